@@ -0,0 +1,36 @@
+"""Category.bulk_create against one Category(...) call per row."""
+import argparse
+import time
+
+from category.domain.entities import Category
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = [
+        {'name': f'Category {i}', 'description': 'some description', 'is_active': i % 2 == 0}
+        for i in range(args.rows)
+    ]
+    columns = {key: [row[key] for row in rows] for key in rows[0]}
+
+    baseline = timed(lambda: [Category(**row) for row in rows])
+    results = [
+        ('Category(**row) loop', baseline),
+        ('Category.bulk_create(rows)', timed(lambda: Category.bulk_create(rows))),
+        ('Category.bulk_create(columns)', timed(lambda: Category.bulk_create(columns))),
+    ]
+    for label, seconds in results:
+        print(f'{label:<36} {args.rows / seconds:12,.0f} rows/s   {baseline / seconds:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+find_by_id over the SQLite category repository with and without the identity
+map cache, for a skewed (Zipf-like) stream of --lookups ids over --rows
+categories, at a few cache sizes and byte budgets. Reports time per lookup
+and the hit rate.
+"""
+import argparse
+import random
+import time
+
+from category.domain.entities import Category
+from category.infra.repositories import CategoryCachedRepository
+from category.infra.sqlite import CategorySqliteRepository
+from common import report
+
+
+def lookup_seconds(repo, ids):
+    start = time.perf_counter()
+    for entity_id in ids:
+        repo.find_by_id(entity_id)
+    return (time.perf_counter() - start) / len(ids)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--lookups', type=int, default=200_000)
+    args = parser.parse_args()
+
+    repo = CategorySqliteRepository()
+    items = Category.bulk_create({'name': [f'Category {i}' for i in range(args.rows)]})
+    repo.bulk_insert(items)
+    rng = random.Random(42)
+    weights = [1 / rank for rank in range(1, args.rows + 1)]
+    ids = [item.id for item in rng.choices(items, weights, k=args.lookups)]
+
+    baseline = lookup_seconds(repo, ids)
+    report('sqlite find_by_id', baseline)
+    for max_entries in [1_000, 10_000, 50_000]:
+        cached = CategoryCachedRepository(repo, max_entries=max_entries)
+        seconds = lookup_seconds(cached, ids)
+        report(f'cached, {max_entries:,} entries ({cached.stats.hit_rate:.1%} hits)',
+               seconds, baseline)
+    for max_bytes in [1 << 20, 8 << 20]:
+        cached = CategoryCachedRepository(repo, max_entries=args.rows, max_bytes=max_bytes)
+        seconds = lookup_seconds(cached, ids)
+        report(f'cached, {max_bytes >> 20} MiB, {len(cached.identity_map):,} entries '
+               f'({cached.stats.hit_rate:.1%} hits)', seconds, baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Per-instance cost of Category(...) and Category.construct(...), guarded for
+CI: each is timed against a plain frozen slots dataclass with the same fields
+built in the same run, so the check holds on slow and fast machines alike,
+and the script exits with status 1 when a ratio goes over --max-ratio (or a
+time over --max-us, when given). The ratio is the median over --repeats runs
+timing both back to back, so one noisy run does not fail the check. Category
+runs at about 1.1-1.3x the reference, the default limit of 3x leaves room
+for shared CI machines and still catches the validation being done twice.
+Ids and created_at are passed in, the cost of generating them is reported
+apart.
+"""
+import argparse
+from dataclasses import dataclass
+from datetime import datetime
+import statistics
+import sys
+import timeit
+from typing import Any, Callable, Optional, Tuple
+
+from common import measure, report
+
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.entities import Category
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Reference:
+    unique_entity_id: UniqueEntityId
+    name: str
+    description: Optional[str] = None
+    is_active: Optional[bool] = True
+    created_at: Optional[datetime] = None
+
+
+def median_times(
+    func: Callable[[], Any], reference: Callable[[], Any], repeats: int, number: int = 100_000
+) -> Tuple[float, float]:
+    """Median time per call of `func` and `reference`, timed back to back in each run."""
+    times, reference_times = [], []
+    for _ in range(repeats):
+        reference_times.append(timeit.timeit(reference, number=number) / number)
+        times.append(timeit.timeit(func, number=number) / number)
+    return statistics.median(times), statistics.median(reference_times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--max-ratio', type=float, default=3.0)
+    parser.add_argument('--max-us', type=float)
+    parser.add_argument('--repeats', type=int, default=7)
+    args = parser.parse_args()
+
+    unique_entity_id, created_at = UniqueEntityId(), datetime.now()
+
+    def reference():
+        return Reference(unique_entity_id=unique_entity_id, name='Movie', created_at=created_at)
+
+    failed = False
+    for label, build in [
+        ('Category(...)', Category),
+        ('Category.construct(...)', Category.construct),
+    ]:
+        seconds, baseline = median_times(
+            lambda build=build: build(
+                unique_entity_id=unique_entity_id, name='Movie', created_at=created_at),
+            reference, args.repeats)
+        report('frozen slots dataclass (reference)', baseline)
+        report(label, seconds, baseline)
+        over_us = args.max_us is not None and seconds * 1e6 > args.max_us
+        if seconds / baseline > args.max_ratio or over_us:
+            print(f'  over budget: {seconds / baseline:.2f}x the reference, limit {args.max_ratio}x'
+                  + (f' / {args.max_us} us' if args.max_us is not None else ''))
+            failed = True
+
+    report('Category(name=...) with generated id and clock',
+           measure(lambda: Category(name='Movie')))
+    report('UniqueEntityId.time_ordered()', measure(UniqueEntityId.time_ordered))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
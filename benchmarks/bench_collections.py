@@ -0,0 +1,64 @@
+"""
+Memory and speed of a read-only result set of --rows categories held as a
+list of Category objects against a CategoryCollection: bytes per row measured
+with tracemalloc while building each from the same SQLite rows, then filtering
+and sorting both.
+"""
+import argparse
+import time
+import tracemalloc
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter
+from category.infra.sqlite import CategorySqliteRepository
+from common import report
+
+NAMES = ['Action', 'Drama', 'Comedy', 'Kids', 'Documentary', 'Horror', 'Romance', 'Sci-fi']
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    args = parser.parse_args()
+
+    repo = CategorySqliteRepository()
+    repo.bulk_insert(Category.bulk_create({
+        'name': [f'{NAMES[i % len(NAMES)]} {NAMES[i // 7 % len(NAMES)]}' for i in range(args.rows)],
+        'description': [None if i % 3 else 'Movies and series' for i in range(args.rows)],
+        'is_active': [i % 4 != 0 for i in range(args.rows)],
+    }))
+
+    categories, list_size = traced(lambda: list(repo.scan(per_page=10_000)))
+    collection, collection_size = traced(repo.collect)
+    print(f'{"list[Category]":<20} {list_size / args.rows:8.1f} bytes/row')
+    print(f'{"CategoryCollection":<20} {collection_size / args.rows:8.1f} bytes/row '
+          f'({list_size / collection_size:.1f}x smaller)')
+
+    filter_param = CategoryFilter(term='dra', is_active=True)
+    baseline = seconds(lambda: sorted(
+        (category for category in categories
+         if category.is_active
+         and any(word.startswith('dra') for word in category.name.casefold().split())),
+        key=lambda category: (category.name.casefold(), category.unique_entity_id.bytes)))
+    report('list[Category] filter + sort (per row)', baseline / args.rows)
+    report('CategoryCollection filter + sort (per row)',
+           seconds(lambda: collection.filter(filter_param).sort('name')) / args.rows,
+           baseline / args.rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Writers updating a few hot categories at once: each write reads a category,
+spends --work-ms (sleeping, like a call to another service) and stores it
+back. The lock baseline holds one lock over the whole read-change-write;
+compare-and-swap writers hold nothing and retry the write when the category
+changed since they read it. Threads share a CategoryInMemoryRepository,
+processes a SQLite file. Reports writes per second, the retries, and checks
+that no write was lost: every write bumps the version once. Last, a batch of
+compare-and-swaps on SQLite, one by one against bulk_update.
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from __seedwork.domain.exceptions import ConcurrencyException
+from __seedwork.infra.sqlite import connect
+from category.domain.entities import Category
+from category.infra.repositories import CategoryInMemoryRepository
+from category.infra.sqlite import CategorySqliteRepository
+
+
+def write_with_lock(repo, category_id, work, lock, _retries):
+    with lock:
+        category = repo.find_by_id(category_id).copy()
+        time.sleep(work)
+        category.update(category.name, f'written at {time.perf_counter()}')
+        repo.update(category)
+
+
+def write_with_cas(repo, category_id, work, _lock, retries):
+    while True:
+        category = repo.find_by_id(category_id).copy()
+        expected_version = category.version
+        time.sleep(work)
+        category.update(category.name, f'written at {time.perf_counter()}')
+        try:
+            repo.update(category, expected_version)
+            return
+        except ConcurrencyException:
+            retries.value += 1
+
+
+class Counter:
+    value = 0
+
+
+def thread_run(write, writers, writes, hot, work):
+    repo = CategoryInMemoryRepository()
+    categories = [Category(name=f'Hot {number}') for number in range(hot)]
+    repo.bulk_insert(categories)
+    lock, retries = threading.Lock(), Counter()
+
+    def writer(number):
+        for write_number in range(writes):
+            write(repo, categories[(number + write_number) % hot].id, work, lock, retries)
+
+    threads = [threading.Thread(target=writer, args=(number,)) for number in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    versions = sum(repo.find_by_id(category.id).version for category in categories)
+    return seconds, retries.value, versions
+
+
+def process_writer(database, write_name, number, writes, category_ids, work, lock, retries):
+    repo = CategorySqliteRepository(connect(database, timeout=30))
+    write = globals()[write_name]
+    for write_number in range(writes):
+        write(repo, category_ids[(number + write_number) % len(category_ids)], work, lock, retries)
+
+
+def process_run(write, writers, writes, hot, work):
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'categories.db')
+        repo = CategorySqliteRepository(connect(database))
+        categories = [Category(name=f'Hot {number}') for number in range(hot)]
+        repo.bulk_insert(categories)
+        category_ids = [category.id for category in categories]
+        lock, retries = multiprocessing.Lock(), multiprocessing.Value('i', 0)
+        processes = [
+            multiprocessing.Process(target=process_writer, args=(
+                database, write.__name__, number, writes, category_ids, work, lock, retries))
+            for number in range(writers)
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        seconds = time.perf_counter() - start
+        versions = sum(repo.find_by_id(category_id).version for category_id in category_ids)
+        return seconds, retries.value, versions
+
+
+def bulk_run(size):
+    repo = CategorySqliteRepository()
+    categories = Category.bulk_create({'name': [f'Category {number}' for number in range(size)]})
+    repo.bulk_insert(categories)
+    for category in categories:
+        category.deactivate()
+
+    start = time.perf_counter()
+    for category in categories:
+        repo.update(category, category.version - 1)
+    one_by_one = time.perf_counter() - start
+    for category in categories:
+        category.activate()
+    start = time.perf_counter()
+    conflicts = repo.bulk_update([(category, category.version - 1) for category in categories])
+    bulk = time.perf_counter() - start
+    assert not conflicts
+    return one_by_one, bulk
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=200, help='per writer')
+    parser.add_argument('--hot', type=int, default=4, help='categories written to')
+    parser.add_argument('--work-ms', type=float, default=1.0)
+    args = parser.parse_args()
+    work = args.work_ms / 1e3
+    total = args.writers * args.writes
+
+    print(f'{args.writers} writers x {args.writes} writes over {args.hot} categories, '
+          f'{args.work_ms} ms of work each')
+    for kind, run in [('threads', thread_run), ('processes', process_run)]:
+        baseline = None
+        for label, write in [('one lock', write_with_lock), ('compare-and-swap', write_with_cas)]:
+            seconds, retries, versions = run(write, args.writers, args.writes, args.hot, work)
+            baseline = baseline or seconds
+            print(f'{kind:<10} {label:<18} {total / seconds:9,.0f} writes/s   '
+                  f'{baseline / seconds:5.2f}x   '
+                  f'{retries:6,} retries   lost writes: {total - versions}')
+
+    one_by_one, bulk = bulk_run(10_000)
+    print(f'10,000 compare-and-swaps on SQLite: one by one {one_by_one * 1e3:.0f} ms, '
+          f'bulk_update {bulk * 1e3:.0f} ms ({one_by_one / bulk:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
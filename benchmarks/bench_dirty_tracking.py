@@ -0,0 +1,92 @@
+"""
+Toggle traffic against a CategorySqliteRepository of --rows categories:
+batches of --batch is_active toggles, about half of them no-ops (activating
+an active category). The baseline stores every touched category with
+bulk_update, whole rows included; the unit of work skips the unchanged ones
+and sends only is_active and the version of the rest, with
+bulk_update_fields. Reports the time per batch and, for the first batch
+(left out of the timing), the statements and SQL text sqlite received,
+bound values expanded.
+"""
+import argparse
+import random
+import time
+
+from __seedwork.application.unit_of_work import UnitOfWork
+from category.domain.entities import Category
+from category.infra.sqlite import CategorySqliteRepository
+
+
+def build(rows):
+    repo = CategorySqliteRepository()
+    repo.bulk_insert(Category.bulk_create({
+        'name': [f'Category {number}' for number in range(rows)],
+        'description': [
+            f'Description of category {number}, long enough to matter' for number in range(rows)
+        ],
+    }))
+    return repo
+
+
+def toggles(repo, ids, batch, seed):
+    rand = random.Random(seed)
+    picked = rand.sample(ids, batch)
+    return [(repo.find_by_id(entity_id), rand.random() < 0.5) for entity_id in picked]
+
+
+def whole_rows(repo, batch):
+    updates = []
+    for category, active in batch:
+        expected_version = category.version
+        category.activate() if active else category.deactivate()
+        updates.append((category, expected_version))
+    assert not repo.bulk_update(updates)
+
+
+def unit_of_work(repo, batch):
+    with UnitOfWork(repo) as work:
+        for category, active in batch:
+            work.register(category)
+            category.activate() if active else category.deactivate()
+    assert not work.conflicts
+
+
+def run(write, rows, batches, size):
+    repo = build(rows)
+    ids = [category.id for category in repo.find_all()]
+    sent = []
+    seconds = 0.0
+    for number in range(batches):
+        batch = toggles(repo, ids, size, number)
+        if number == 0:
+            repo.connection.set_trace_callback(sent.append)
+            write(repo, batch)
+            repo.connection.set_trace_callback(None)
+            continue
+        start = time.perf_counter()
+        write(repo, batch)
+        seconds += time.perf_counter() - start
+    return seconds / (batches - 1), sum(len(statement) for statement in sent), len(sent)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--batch', type=int, default=1_000)
+    parser.add_argument('--batches', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'{args.batches} batches of {args.batch} toggles over {args.rows:,} categories')
+    baseline = None
+    for label, write in [
+        ('bulk_update, whole rows', whole_rows),
+        ('unit of work, changed fields', unit_of_work),
+    ]:
+        seconds, sent, statements = run(write, args.rows, args.batches, args.batch)
+        baseline = baseline or seconds
+        print(f'{label:<32} {seconds * 1e3:8.2f} ms/batch   {baseline / seconds:5.2f}x   '
+              f'{statements:5} statements   {sent / 1024:8.1f} KiB of SQL')
+
+
+if __name__ == '__main__':
+    main()
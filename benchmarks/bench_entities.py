@@ -0,0 +1,53 @@
+"""
+Entity.id access against the uncached ValueObject.__str__ it used to go
+through, and the generated to_dict against dataclasses.asdict.
+"""
+from dataclasses import asdict, fields
+import json
+
+from common import measure, report
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.serializers import iter_json_lines
+from category.domain.entities import Category
+
+
+def asdict_to_dict(entity):
+    entity_dict = asdict(entity)
+    entity_dict.pop('unique_entity_id')
+    entity_dict['id'] = entity.id
+    return entity_dict
+
+
+def uncached_id(entity):
+    value_object = entity.unique_entity_id
+    fields_name = [field.name for field in fields(value_object)]
+    if len(fields_name) == 1:
+        return str(getattr(value_object, fields_name[0]))
+    return json.dumps({field_name: getattr(value_object, field_name) for field_name in fields_name})
+
+
+def main():
+    category = Category(name='Movie', description='some description')
+
+    baseline = measure(lambda: uncached_id(category))
+    report('entity.id / str() through fields()', baseline)
+    report('entity.id / cached', measure(lambda: category.id), baseline)
+    report('hash(entity.unique_entity_id)',
+           measure(lambda: hash(category.unique_entity_id)), baseline)
+    categories = [Category(name=f'Movie {i}') for i in range(1_000)]
+
+    baseline = measure(lambda: asdict_to_dict(category), number=20_000)
+    report('to_dict / dataclasses.asdict', baseline)
+    report('to_dict / generated serializer', measure(category.to_dict, number=20_000), baseline)
+
+    baseline = measure(lambda: [asdict_to_dict(item) for item in categories], number=20)
+    report('1k categories / asdict loop', baseline)
+    report('1k categories / Entity.to_dicts',
+           measure(lambda: Entity.to_dicts(categories), number=20), baseline)
+    report('1k categories / iter_json_lines',
+           measure(lambda: list(iter_json_lines(categories)), number=20), baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Exports --rows categories from a SQLite file: the full payload built in memory
+(json.dumps over find_all and to_dict) against the streaming JSON-lines and
+CSV exporters. Each export runs in its own process so peak RSS is its own.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from __seedwork.infra.sqlite import connect
+from category.domain.entities import Category
+from category.infra.exporters import export_categories
+from category.infra.sqlite import CategorySqliteRepository
+
+CHUNK = 50_000
+
+
+def export(database, mode, output):
+    repo = CategorySqliteRepository(connect(database))
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with open(output, 'w', encoding='utf-8') as file:
+        if mode == 'in memory':
+            rows = [category.to_dict() for category in repo.find_all()]
+            file.write(json.dumps(rows, default=str))
+        else:
+            export_categories(repo, file, mode)
+    seconds = time.perf_counter() - start
+    rows = repo.connection.execute('SELECT COUNT(*) FROM categories').fetchone()[0]
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f'{mode:<10} {rows / seconds:12,.0f} rows/s   peak RSS {peak / 1024:8.1f} MiB '
+          f'(+{(peak - rss_before) / 1024:.1f} MiB during the export)')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--mode', help=argparse.SUPPRESS)
+    parser.add_argument('--database', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        export(args.database, args.mode, os.devnull)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'categories.db')
+        repo = CategorySqliteRepository(connect(database))
+        for offset in range(0, args.rows, CHUNK):
+            size = min(CHUNK, args.rows - offset)
+            repo.bulk_insert(Category.bulk_create({
+                'name': [f'Category {offset + i}' for i in range(size)],
+                'description': [f'Description of category {offset + i}' for i in range(size)],
+            }))
+        repo.connection.close()
+        for mode in ['in memory', 'jsonl', 'csv']:
+            subprocess.run(
+                [sys.executable, __file__, '--mode', mode, '--database', database],
+                check=True, env=os.environ)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Query latency of the category full-text index over --rows categories with
+Portuguese-like names and descriptions (words drawn with Zipf-Mandelbrot
+frequencies, the most common of them being the usual function words):
+p50/p99 for word queries and for search-as-you-type prefixes, the cost of
+incremental updates, and a substring scan over the categories for
+comparison.
+"""
+import argparse
+import itertools
+import random
+import time
+
+from __seedwork.infra.fulltext import STOPWORDS
+from category.domain.entities import Category
+from category.infra.search import CategorySearchIndex
+
+SYLLABLES = ['ca', 'ção', 'ma', 'ré', 'ti', 'lo', 'ba', 'ná', 'de', 'sé', 'ri', 'o', 'a', 'dra',
+             'men', 'tá', 'ri', 'co', 'mé', 'di', 'an', 'ime', 'fil', 'mes', 'in', 'fan', 'til',
+             'ter', 'ror', 'ví', 'deo', 'au', 'la']
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return samples[len(samples) // 2] * 1e3, samples[int(len(samples) * 0.99)] * 1e3
+
+
+def timed(func, arguments):
+    samples = []
+    for argument in arguments:
+        start = time.perf_counter()
+        func(argument)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocabulary = sorted({
+        ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(30_000)
+    })
+    rng.shuffle(vocabulary)
+    vocabulary = sorted(STOPWORDS) + vocabulary
+    cum_weights = list(itertools.accumulate(
+        1 / (rank + 2.7) for rank in range(1, len(vocabulary) + 1)))
+
+    def words(count):
+        return ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=count))
+
+    categories = Category.bulk_create({
+        'name': [words(rng.randint(1, 3)).capitalize() for _ in range(args.rows)],
+        'description': [words(rng.randint(4, 12)) for _ in range(args.rows)],
+    })
+
+    start = time.perf_counter()
+    index = CategorySearchIndex(categories)
+    print(f'build {args.rows:,} categories: {time.perf_counter() - start:.1f} s')
+
+    word_queries = [words(rng.randint(1, 3)) for _ in range(args.queries)]
+    prefixes = [
+        ' '.join(query.split()[:-1] + [query.split()[-1][:rng.randint(2, 5)]])
+        for query in (words(rng.randint(1, 2)) for _ in range(args.queries))
+    ]
+    for label, func, queries in [
+        ('words, top 10', lambda query: index.search(query, 10), word_queries),
+        ('search as you type, top 10',
+         lambda query: index.search(query, 10, prefix=True), prefixes),
+    ]:
+        p50, p99 = percentiles(timed(func, queries))
+        print(f'{label:<32} p50 {p50:7.3f} ms   p99 {p99:7.3f} ms')
+
+    updated = rng.sample(categories, min(args.queries, len(categories)))
+    p50, p99 = percentiles(timed(
+        lambda category: index.add(Category.construct(
+            unique_entity_id=category.unique_entity_id, name=words(2), description=words(8))),
+        updated
+    ))
+    print(f'{"update a category":<32} p50 {p50:7.3f} ms   p99 {p99:7.3f} ms')
+    p50, p99 = percentiles(timed(lambda category: index.remove(category.id), updated))
+    print(f'{"remove a category":<32} p50 {p50:7.3f} ms   p99 {p99:7.3f} ms')
+
+    word = word_queries[0].split()[0]
+    scan = timed(lambda term: [
+        category for category in categories
+        if term in category.name.lower() or term in (category.description or '').lower()
+    ], [word] * 3)
+    print(f'{"substring scan, one word":<32} p50 {percentiles(scan)[0]:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
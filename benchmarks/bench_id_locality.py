@@ -0,0 +1,54 @@
+"""
+Sorted-insert locality of random (v4) against time ordered (v7) ids: each id
+is inserted into a sorted list, standing in for a B-tree index. Reports how
+far from the end inserts land, how many leaf pages (of --page-size keys) a
+window of 1000 consecutive inserts touches, and the time taken by insort.
+"""
+import argparse
+from bisect import bisect_left, insort
+import time
+
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+def locality(keys, page_size):
+    index, appended, distance, pages_per_window, window = [], 0, 0, [], set()
+    for position, key in enumerate(keys):
+        slot = bisect_left(index, key)
+        appended += slot == len(index)
+        distance += len(index) - slot
+        window.add(slot // page_size)
+        if position % 1000 == 999:
+            pages_per_window.append(len(window))
+            window = set()
+        index.insert(slot, key)
+    pages = sum(pages_per_window) / max(len(pages_per_window), 1)
+    return appended / len(keys), distance / len(keys), pages
+
+
+def insort_seconds(keys):
+    index = []
+    start = time.perf_counter()
+    for key in keys:
+        insort(index, key)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ids', type=int, default=200_000)
+    parser.add_argument('--page-size', type=int, default=128)
+    args = parser.parse_args()
+
+    for label, time_ordered in [('uuid4 (random)', False), ('uuid7 (time ordered)', True)]:
+        ids = UniqueEntityId.generate(args.ids, time_ordered)
+        keys = [unique_entity_id.bytes for unique_entity_id in ids]
+        appended, distance, pages = locality(keys, args.page_size)
+        print(
+            f'{label:<22} appended {appended:7.2%}   mean distance from end {distance:12,.0f}   '
+            f'pages per 1k inserts {pages:7.1f}   insort {insort_seconds(keys):6.2f}s'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Throughput of import_categories for a generated JSON-lines (or --format csv)
+file of --rows categories, validated in process (0 workers) and on 1, 2, 4
+and 8 worker processes, into the in-memory repository.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from category.infra.importers import import_categories
+from category.infra.repositories import CategoryInMemoryRepository
+
+
+def write_file(path, file_format, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        if file_format == 'csv':
+            file.write('name,description,is_active\n')
+        for i in range(rows):
+            name, description, is_active = (
+                f'Category {i}', f'Description of category {i}', i % 3 != 0)
+            if file_format == 'csv':
+                file.write(f'{name},{description},{str(is_active).lower()}\n')
+            else:
+                row = {'name': name, 'description': description, 'is_active': is_active}
+                file.write(json.dumps(row) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default='jsonl')
+    parser.add_argument('--chunk-size', type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f'categories.{args.format}')
+        write_file(path, args.format, args.rows)
+        for workers in [0, 1, 2, 4, 8]:
+            repo = CategoryInMemoryRepository()
+            start = time.perf_counter()
+            result = import_categories(path, repo, chunk_size=args.chunk_size, workers=workers)
+            seconds = time.perf_counter() - start
+            assert result.imported == args.rows and not result.errors
+            print(f'{workers} workers   {args.rows / seconds:12,.0f} rows/s   {seconds:6.2f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Cold import time of the domain and application modules, from the
+`python -X importtime` report of a fresh interpreter per run: the time
+spent importing the target and everything it pulls in that a bare
+interpreter has not already loaded, as the median of --runs runs, and the
+modules that cost the most of it.
+
+    PYTHONPATH=src python benchmarks/bench_import_time.py
+    PYTHONPATH=src python benchmarks/bench_import_time.py --scale 1.5
+
+Exits with status 1 when a target goes over its budget, in milliseconds
+times --scale. The budgets were set with some headroom on a slow one CPU
+machine; scale them for others, or after a deliberate change of what the
+modules import.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BUDGETS_MS = {
+    '__seedwork.domain.entities': 80,
+    'category.domain.entities': 100,
+    'category.domain.repositories': 115,
+    'category.application.use_cases': 150,
+}
+
+
+def importtime(statement: str) -> List[Tuple[str, int, int]]:
+    """
+    The (name, self, cumulative) microseconds of each module the statement
+    imported, nesting kept in the name.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.path.join(root, 'src'))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        env=env, capture_output=True, text=True, check=True
+    )
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure(target: str, startup: set, runs: int) -> Tuple[float, Dict[str, int]]:
+    totals, heaviest = [], {}
+    for _ in range(runs):
+        total = 0
+        for name, self_us, cumulative_us in importtime(f'import {target}'):
+            module = name.strip()
+            if module in startup:
+                continue
+            # top level entries are imported by the statement itself, the rest by them
+            if name == module:
+                total += cumulative_us
+            heaviest[module] = min(heaviest.get(module, self_us), self_us)
+        totals.append(total)
+    return statistics.median(totals) / 1e3, heaviest
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--scale', type=float, default=1.0, help='multiplies every budget')
+    parser.add_argument('--top', type=int, default=5, help='heaviest modules shown per target')
+    args = parser.parse_args()
+
+    # compile the sources first, so no run pays for writing bytecode
+    importtime('import ' + ', '.join(BUDGETS_MS))
+    startup = {name.strip() for name, _, _ in importtime('pass')}
+    over = []
+    for target, budget_ms in BUDGETS_MS.items():
+        milliseconds, heaviest = measure(target, startup, args.runs)
+        budget_ms *= args.scale
+        verdict = 'ok' if milliseconds <= budget_ms else 'OVER BUDGET'
+        print(f'{target:<36} {milliseconds:8.1f} ms   budget {budget_ms:6.1f} ms   '
+              f'{len(heaviest):3} modules   {verdict}')
+        for module, self_us in sorted(heaviest.items(), key=lambda item: -item[1])[:args.top]:
+            print(f'    {module:<48} {self_us / 1e3:6.1f} ms')
+        if milliseconds > budget_ms:
+            over.append(target)
+    if over:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
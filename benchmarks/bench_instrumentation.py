@@ -0,0 +1,41 @@
+"""
+Cost of the opt-in instrumentation on Category(...) and to_dict(): before
+enabling it, while enabled and after disabling it (the originals are back, so
+the last should match the first), then the latencies it recorded.
+"""
+from common import measure, report
+
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.instrumentation import InMemoryMetricsSink, Instrumentation
+from category.domain.entities import Category
+
+
+def run(label, baselines=None):
+    category = Category(name='Movie')
+    timings = [
+        measure(lambda: Category(name='Movie', description='description')),
+        measure(category.to_dict),
+        measure(lambda: UniqueEntityId('6f5b4b0e-2b7e-4c1a-9d2f-0c8a4e0f7b61')),
+    ]
+    names = ['Category(...)', 'to_dict()', 'UniqueEntityId(str)']
+    for name, seconds, baseline in zip(names, timings, baselines or [None] * 3):
+        report(f'{label}: {name}', seconds, baseline)
+    return timings
+
+
+def main():
+    baselines = run('off')
+    sink = InMemoryMetricsSink()
+    with Instrumentation(sink).enable(Category):
+        run('on', baselines)
+    run('off again', baselines)
+
+    (snapshot,) = sink.snapshots
+    for (class_name, operation), stats in sorted(snapshot.operations.items()):
+        print(f'  {class_name + "." + operation:<26} {stats.calls:>9,} calls   '
+              f'mean {stats.total_seconds / stats.calls * 1e6:6.2f} us   '
+              f'p99 <= {stats.percentile(0.99) * 1e6:5.0f} us')
+
+
+if __name__ == '__main__':
+    main()
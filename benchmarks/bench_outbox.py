@@ -0,0 +1,65 @@
+"""
+Throughput of --ops activate/deactivate use cases over the async in-memory
+repository without events and with their events going through the outbox to
+a broker stand-in that costs --latency seconds per publish call: one event
+per call against batches. Reports the write loop time per use case and the
+end-to-end rate once the outbox has drained.
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from __seedwork.domain.events import DomainEvent, EventPublisher
+from __seedwork.infra.events import OutboxDispatcher
+from category.application.use_cases import ActivateCategoryUseCase, DeactivateCategoryUseCase
+from category.domain.entities import Category
+from category.infra.repositories import CategoryAsyncInMemoryRepository
+
+
+class Broker(EventPublisher):
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.received = 0
+
+    async def publish(self, events: List[DomainEvent]) -> None:
+        await asyncio.sleep(self.latency)
+        self.received += len(events)
+
+
+async def run(label, ops, latency, max_batch=None):
+    repo = CategoryAsyncInMemoryRepository()
+    categories = Category.bulk_create({'name': [f'Category {i}' for i in range(1_000)]})
+    await repo.bulk_insert(categories)
+    broker = Broker(latency)
+    outbox = OutboxDispatcher(broker, max_batch=max_batch, max_delay=0.01) if max_batch else None
+    activate = ActivateCategoryUseCase(repo, outbox)
+    deactivate = DeactivateCategoryUseCase(repo, outbox)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        category_id = categories[i % len(categories)].id
+        use_case = deactivate if i // len(categories) % 2 == 0 else activate
+        await use_case.execute(use_case.Input(category_id))
+    written = time.perf_counter() - start
+    if outbox is not None:
+        await outbox.close()
+    drained = time.perf_counter() - start
+    print(f'{label:<36} {written / ops * 1e6:8.2f} us/op   {ops / drained:10,.0f} ops/s end to end'
+          f'   {broker.received:,} events')
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ops', type=int, default=20_000)
+    parser.add_argument('--latency', type=float, default=0.001)
+    args = parser.parse_args()
+
+    await run('no events', args.ops, args.latency)
+    await run('outbox, 1 event per publish', args.ops, args.latency, max_batch=1)
+    await run('outbox, batches of 500', args.ops, args.latency, max_batch=500)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
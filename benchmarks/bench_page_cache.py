@@ -0,0 +1,119 @@
+"""
+Dashboard traffic against --rows categories: a stream of --ops operations,
+most of them searches for the first pages of a few list views (sorted by
+created_at or name, with and without an is_active or term filter), the rest
+writes (toggling is_active, renaming, creating and deleting categories) at
+a few write ratios. Each backend runs the same stream bare and behind a
+CategoryCachedRepository, whose page cache every write invalidates. Reports
+the time per read and per write, the page hit rate and, as a check, whether
+both runs returned the same pages.
+"""
+import argparse
+import random
+import time
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.repositories import CategoryCachedRepository, CategoryInMemoryRepository
+from category.infra.sqlite import CategorySqliteRepository
+
+WORDS = ['action', 'drama', 'kids', 'comedy', 'horror', 'docs', 'music', 'anime']
+VIEWS = [
+    (None, None, None),
+    ('name', 'asc', None),
+    (None, None, CategoryFilter(is_active=True)),
+    ('name', 'asc', CategoryFilter(is_active=False)),
+    ('created_at', 'asc', CategoryFilter(term='kids')),
+]
+
+
+def categories(rand, count):
+    return Category.bulk_create({
+        'name': [f'{" ".join(rand.sample(WORDS, 2))} {number}' for number in range(count)],
+        'is_active': [rand.random() < 0.8 for _ in range(count)],
+    })
+
+
+def workload(seed, stored, ops, write_ratio):
+    rand = random.Random(seed)
+    live = [category.id for category in stored]
+    created = categories(rand, ops)
+    stream = []
+    for number in range(ops):
+        if rand.random() >= write_ratio:
+            sort, sort_dir, filter_param = rand.choice(VIEWS)
+            page = rand.choices([1, 2, 3], [0.6, 0.25, 0.15])[0]
+            stream.append(('search', CategoryRepository.SearchParams(
+                page=page, per_page=20, sort=sort, sort_dir=sort_dir, filter=filter_param)))
+            continue
+        kind = rand.choices(['toggle', 'rename', 'create', 'delete'], [0.5, 0.3, 0.1, 0.1])[0]
+        if kind == 'create':
+            live.append(created[number].id)
+            stream.append(('create', created[number]))
+        elif kind == 'delete':
+            stream.append(('delete', live.pop(rand.randrange(len(live)))))
+        else:
+            stream.append((kind, rand.choice(live)))
+    return stream
+
+
+def run(repo, stream):
+    reads = writes = 0.0
+    pages = []
+    for kind, argument in stream:
+        start = time.perf_counter()
+        if kind == 'search':
+            pages.append([category.id for category in repo.search(argument).items])
+            reads += time.perf_counter() - start
+            continue
+        if kind == 'create':
+            repo.insert(argument.copy())
+        elif kind == 'delete':
+            repo.delete(argument)
+        else:
+            category = repo.find_by_id(argument)
+            expected_version = category.version
+            if kind == 'toggle':
+                category.deactivate() if category.is_active else category.activate()
+            else:
+                category.update(f'{category.name} renamed', category.description)
+            repo.update(category, expected_version)
+        writes += time.perf_counter() - start
+    return reads, writes, pages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--ops', type=int, default=20_000)
+    args = parser.parse_args()
+
+    stored = categories(random.Random(1), args.rows)
+    backends = [('in-memory', CategoryInMemoryRepository), ('sqlite', CategorySqliteRepository)]
+    print(f'{args.ops:,} operations over {args.rows:,} categories, pages of 20')
+    for write_ratio in [0.0, 0.001, 0.01, 0.1]:
+        stream = workload(2, stored, args.ops, write_ratio)
+        searches = sum(kind == 'search' for kind, _ in stream)
+        writes = len(stream) - searches
+        print(f'\n{write_ratio:.1%} writes ({searches:,} searches, {writes:,} writes)')
+        for name, backend in backends:
+            results = []
+            for cached in [False, True]:
+                repo = backend()
+                repo.bulk_insert([category.copy() for category in stored])
+                if cached:
+                    repo = CategoryCachedRepository(repo)
+                results.append((repo, *run(repo, stream)))
+            (_, bare_reads, bare_writes, bare_pages), (repo, reads, cached_writes, pages) = results
+            per_write = ' ' * 18
+            if writes:
+                per_write = (f'{bare_writes / writes * 1e6:7.1f} -> '
+                             f'{cached_writes / writes * 1e6:7.1f} us')
+            print(f'  {name:<10} search {bare_reads / searches * 1e6:7.1f} -> '
+                  f'{reads / searches * 1e6:6.1f} us '
+                  f'({bare_reads / reads:5.1f}x)   write {per_write}   '
+                  f'{repo.page_stats.hit_rate:6.1%} hits   same pages: {pages == bare_pages}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Warm startup of a store of --rows categories: rebuilding a
+CategoryInMemoryRepository from a JSON-lines dump (import_categories in
+process, validating every category and building the indexes) against
+opening a snapshot and serving the first page and a lookup from it. Both
+files are read right after being written, so they are in the page cache;
+then the cost of reading categories out of the snapshot.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.exporters import export_categories
+from category.infra.importers import import_categories
+from category.infra.repositories import CategoryInMemoryRepository
+from category.infra.snapshots import CategorySnapshot, write_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500_000)
+    args = parser.parse_args()
+
+    rand = random.Random(4)
+    words = ['action', 'drama', 'kids', 'comedy', 'horror', 'docs', 'music', 'anime']
+    source = CategoryInMemoryRepository(Category.bulk_create({
+        'name': [f'{" ".join(rand.sample(words, 2))} {number}' for number in range(args.rows)],
+        'description': [f'Description of category {number}' for number in range(args.rows)],
+        'is_active': [rand.random() < 0.8 for _ in range(args.rows)],
+    }))
+    ids = rand.sample(list(source.items), 1_000)
+
+    with tempfile.TemporaryDirectory() as directory:
+        dump = os.path.join(directory, 'categories.jsonl')
+        snapshot_path = os.path.join(directory, 'categories.snapshot')
+        start = time.perf_counter()
+        with open(dump, 'w', encoding='utf-8') as file:
+            export_categories(source, file)
+        print(f'write JSON-lines     {time.perf_counter() - start:8.2f} s   '
+              f'{os.path.getsize(dump) / 2**20:7.1f} MiB')
+        start = time.perf_counter()
+        write_snapshot(source.find_all(), snapshot_path)
+        print(f'write snapshot       {time.perf_counter() - start:8.2f} s   '
+              f'{os.path.getsize(snapshot_path) / 2**20:7.1f} MiB')
+
+        start = time.perf_counter()
+        repo = CategoryInMemoryRepository()
+        import_categories(dump, repo, workers=0)
+        repo.search(CategoryRepository.SearchParams(per_page=20, sort='name'))
+        repo.find_by_id(ids[0])
+        rebuild = time.perf_counter() - start
+        print(f'\nstartup from JSON-lines   {rebuild * 1e3:10.1f} ms')
+
+        start = time.perf_counter()
+        snapshot = CategorySnapshot(snapshot_path)
+        snapshot.page(0, 20, 'name')
+        snapshot.find_by_id(ids[0])
+        opened = time.perf_counter() - start
+        print(f'startup from snapshot     {opened * 1e3:10.1f} ms   {rebuild / opened:,.0f}x')
+
+        start = time.perf_counter()
+        for entity_id in ids:
+            snapshot.find_by_id(entity_id)
+        per_id = (time.perf_counter() - start) / len(ids)
+        print(f'\nsnapshot find_by_id       {per_id * 1e6:10.1f} us')
+        start = time.perf_counter()
+        for _ in snapshot.page(0, 10_000, 'created_at', reverse=True):
+            pass
+        print(f'snapshot read, per item   {(time.perf_counter() - start) / 10_000 * 1e6:10.1f} us')
+        start = time.perf_counter()
+        for entity_id in ids:
+            repo.find_by_id(entity_id)
+        per_id = (time.perf_counter() - start) / len(ids)
+        print(f'repository find_by_id     {per_id * 1e6:10.1f} us')
+        snapshot.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Deleting categories from a CategoryInMemoryRepository of --rows categories.
+A hard delete (tombstone and purge right away, taking the entity out of every
+index) against the soft delete (tombstone only); then searches with the
+tombstones left and after compaction, the time of each compaction step, a
+read stalls for at most one, and the compaction time per id against a hard
+delete.
+"""
+import argparse
+import random
+import time
+
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.repositories import CategoryInMemoryRepository
+
+
+def build(rows):
+    repo = CategoryInMemoryRepository()
+    rand = random.Random(5)
+    words = ['action', 'drama', 'kids', 'comedy', 'horror', 'docs', 'music', 'anime']
+    repo.bulk_insert(Category.bulk_create({
+        'name': [f'{" ".join(rand.sample(words, 2))} {number}' for number in range(rows)],
+        'is_active': [rand.random() < 0.8 for _ in range(rows)],
+    }))
+    return repo
+
+
+def percentiles(seconds):
+    ordered = sorted(seconds)
+    return ordered[len(ordered) // 2] * 1e6, ordered[int(len(ordered) * 0.99)] * 1e6
+
+
+def time_each(calls):
+    seconds = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def deletes(rows, count, hard):
+    repo = build(rows)
+    ids = random.Random(1).sample(list(repo.items), count)
+    if hard:
+        def delete(entity_id):
+            repo.delete(entity_id)
+            repo._purge(entity_id)  # pylint: disable=protected-access
+    else:
+        delete = repo.delete
+    return time_each([lambda entity_id=entity_id: delete(entity_id) for entity_id in ids])
+
+
+SEARCHES = [
+    ('no filter', None),
+    ('is_active=False', CategoryFilter(is_active=False)),
+    ('term', 'kids act'),
+]
+
+
+def searches(repo, filter_param, count):
+    rand = random.Random(2)
+    params = [
+        CategoryRepository.SearchParams(
+            page=rand.randint(1, 5), per_page=20, sort=rand.choice([None, 'name']),
+            filter=filter_param)
+        for _ in range(count)
+    ]
+    return time_each([lambda param=param: repo.search(param) for param in params])
+
+
+def report_searches(repo, when):
+    for label, filter_param in SEARCHES:
+        p50, p99 = percentiles(searches(repo, filter_param, 200))
+        print(f'{f"search {when}, {label}":<44} p50 {p50:9.1f} us   p99 {p99:9.1f} us')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--deleted', type=float, default=0.1, help='fraction of the rows deleted')
+    parser.add_argument(
+        '--budget', type=int, default=10_000, help='index entries per compaction step')
+    args = parser.parse_args()
+    count = int(args.rows * args.deleted)
+
+    print(f'{args.rows:,} categories, {count:,} deleted')
+    hard = deletes(args.rows, min(count, 2_000), hard=True)
+    soft = deletes(args.rows, min(count, 2_000), hard=False)
+    for label, seconds in [('hard delete', hard), ('soft delete', soft)]:
+        p50, p99 = percentiles(seconds)
+        print(f'{label:<44} p50 {p50:9.1f} us   p99 {p99:9.1f} us')
+
+    repo = build(args.rows)
+    ids = random.Random(1).sample(list(repo.items), count)
+    for entity_id in ids:
+        repo.delete(entity_id)
+    report_searches(repo, 'with tombstones')
+
+    steps = []
+    while True:
+        start = time.perf_counter()
+        more = repo.compact(args.budget)
+        steps.append(time.perf_counter() - start)
+        if not more:
+            break
+    p50, _ = percentiles(steps)
+    print(f'{"compaction step":<44} p50 {p50:9.1f} us   max {max(steps) * 1e6:9.1f} us   '
+          f'{len(steps)} steps, {sum(steps) * 1e3:.0f} ms in all')
+    report_searches(repo, 'after compaction')
+
+    per_id = sum(hard) / len(hard)
+    print(f'{"compaction":<44} {sum(steps) / count * 1e6:9.1f} us per id   '
+          f'hard delete {per_id * 1e6:9.1f} us per id')
+
+
+if __name__ == '__main__':
+    main()
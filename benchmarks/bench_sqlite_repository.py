@@ -0,0 +1,83 @@
+"""
+SQLite category repository against a naive row-by-row implementation, both on
+a file in a temporary directory: inserts per second (the naive one commits
+every row, over --naive-rows rows) and the time to list a page --depth of the
+way into the name ordering with OFFSET and with a keyset cursor.
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from __seedwork.infra.sqlite import connect
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.sqlite import CategorySqliteRepository
+from common import measure, report
+
+CHUNK = 50_000
+
+
+class NaiveCategorySqliteRepository:
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path, cached_statements=0)
+        self.connection.execute(
+            'CREATE TABLE categories (id TEXT PRIMARY KEY, name TEXT, description TEXT, '
+            'is_active INTEGER, created_at TEXT)')
+
+    def insert(self, entity):
+        self.connection.execute(
+            'INSERT INTO categories VALUES (?, ?, ?, ?, ?)',
+            (entity.id, entity.name, entity.description, entity.is_active,
+             entity.created_at.isoformat()))
+        self.connection.commit()
+
+
+def categories(size, offset=0):
+    names = [f'Category {(offset + i) * 7919 % size:07d}' for i in range(size)]
+    return Category.bulk_create({'name': names})
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--naive-rows', type=int, default=20_000)
+    parser.add_argument('--depth', type=float, default=0.9)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        naive = NaiveCategorySqliteRepository(os.path.join(directory, 'naive.db'))
+        items = categories(args.naive_rows)
+        start = time.perf_counter()
+        for item in items:
+            naive.insert(item)
+        naive_seconds = (time.perf_counter() - start) / args.naive_rows
+        report('naive insert, commit per row (per row)', naive_seconds)
+
+        repo = CategorySqliteRepository(connect(os.path.join(directory, 'categories.db')))
+        seconds = 0.0
+        for offset in range(0, args.rows, CHUNK):
+            items = categories(min(CHUNK, args.rows - offset), offset)
+            start = time.perf_counter()
+            repo.bulk_insert(items)
+            seconds += time.perf_counter() - start
+        report(f'executemany in {CHUNK:,} row batches (per row)',
+               seconds / args.rows, naive_seconds)
+
+        per_page = 50
+        page = int(args.rows * args.depth) // per_page
+        cursor = repo.search(
+            CategoryRepository.SearchParams(page=page, per_page=per_page, sort='name')).next_cursor
+        with_offset = CategoryRepository.SearchParams(page=page + 1, per_page=per_page, sort='name')
+        with_cursor = CategoryRepository.SearchParams(per_page=per_page, sort='name', cursor=cursor)
+        assert repo.search(with_offset).items == repo.search(with_cursor).items
+        offset_seconds = measure(lambda: repo.search(with_offset), number=5)
+        report(f'page {page + 1:,} sorted by name, OFFSET', offset_seconds)
+        report(f'page {page + 1:,} sorted by name, cursor',
+               measure(lambda: repo.search(with_cursor), number=5), offset_seconds)
+
+
+if __name__ == '__main__':
+    main()
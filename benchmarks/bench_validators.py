@@ -0,0 +1,37 @@
+"""Compiled validation plan against the ValidatorRules chain it replaces."""
+from common import measure, report
+
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.validators import ValidatorRules
+from category.domain.entities import Category
+
+
+def chain(name, description, is_active):
+    ValidatorRules.values(name, 'name').required().string().max_length(255)
+    ValidatorRules.values(description, 'description').string()
+    ValidatorRules.values(is_active, 'is_active').boolean()
+
+
+def chain_raising(name, description, is_active):
+    try:
+        chain(name, description, is_active)
+    except ValidationException:
+        pass
+
+
+def main():
+    check = Category.rules.check
+    valid = ('Movie', 'some description', True)
+    invalid = (5, 10, 'yes')
+
+    baseline = measure(lambda: chain(*valid))
+    report('valid / ValidatorRules chain', baseline)
+    report('valid / compiled plan', measure(lambda: check(*valid)), baseline)
+
+    baseline = measure(lambda: chain_raising(*invalid))
+    report('invalid / ValidatorRules chain (first error)', baseline)
+    report('invalid / compiled plan (all errors)', measure(lambda: check(*invalid)), baseline)
+
+
+if __name__ == '__main__':
+    main()
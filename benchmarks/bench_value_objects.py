@@ -0,0 +1,30 @@
+"""UniqueEntityId creation: generated ids against the str(uuid4()) + parse path."""
+from dataclasses import dataclass, field
+import uuid
+
+from common import measure, report
+
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True)
+class ParsedUniqueEntityId:
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    def __post_init__(self):
+        uuid.UUID(self.id)
+
+
+def main():
+    baseline = measure(ParsedUniqueEntityId)
+    report('str(uuid4()) + uuid.UUID parse', baseline)
+    report('UniqueEntityId()', measure(UniqueEntityId), baseline)
+    report('UniqueEntityId().id (rendered)', measure(lambda: UniqueEntityId().id), baseline)
+    report('UniqueEntityId.generate(1000), per id',
+           measure(lambda: UniqueEntityId.generate(1000), number=200) / 1000, baseline)
+    report('UniqueEntityId(str) parse',
+           measure(lambda: UniqueEntityId('bb0e392e-dc7b-4d13-a22a-3dd6b9d1caf5')), baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+"""
+Helpers shared by the benchmark scripts. They import the project packages, so
+run them from the repository root with the sources on the path:
+
+    PYTHONPATH=src python benchmarks/bench_validators.py
+"""
+import timeit
+from typing import Any, Callable, Optional
+
+
+def measure(func: Callable[[], Any], number: int = 100_000, repeat: int = 5) -> float:
+    """Best time per call, in seconds, over `repeat` runs of `number` calls."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(label: str, seconds: float, baseline: Optional[float] = None) -> None:
+    line = f'{label:<52} {seconds * 1e6:10.3f} us'
+    if baseline is not None:
+        line += f'   {baseline / seconds:6.2f}x'
+    print(line)
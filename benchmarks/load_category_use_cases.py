@@ -0,0 +1,83 @@
+"""
+Load test for the category use cases over the async in-memory repository:
+--concurrency workers share one repository seeded with --seed categories and
+run a get/list/create/update mix for --requests calls in total. Reports
+requests per second and per-request latency percentiles.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from category.application.use_cases import (
+    CreateCategoryUseCase,
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+    UpdateCategoryUseCase
+)
+from category.domain.entities import Category
+from category.infra.repositories import CategoryAsyncInMemoryRepository
+
+WORDS = ['movie', 'series', 'documentary', 'drama', 'comedy', 'action', 'kids', 'music']
+
+
+def random_name(rng):
+    return ' '.join(rng.sample(WORDS, 2)) + f' {rng.randrange(10_000)}'
+
+
+async def worker(repo, ids, rng, remaining, latencies):
+    create, get = CreateCategoryUseCase(repo), GetCategoryUseCase(repo)
+    list_categories, update = ListCategoriesUseCase(repo), UpdateCategoryUseCase(repo)
+    while remaining[0] > 0:
+        remaining[0] -= 1
+        roll = rng.random()
+        start = time.perf_counter()
+        if roll < 0.5:
+            await get.execute(GetCategoryUseCase.Input(rng.choice(ids)))
+        elif roll < 0.8:
+            await list_categories.execute(
+                ListCategoriesUseCase.Input(
+                    filter=rng.choice(WORDS), sort='name', page=rng.randint(1, 3)))
+        elif roll < 0.9:
+            output = await create.execute(CreateCategoryUseCase.Input(name=random_name(rng)))
+            ids.append(output.id)
+        else:
+            await update.execute(
+                UpdateCategoryUseCase.Input(id=rng.choice(ids), name=random_name(rng)))
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args):
+    rng = random.Random(42)
+    repo = CategoryAsyncInMemoryRepository()
+    seed = Category.bulk_create([{'name': random_name(rng)} for _ in range(args.seed)])
+    await repo.bulk_insert(seed)
+    ids = [category.id for category in seed]
+
+    remaining, latencies = [args.requests], []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(repo, ids, random.Random(i), remaining, latencies) for i in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f'concurrency {args.concurrency}   {len(latencies) / elapsed:10,.0f} req/s   '
+        f'p50 {quantiles[49] * 1e3:7.3f} ms   p95 {quantiles[94] * 1e3:7.3f} ms   '
+        f'p99 {quantiles[98] * 1e3:7.3f} ms'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=50_000)
+    parser.add_argument('--seed', type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+"""
+Regression suite for the seedwork and category domain layer: entity
+construction, validation (valid and failing), id generation and parsing,
+to_dict, value object __str__ and the category mutators, each timed as the
+best time per call over --repeat runs.
+
+    PYTHONPATH=src python benchmarks/suite.py --save baseline.json
+    PYTHONPATH=src python benchmarks/suite.py --compare baseline.json --max-slowdown 15
+
+--compare exits with status 1 when a case is more than --max-slowdown percent
+slower than in the baseline. Baselines only compare on the machine (and
+Python) they were recorded on; --filter runs the cases whose name contains it.
+"""
+import argparse
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import cycle
+import json
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import EntityValidationException, ValidationException
+from __seedwork.domain.validators import ValidatorRules
+from __seedwork.domain.value_objects import UniqueEntityId, ValueObject
+from category.domain.entities import Category
+
+ID = 'bb0e392e-dc7b-4d13-a22a-3dd6b9d1caf5'
+
+CASES: List[Tuple[str, Callable[[], Callable[[], Any]]]] = []
+
+
+def case(name: str):
+    """Registers a setup function returning the callable to time."""
+    def register(setup: Callable[[], Callable[[], Any]]):
+        CASES.append((name, setup))
+        return setup
+    return register
+
+
+@dataclass(frozen=True)
+class Money(ValueObject):
+    amount: int
+    currency: str
+
+
+@case('entity/construct')
+def _():
+    unique_entity_id, created_at = UniqueEntityId(), datetime.now()
+    return lambda: Category(
+        unique_entity_id=unique_entity_id, name='Movie', description='description',
+        created_at=created_at)
+
+
+@case('entity/construct with generated id and clock')
+def _():
+    return lambda: Category(name='Movie')
+
+
+@case('entity/construct trusted')
+def _():
+    unique_entity_id, created_at = UniqueEntityId(), datetime.now()
+    return lambda: Category.construct(
+        unique_entity_id=unique_entity_id, name='Movie', created_at=created_at)
+
+
+@case('entity/create with event')
+def _():
+    return lambda: Category.create('Movie', 'description')
+
+
+@case('entity/to_dict')
+def _():
+    return Category(name='Movie', description='description').to_dict
+
+
+@case('entity/to_dicts, 1k')
+def _():
+    categories = [Category(name=f'Movie {number}') for number in range(1_000)]
+    return lambda: Entity.to_dicts(categories)
+
+
+@case('validation/valid')
+def _():
+    return lambda: Category.validate('Movie', 'description', True)
+
+
+@case('validation/invalid')
+def _():
+    def validate():
+        try:
+            Category.validate(5, 10, 'yes')
+        except EntityValidationException:
+            pass
+    return validate
+
+
+@case('validation/ValidatorRules valid')
+def _():
+    return lambda: ValidatorRules.values('Movie', 'name').required().string().max_length(255)
+
+
+@case('validation/ValidatorRules invalid')
+def _():
+    def validate():
+        try:
+            ValidatorRules.values(None, 'name').required()
+        except ValidationException:
+            pass
+    return validate
+
+
+@case('id/generate')
+def _():
+    return UniqueEntityId
+
+
+@case('id/time ordered')
+def _():
+    return UniqueEntityId.time_ordered
+
+
+@case('id/generate batch, 1k')
+def _():
+    return lambda: UniqueEntityId.generate(1_000)
+
+
+@case('id/parse str')
+def _():
+    return lambda: UniqueEntityId(ID)
+
+
+@case('id/from bytes')
+def _():
+    raw = UniqueEntityId(ID).bytes
+    return lambda: UniqueEntityId.from_bytes(raw)
+
+
+@case('value object/str of a new id')
+def _():
+    raw = UniqueEntityId(ID).bytes
+    return lambda: str(UniqueEntityId.from_bytes(raw))
+
+
+@case('value object/str cached')
+def _():
+    unique_entity_id = UniqueEntityId(ID)
+    str(unique_entity_id)
+    return lambda: str(unique_entity_id)
+
+
+@case('value object/str of a new multi-field value object')
+def _():
+    return lambda: str(Money(10, 'BRL'))
+
+
+# the mutators record an event for each change, pulled right away so the list stays empty
+@case('mutators/update')
+def _():
+    category = Category(name='Movie')
+    names = cycle(('Documentary', 'Movie'))
+
+    def update():
+        category.update(next(names), 'description')
+        category.pull_events()
+    return update
+
+
+@case('mutators/toggle')
+def _():
+    category = Category(name='Movie')
+
+    def toggle():
+        category.deactivate()
+        category.activate()
+        category.pull_events()
+    return toggle
+
+
+@case('mutators/activate, already active')
+def _():
+    return Category(name='Movie').activate
+
+
+def run(name_filter: str, repeat: int) -> Dict[str, float]:
+    results = {}
+    for name, setup in CASES:
+        if name_filter not in name:
+            continue
+        timer = timeit.Timer(setup())
+        # enough calls for a run of at least 0.2 s
+        number, _ = timer.autorange()
+        results[name] = min(timer.repeat(repeat=repeat, number=number)) / number
+        print(f'{name:<56} {results[name] * 1e6:10.3f} us')
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, Any], max_slowdown: float) -> bool:
+    """
+    Prints every case against the baseline, returning whether one is over the
+    allowed slowdown.
+    """
+    if baseline.get('python') != platform.python_version():
+        print(f"warning: baseline recorded on Python {baseline.get('python')}, "
+              f"running {platform.python_version()}")
+    print(f'\n{"case":<56} {"baseline":>10} {"now":>10} {"change":>8}')
+    failed = False
+    for name, seconds in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            print(f'{name:<56} {"-":>10} {seconds * 1e6:10.3f} {"new":>8}')
+            continue
+        change = (seconds / before - 1) * 100
+        slower = change > max_slowdown
+        failed |= slower
+        print(f'{name:<56} {before * 1e6:10.3f} {seconds * 1e6:10.3f} {change:+7.1f}%'
+              + ('  SLOWER' if slower else ''))
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--save', metavar='PATH', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare with a JSON baseline')
+    parser.add_argument('--max-slowdown', type=float, default=10.0, help='percent, for --compare')
+    parser.add_argument('--filter', default='')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+    results = run(args.filter, args.repeat)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.platform(),
+                'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                'results': results,
+            }, file, indent=2)
+    if baseline is not None and compare(results, baseline, args.max_slowdown):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+from typing import Any, Dict, Generic, List, Tuple
+
+from __seedwork.domain.repositories import ET, AsyncRepositoryInterface, RepositoryInterface
+
+
+class UnitOfWork(Generic[ET]):
+    """
+    Collects the entities a business transaction changes and writes them with
+    one bulk_update_fields call on commit: entities left unchanged are not
+    written at all, the others send their changed fields, compared against
+    the version they had when registered. Stored entities have their changes
+    cleared; the conflicting ones keep them and are returned to retry. As a
+    context manager it commits on success, keeping the conflicts in
+    `conflicts`, and forgets everything on error.
+    """
+
+    def __init__(self, repository: RepositoryInterface[ET]) -> None:
+        self.repository = repository
+        self.conflicts: List[ET] = []
+        self._registered: Dict[str, Tuple[ET, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._registered)
+
+    def __enter__(self) -> 'UnitOfWork[ET]':
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.conflicts = self.commit()
+        else:
+            self.rollback()
+
+    def register(self, entity: ET) -> ET:
+        """Tracks the entity from its current version on, before it is changed."""
+        self._registered.setdefault(entity.id, (entity, entity.version))
+        return entity
+
+    def commit(self) -> List[ET]:
+        changes = _pending_changes(self._registered)
+        self._registered = {}
+        if not changes:
+            return []
+        return _stored(changes, self.repository.bulk_update_fields(changes))
+
+    def rollback(self) -> None:
+        self._registered = {}
+
+
+class AsyncUnitOfWork(Generic[ET]):
+    """UnitOfWork for coroutines."""
+
+    def __init__(self, repository: AsyncRepositoryInterface[ET]) -> None:
+        self.repository = repository
+        self.conflicts: List[ET] = []
+        self._registered: Dict[str, Tuple[ET, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._registered)
+
+    async def __aenter__(self) -> 'AsyncUnitOfWork[ET]':
+        return self
+
+    async def __aexit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.conflicts = await self.commit()
+        else:
+            self.rollback()
+
+    def register(self, entity: ET) -> ET:
+        self._registered.setdefault(entity.id, (entity, entity.version))
+        return entity
+
+    async def commit(self) -> List[ET]:
+        changes = _pending_changes(self._registered)
+        self._registered = {}
+        if not changes:
+            return []
+        return _stored(changes, await self.repository.bulk_update_fields(changes))
+
+    def rollback(self) -> None:
+        self._registered = {}
+
+
+def _pending_changes(registered: Dict[str, Tuple[ET, int]]) -> List[Tuple[ET, Dict[str, Any], int]]:
+    changes = []
+    for entity, expected_version in registered.values():
+        changed = entity.changed_fields()
+        # a delete, or changes undone, still moves the version
+        if changed or entity.version != expected_version:
+            changes.append((entity, changed, expected_version))
+    return changes
+
+
+def _stored(changes: List[Tuple[ET, Dict[str, Any], int]], conflicts: List[ET]) -> List[ET]:
+    rejected = {id(entity) for entity in conflicts}
+    for entity, _, _ in changes:
+        if id(entity) not in rejected:
+            entity.clear_changes()
+    return conflicts
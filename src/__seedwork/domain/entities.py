@@ -1,25 +1,163 @@
 from abc import ABC
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from __seedwork.domain.events import DomainEvent
+from __seedwork.domain.serializers import dict_serializer
 from __seedwork.domain.value_objects import UniqueEntityId
-from typing import Any
 
 
-@dataclass(frozen=True, slots=True)
-class Entity(ABC):
+_UNSET = object()
+
+
+def _same(current: Any, value: Any) -> bool:
+    # True == 1, but setting one in place of the other is a change
+    return current is value or (current.__class__ is value.__class__ and current == value)
+
 
-    unique_entity_id: UniqueEntityId = field(
-        default_factory=lambda: UniqueEntityId()
+@lru_cache(maxsize=None)
+def _field_names(entity_class: type) -> Tuple[str, ...]:
+    return tuple(entity_field.name for entity_field in fields(entity_class))
+
+
+@lru_cache(maxsize=None)
+def _time_ordered_ids(entity_class: type) -> bool:
+    # a class writing its own __init__ names its id factory _new_id
+    factory = getattr(entity_class, '_new_id', None) or next(
+        entity_field.default_factory for entity_field in fields(entity_class)
+        if entity_field.name == 'unique_entity_id'
     )
+    return getattr(factory, '__func__', None) is UniqueEntityId.time_ordered.__func__
+
+
+class _EntityState:
+    # outside the dataclass fields: not part of to_dict, == or repr
+    __slots__ = ('_version', '_deleted_at', '_changes')
+
+
+@dataclass(frozen=True, slots=True)
+class Entity(_EntityState, ABC):
+
+    unique_entity_id: UniqueEntityId = field(default_factory=UniqueEntityId)
+
+    @property
+    def id(self) -> str:
+        return self.unique_entity_id.id
+
+    @property
+    def version(self) -> int:
+        """The number of changes made since the entity was created."""
+        return getattr(self, '_version', 0)
 
     @property
-    def id(self):
-        return str(self.unique_entity_id)
+    def deleted_at(self) -> Optional[datetime]:
+        return getattr(self, '_deleted_at', None)
 
-    def _set(self, name: str, value: Any):
+    def delete(self) -> None:
+        """Soft delete: sets the deleted_at tombstone once."""
+        if self.deleted_at is None:
+            object.__setattr__(self, '_deleted_at', datetime.now())
+            self._bump_version()
+
+    @classmethod
+    def construct(cls, *, version: int = 0, **kwargs):
+        """Builds an entity from valid data without validating it."""
+        entity = object.__new__(cls)
+        cls.__init__(entity, **kwargs)
+        if version:
+            object.__setattr__(entity, '_version', version)
+        return entity
+
+    def copy(self):
+        """A copy of the fields, version, tombstone and changed fields."""
+        entity = object.__new__(self.__class__)
+        for name in _field_names(self.__class__):
+            object.__setattr__(entity, name, getattr(self, name))
+        if self.version:
+            object.__setattr__(entity, '_version', self.version)
+        if self.deleted_at is not None:
+            object.__setattr__(entity, '_deleted_at', self.deleted_at)
+        changes = getattr(self, '_changes', None)
+        if changes:
+            object.__setattr__(entity, '_changes', dict(changes))
+        return entity
+
+    def changed_fields(self) -> Dict[str, Any]:
+        """The fields changed since the changes were last cleared, with their current values."""
+        changes = getattr(self, '_changes', None)
+        if not changes:
+            return {}
+        return {name: getattr(self, name) for name in changes}
+
+    def clear_changes(self) -> None:
+        """Forgets the changed fields."""
+        if getattr(self, '_changes', None) is not None:
+            object.__delattr__(self, '_changes')
+
+    @classmethod
+    def generate_ids(cls, size: int, time_ordered: Optional[bool] = None) -> List[UniqueEntityId]:
+        """Ids of the kind the class makes by default, unless time_ordered says otherwise."""
+        if time_ordered is None:
+            time_ordered = _time_ordered_ids(cls)
+        return UniqueEntityId.generate(size, time_ordered=time_ordered)
+
+    def _set(self, name: str, value: Any) -> bool:
+        """Sets a field, returning whether its value changed."""
+        current = getattr(self, name)
+        if _same(current, value):
+            return False
+        try:
+            changes = self._changes
+        except AttributeError:
+            changes = {}
+            object.__setattr__(self, '_changes', changes)
+        # the value when the changes were last cleared
+        original = changes.get(name, _UNSET)
+        if original is _UNSET:
+            changes[name] = current
+        elif _same(original, value):
+            del changes[name]
         object.__setattr__(self, name, value)
+        return True
+
+    def _bump_version(self) -> None:
+        object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict_serializer(self.__class__)(self)
+
+    @staticmethod
+    def to_dicts(entities: Iterable['Entity']) -> List[Dict[str, Any]]:
+        entity_dicts = []
+        entity_class = to_dict = None
+        for entity in entities:
+            if entity.__class__ is not entity_class:
+                entity_class = entity.__class__
+                to_dict = dict_serializer(entity_class)
+            entity_dicts.append(to_dict(entity))
+        return entity_dicts
+
+
+class AggregateRoot(Entity, ABC):
+    """An entity recording domain events until they are pulled."""
+
+    __slots__ = ('_domain_events',)
+
+    @property
+    def domain_events(self) -> Tuple[DomainEvent, ...]:
+        return tuple(getattr(self, '_domain_events', ()))
+
+    def record_event(self, event: DomainEvent) -> None:
+        try:
+            self._domain_events.append(event)
+        except AttributeError:
+            object.__setattr__(self, '_domain_events', [event])
 
-    def to_dict(self):
-        entity_dict = asdict(self)
-        entity_dict.pop('unique_entity_id')
-        entity_dict['id'] = self.id
-        return entity_dict
\ No newline at end of file
+    def pull_events(self) -> List[DomainEvent]:
+        """The recorded events, oldest first, forgetting them."""
+        events = getattr(self, '_domain_events', None)
+        if events is None:
+            return []
+        object.__delattr__(self, '_domain_events')
+        return events
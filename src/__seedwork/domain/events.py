@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, List
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DomainEvent(ABC):
+
+    aggregate_id: str
+    occurred_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def event_name(self) -> str:
+        return self.__class__.__name__
+
+
+class EventPublisher(ABC):
+
+    @abstractmethod
+    async def publish(self, events: List[DomainEvent]) -> None:
+        raise NotImplementedError()
+
+
+class EventOutbox(ABC):
+
+    @abstractmethod
+    def add(self, events: Iterable[DomainEvent]) -> None:
+        """Queues events for publishing, without waiting for them to be published."""
+        raise NotImplementedError()
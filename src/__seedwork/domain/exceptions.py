@@ -1,7 +1,45 @@
+from typing import Dict, List
+
+
 class InvalidUuidException(Exception):
     def __init__(self, error = "ID must be a valid uuid") -> None:
         super().__init__(error)
 
 
+class InvalidCursorException(Exception):
+    def __init__(self, error = "Cursor is not valid") -> None:
+        super().__init__(error)
+
+
 class ValidationException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class EntityValidationException(ValidationException):
+    def __init__(self, errors: Dict[str, List[str]]) -> None:
+        self.errors = errors
+        super().__init__(next(iter(errors.values()))[0])
+
+
+class BatchValidationException(ValidationException):
+    def __init__(self, errors: Dict[int, Dict[str, List[str]]]) -> None:
+        self.errors = errors
+        super().__init__(f'{len(errors)} invalid rows')
+
+
+class NotFoundException(Exception):
+    pass
+
+
+class AlreadyExistsException(Exception):
+    pass
+
+
+class ConcurrencyException(Exception):
+    def __init__(self, entity_id: str, expected_version: int, version: int) -> None:
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        self.version = version
+        super().__init__(
+            f"Entity '{entity_id}' is at version {version}, "
+            f"it was expected at version {expected_version}")
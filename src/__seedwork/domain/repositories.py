@@ -0,0 +1,438 @@
+import abc
+from abc import ABC
+from dataclasses import dataclass, field
+from itertools import islice
+import math
+import threading
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import (
+    AlreadyExistsException,
+    ConcurrencyException,
+    InvalidCursorException,
+    NotFoundException
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+ET = TypeVar('ET', bound=Entity)
+
+
+class RepositoryInterface(Generic[ET], ABC):
+
+    @abc.abstractmethod
+    def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def bulk_insert(self, entities: List[ET]) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def update(self, entity: ET, expected_version: Optional[int] = None) -> None:
+        """
+        Stores the entity. With `expected_version`, only if the stored one is
+        still at that version (compare-and-swap), raising ConcurrencyException
+        otherwise.
+        """
+        raise NotImplementedError()
+
+    def bulk_update(self, updates: Iterable[Tuple[ET, int]]) -> List[ET]:
+        """
+        Compare-and-swap of many (entity, expected version) pairs: stores the
+        entities whose stored version is the expected one and returns the
+        others, changed or deleted since they were read, to retry.
+        """
+        conflicts = []
+        for entity, expected_version in updates:
+            try:
+                self.update(entity, expected_version)
+            except (ConcurrencyException, NotFoundException):
+                conflicts.append(entity)
+        return conflicts
+
+    def bulk_update_fields(self, changes: Iterable[Tuple[ET, Dict[str, Any], int]]) -> List[ET]:
+        """
+        bulk_update of (entity, changed fields, expected version) triples, for
+        repositories that can write only the changed fields: the others store
+        the whole entities.
+        """
+        return self.bulk_update(
+            (entity, expected_version) for entity, _, expected_version in changes)
+
+    @abc.abstractmethod
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        raise NotImplementedError()
+
+
+Input = TypeVar('Input')
+Output = TypeVar('Output')
+
+
+class SearchableRepositoryInterface(Generic[ET, Input, Output], RepositoryInterface[ET], ABC):
+    sortable_fields: List[str] = []
+
+    @abc.abstractmethod
+    def search(self, input_params: Input) -> Output:
+        raise NotImplementedError()
+
+
+class AsyncRepositoryInterface(Generic[ET], ABC):
+
+    @abc.abstractmethod
+    async def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def bulk_insert(self, entities: List[ET]) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def update(self, entity: ET, expected_version: Optional[int] = None) -> None:
+        raise NotImplementedError()
+
+    async def bulk_update(self, updates: Iterable[Tuple[ET, int]]) -> List[ET]:
+        conflicts = []
+        for entity, expected_version in updates:
+            try:
+                await self.update(entity, expected_version)
+            except (ConcurrencyException, NotFoundException):
+                conflicts.append(entity)
+        return conflicts
+
+    async def bulk_update_fields(
+        self, changes: Iterable[Tuple[ET, Dict[str, Any], int]]
+    ) -> List[ET]:
+        return await self.bulk_update(
+            (entity, expected_version) for entity, _, expected_version in changes)
+
+    @abc.abstractmethod
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        raise NotImplementedError()
+
+
+class AsyncSearchableRepositoryInterface(
+    Generic[ET, Input, Output], AsyncRepositoryInterface[ET], ABC
+):
+    sortable_fields: List[str] = []
+
+    @abc.abstractmethod
+    async def search(self, input_params: Input) -> Output:
+        raise NotImplementedError()
+
+
+Filter = TypeVar('Filter')
+
+
+@dataclass(slots=True, kw_only=True)
+class SearchParams(Generic[Filter]):
+    page: Optional[int] = 1
+    per_page: Optional[int] = 15
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+
+    def __post_init__(self):
+        self._normalize_page()
+        self._normalize_per_page()
+        self._normalize_sort()
+        self._normalize_sort_dir()
+        self._normalize_filter()
+
+    def _normalize_page(self):
+        self.page = self._to_positive_int(self.page, 1)
+
+    def _normalize_per_page(self):
+        self.per_page = self._to_positive_int(self.per_page, 15)
+
+    def _normalize_sort(self):
+        self.sort = None if self.sort == '' or self.sort is None else str(self.sort)
+
+    def _normalize_sort_dir(self):
+        if not self.sort:
+            self.sort_dir = None
+            return
+        sort_dir = str(self.sort_dir).lower()
+        self.sort_dir = 'asc' if sort_dir not in ['asc', 'desc'] else sort_dir
+
+    def _normalize_filter(self):
+        self.filter = None if self.filter == '' or self.filter is None else str(self.filter)
+
+    @staticmethod
+    def _to_positive_int(value: Any, default: int) -> int:
+        try:
+            value = int(value)
+        except (ValueError, TypeError):
+            return default
+        return value if value > 0 else default
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class SearchResult(Generic[ET, Filter]):
+    items: List[ET]
+    total: int
+    current_page: int
+    per_page: int
+    last_page: int = field(init=False)
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, 'last_page', math.ceil(self.total / self.per_page))
+
+    def to_dict(self):
+        return {
+            'items': self.items,
+            'total': self.total,
+            'current_page': self.current_page,
+            'per_page': self.per_page,
+            'last_page': self.last_page,
+            'sort': self.sort,
+            'sort_dir': self.sort_dir,
+            'filter': self.filter
+        }
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Opaque keyset pagination cursor holding the sort key values of the last
+    item of a page. It is only meaningful to the repository that issued it.
+    """
+    # pylint: disable=import-outside-toplevel
+    import base64
+    import json
+    payload = json.dumps(list(values), separators=(',', ':'), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    # pylint: disable=import-outside-toplevel
+    import base64
+    import binascii
+    import json
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error) as ex:
+        raise InvalidCursorException() from ex
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorException()
+    return values
+
+
+@dataclass(slots=True)
+class InMemoryRepository(RepositoryInterface[ET], ABC):
+    """
+    Deletes are soft: delete() and the update of an entity with a deleted_at
+    tombstone only mark the id, which every read then skips, and compact()
+    purges the marked items a budget at a time, oldest first.
+    """
+    items: Dict[str, ET] = field(default_factory=dict)
+    # the version of each item when it was last stored: the items are the
+    # instances handed out, so their own version may be ahead of it
+    versions: Dict[str, int] = field(default_factory=dict)
+    # ids deleted but not purged yet, in deletion order
+    tombstones: Dict[str, None] = field(default_factory=dict)
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+
+    def insert(self, entity: ET) -> None:
+        self.bulk_insert([entity])
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        with self.lock:
+            self._check_new(entities)
+            for entity in entities:
+                self._store_new(entity)
+                # an entity deleted before it was stored is only kept as a tombstone
+                if entity.deleted_at is not None:
+                    self._tombstone(entity.id)
+
+    def _check_new(self, entities: List[ET]) -> None:
+        # a deleted id can be inserted again, like a row deleted from a table
+        seen = set()
+        for entity in entities:
+            if entity.id in seen or (entity.id in self.items and entity.id not in self.tombstones):
+                raise AlreadyExistsException(f"Entity already exists using ID '{entity.id}'")
+            seen.add(entity.id)
+
+    def _store_new(self, entity: ET) -> None:
+        if entity.id in self.tombstones:
+            self._purge(entity.id)
+        self.items[entity.id] = entity
+        self.versions[entity.id] = entity.version
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        return self._get(str(entity_id))
+
+    def find_all(self) -> List[ET]:
+        with self.lock:
+            if not self.tombstones:
+                return list(self.items.values())
+            tombstones = self.tombstones
+            return [
+                entity for entity_id, entity in self.items.items() if entity_id not in tombstones
+            ]
+
+    def update(self, entity: ET, expected_version: Optional[int] = None) -> None:
+        with self.lock:
+            self._get(entity.id)
+            if expected_version is not None and self.versions[entity.id] != expected_version:
+                raise ConcurrencyException(entity.id, expected_version, self.versions[entity.id])
+            self.items[entity.id] = entity
+            self.versions[entity.id] = entity.version
+            if entity.deleted_at is not None:
+                self._tombstone(entity.id)
+
+    def bulk_update(self, updates: Iterable[Tuple[ET, int]]) -> List[ET]:
+        with self.lock:
+            return RepositoryInterface.bulk_update(self, updates)
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        entity_id = str(entity_id)
+        with self.lock:
+            self._get(entity_id)
+            self._tombstone(entity_id)
+
+    def compact(self, budget: int = 1_000) -> bool:
+        """Purges up to `budget` tombstoned items, returning whether some are left."""
+        with self.lock:
+            for entity_id in list(islice(self.tombstones, budget)):
+                self._purge(entity_id)
+            return bool(self.tombstones)
+
+    def _tombstone(self, entity_id: str) -> None:
+        self.tombstones[entity_id] = None
+
+    def _purge(self, entity_id: str) -> None:
+        del self.tombstones[entity_id]
+        del self.items[entity_id]
+        del self.versions[entity_id]
+
+    def _get(self, entity_id: str) -> ET:
+        try:
+            if entity_id in self.tombstones:
+                raise KeyError(entity_id)
+            return self.items[entity_id]
+        except KeyError as ex:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'") from ex
+
+
+class InMemorySearchableRepository(
+    Generic[ET, Filter],
+    InMemoryRepository[ET],
+    SearchableRepositoryInterface[ET, SearchParams[Filter], SearchResult[ET, Filter]],
+    ABC
+):
+
+    def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        items_filtered = self._apply_filter(self.find_all(), input_params.filter)
+        items_sorted = self._apply_sort(
+            items_filtered, input_params.sort, input_params.sort_dir)
+        items_paginated = self._apply_paginate(
+            items_sorted, input_params.page, input_params.per_page)
+
+        return SearchResult(
+            items=items_paginated,
+            total=len(items_filtered),
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    @abc.abstractmethod
+    def _apply_filter(self, items: List[ET], filter_param: Filter | None) -> List[ET]:
+        raise NotImplementedError()
+
+    def _apply_sort(self, items: List[ET], sort: str | None, sort_dir: str | None) -> List[ET]:
+        if sort and sort in self.sortable_fields:
+            is_reverse = sort_dir == 'desc'
+            return sorted(items, key=lambda item: getattr(item, sort), reverse=is_reverse)
+        return items
+
+    def _apply_paginate(self, items: List[ET], page: int, per_page: int) -> List[ET]:
+        start = (page - 1) * per_page
+        return items[start:start + per_page]
+
+
+class AsyncInMemoryRepository(AsyncSearchableRepositoryInterface[ET, Input, Output], ABC):
+    """
+    Exposes a synchronous in-memory repository to coroutines. Every call holds
+    one asyncio.Lock, so concurrent tasks see each operation as atomic, and
+    bulk_insert hands control back to the event loop between chunks instead of
+    blocking it for the whole batch.
+    """
+
+    def __init__(
+        self,
+        repository: SearchableRepositoryInterface[ET, Input, Output],
+        chunk_size: int = 5_000
+    ) -> None:
+        self.repository = repository
+        self.chunk_size = chunk_size
+        # asyncio is only imported once an async repository is built
+        import asyncio  # pylint: disable=import-outside-toplevel
+        self._lock = asyncio.Lock()
+
+    async def insert(self, entity: ET) -> None:
+        async with self._lock:
+            self.repository.insert(entity)
+
+    async def bulk_insert(self, entities: List[ET]) -> None:
+        import asyncio  # pylint: disable=import-outside-toplevel
+        async with self._lock:
+            for start in range(0, len(entities), self.chunk_size):
+                self.repository.bulk_insert(entities[start:start + self.chunk_size])
+                await asyncio.sleep(0)
+
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        async with self._lock:
+            return self.repository.find_by_id(entity_id)
+
+    async def find_all(self) -> List[ET]:
+        async with self._lock:
+            return self.repository.find_all()
+
+    async def update(self, entity: ET, expected_version: Optional[int] = None) -> None:
+        async with self._lock:
+            self.repository.update(entity, expected_version)
+
+    async def bulk_update(self, updates: Iterable[Tuple[ET, int]]) -> List[ET]:
+        async with self._lock:
+            return self.repository.bulk_update(updates)
+
+    async def bulk_update_fields(
+        self, changes: Iterable[Tuple[ET, Dict[str, Any], int]]
+    ) -> List[ET]:
+        async with self._lock:
+            return self.repository.bulk_update_fields(changes)
+
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        async with self._lock:
+            self.repository.delete(entity_id)
+
+    async def compact(self, budget: int = 1_000) -> bool:
+        async with self._lock:
+            return self.repository.compact(budget)
+
+    async def search(self, input_params: Input) -> Output:
+        async with self._lock:
+            return self.repository.search(input_params)
@@ -0,0 +1,98 @@
+from dataclasses import fields
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+
+@lru_cache(maxsize=None)
+def dict_serializer(entity_class: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Builds, once per entity class, a function returning the flat dict of an
+    entity: its fields read as they are, with no recursion or copies, and the
+    unique_entity_id replaced by the id string.
+    """
+    items = [
+        f'{field.name!r}: entity.{field.name}'
+        for field in fields(entity_class) if field.name != 'unique_entity_id'
+    ]
+    items.append("'id': entity.id")
+    namespace: Dict[str, Any] = {}
+    source = f"def to_dict(entity):\n    return {{{', '.join(items)}}}"
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace['to_dict']
+
+
+def isoformat(value: date) -> str:
+    # aware datetimes of the same instant in other timezones are equal,
+    # so only naive ones are cached
+    if getattr(value, 'tzinfo', None) is not None:
+        return value.isoformat()
+    return _naive_isoformat(value)
+
+
+# entities created together share created_at, so most lookups are hits
+@lru_cache(maxsize=4096)
+def _naive_isoformat(value: date) -> str:
+    return value.isoformat()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return isoformat(value)
+    return str(value)
+
+
+# json is imported on the first JSON line written, not when the module is
+@lru_cache(maxsize=None)
+def _json_encoder() -> Any:
+    import json  # pylint: disable=import-outside-toplevel
+    return json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
+
+@lru_cache(maxsize=None)
+def _json_value_encoder() -> Callable[[Any], str]:
+    from json.encoder import encode_basestring  # pylint: disable=import-outside-toplevel
+    encode = _json_encoder().encode
+
+    def json_value(value: Any) -> str:
+        if value.__class__ is str:
+            return encode_basestring(value)
+        if value is None:
+            return 'null'
+        if value is True or value is False:
+            return 'true' if value else 'false'
+        if value.__class__ is int:
+            return int.__repr__(value)
+        if isinstance(value, (datetime, date)):
+            return f'"{isoformat(value)}"'
+        return encode(value)
+    return json_value
+
+
+@lru_cache(maxsize=None)
+def json_line_serializer(entity_class: type) -> Callable[[Any], str]:
+    """
+    Builds, once per entity class, a function returning the JSON line of the
+    to_dict of an entity, the same text _json_encoder would produce, without
+    building the dict or going through the encoder for plain values.
+    """
+    from json.encoder import encode_basestring  # pylint: disable=import-outside-toplevel
+    names = [field.name for field in fields(entity_class) if field.name != 'unique_entity_id']
+    names.append('id')
+    members = ','.join(
+        f'{encode_basestring(name)}:{{_json_value(entity.{name})}}' for name in names
+    )
+    namespace: Dict[str, Any] = {'_json_value': _json_value_encoder()}
+    source = f"def to_json_line(entity):\n    return f'{{{{{members}}}}}\\n'"
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace['to_json_line']
+
+
+def iter_json_lines(entities: Iterable[Any]) -> Iterator[str]:
+    """Encodes entities lazily as JSON-lines, one newline-terminated line each."""
+    entity_class = to_json_line = None
+    for entity in entities:
+        if entity.__class__ is not entity_class:
+            entity_class = entity.__class__
+            to_json_line = json_line_serializer(entity_class)
+        yield to_json_line(entity)
@@ -2,7 +2,7 @@
 from abc import ABC
 import abc
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, List, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
 
 from .exceptions import ValidationException
 
@@ -38,6 +38,39 @@ class ValidatorRules:
 
 ErrorFields = Dict[str, List[str]]
 
+
+@dataclass(frozen=True, slots=True)
+class ErrorTable:
+    """The errors of a batch, one (row, field, messages) entry per invalid field, by row."""
+    rows: List[int]
+    fields: List[str]
+    messages: List[List[str]]
+
+    @classmethod
+    def from_rows(cls, errors: Optional[Dict[int, ErrorFields]]) -> 'ErrorTable':
+        table = cls([], [], [])
+        for row in sorted(errors or ()):
+            for prop, messages in errors[row].items():
+                table.rows.append(row)
+                table.fields.append(prop)
+                table.messages.append(messages)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Tuple[int, str, List[str]]]:
+        return zip(self.rows, self.fields, self.messages)
+
+    def invalid_rows(self) -> List[int]:
+        return sorted(set(self.rows))
+
+    def by_row(self) -> Dict[int, ErrorFields]:
+        errors: Dict[int, ErrorFields] = {}
+        for row, prop, messages in self:
+            errors.setdefault(row, {})[prop] = messages
+        return errors
+
 PropsValidated = TypeVar('PropsValidated')
 
 @dataclass(slots=True)
@@ -47,4 +80,117 @@ class ValidatorFieldsInterface(ABC, Generic[PropsValidated]):
 
     @abc.abstractmethod
     def validate(self, data: Any) -> bool:
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
+
+
+_RULE_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    'required': ('{value} is None or {value} == ""', 'Field {prop} is required'),
+    'string': (
+        '{value} is not None and not isinstance({value}, str)',
+        'Field {prop} must be a string',
+    ),
+    'max_length': (
+        '{value} is not None and len({value}) > {arg}',
+        'Field {prop} length should be smaller than {arg}',
+    ),
+    'boolean': (
+        '{value} is not None and not isinstance({value}, bool)',
+        'The {prop} must be a bool value',
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationPlan:
+    rules: Dict[str, List[Tuple[str, Optional[str]]]]
+    check: Callable[..., Optional[ErrorFields]]
+    check_columns: Callable[..., Optional[Dict[int, ErrorFields]]]
+    # (field, error message) -> name of the rule that reported it
+    failed_rules: Dict[Tuple[str, str], str]
+
+
+def _add_error(errors: Optional[ErrorFields], prop: str, message: str) -> ErrorFields:
+    if errors is None:
+        errors = {}
+    errors[prop] = [message]
+    return errors
+
+
+def _add_row_error(
+    errors: Optional[Dict[int, ErrorFields]], row: int, prop: str, message: str
+) -> Dict[int, ErrorFields]:
+    if errors is None:
+        errors = {}
+    errors.setdefault(row, {})[prop] = [message]
+    return errors
+
+
+def _parse_rules(schema: Dict[str, str]) -> Dict[str, List[Tuple[str, Optional[str]]]]:
+    rules: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+    for prop, rule_set in schema.items():
+        if not prop.isidentifier() or prop.startswith('_'):
+            raise ValueError(f'Invalid field name {prop!r}')
+        rules[prop] = []
+        for rule in rule_set.split('|'):
+            name, _, arg = rule.partition(':')
+            if name not in _RULE_TEMPLATES:
+                raise ValueError(f'Unknown validation rule {name!r}')
+            if '{arg}' in _RULE_TEMPLATES[name][0] and not arg:
+                raise ValueError(f'Validation rule {name!r} requires an argument')
+            rules[prop].append((name, str(int(arg)) if arg else None))
+    return rules
+
+
+def _rule_lines(
+    prop: str, value: str, rules: List[Tuple[str, Optional[str]]], on_error: str, indent: str
+):
+    for position, (name, arg) in enumerate(rules):
+        condition, message = _RULE_TEMPLATES[name]
+        keyword = 'if' if position == 0 else 'elif'
+        yield f'{indent}{keyword} {condition.format(value=value, arg=arg)}:'
+        text = repr(message.format(prop=prop, arg=arg))
+        yield f'{indent}    {on_error.format(prop=repr(prop), message=text)}'
+
+
+def compile_rules(schema: Dict[str, str]) -> ValidationPlan:
+    """
+    Compiles a schema such as {'name': 'required|string|max_length:255'} into
+    generated functions. Rules of a field stop at its first failure, like a
+    ValidatorRules chain, but every field is checked:
+
+    - check(**fields) returns the ErrorFields of one row, or None when valid;
+    - check_columns(size, **columns) validates whole columns, one loop per
+      field, and returns the ErrorFields of each invalid row by row number.
+    """
+    rules = _parse_rules(schema)
+    params = ', '.join(f'{prop}=None' for prop in rules)
+
+    lines = [f'def check({params}, **_):', '    _errors = None']
+    for prop, prop_rules in rules.items():
+        lines.extend(_rule_lines(
+            prop, prop, prop_rules, '_errors = _add_error(_errors, {prop}, {message})', '    '))
+    lines.append('    return _errors')
+
+    lines.extend([f'def check_columns(_size, {params}, **_):', '    _errors = None'])
+    for prop, prop_rules in rules.items():
+        lines.extend([
+            f'    for _row, _value in enumerate('
+            f'{prop} if {prop} is not None else (None,) * _size):',
+            *_rule_lines(
+                prop, '_value', prop_rules,
+                '_errors = _add_row_error(_errors, _row, {prop}, {message})', '        ')
+        ])
+    lines.append('    return _errors')
+
+    namespace = {'_add_error': _add_error, '_add_row_error': _add_row_error}
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    failed_rules = {
+        (prop, _RULE_TEMPLATES[name][1].format(prop=prop, arg=arg)): name
+        for prop, prop_rules in rules.items() for name, arg in prop_rules
+    }
+    return ValidationPlan(
+        rules=rules,
+        check=namespace['check'],
+        check_columns=namespace['check_columns'],
+        failed_rules=failed_rules
+    )
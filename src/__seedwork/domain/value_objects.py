@@ -1,34 +1,174 @@
 from abc import ABC
-import json
 from dataclasses import dataclass, field, fields
-import uuid
+from functools import lru_cache
+import os
+import sys
+import threading
+import time
+from typing import List, Tuple
 
 from __seedwork.domain.exceptions import InvalidUuidException
 
+@lru_cache(maxsize=None)
+def _fields_name(value_object_class: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(value_object_class))
+
+
 @dataclass(frozen=True, slots=True)
 class ValueObject(ABC):
 
     def __str__(self) -> str:
-        fields_name = [field.name for field in fields(self)]
-        return str(getattr(self, fields_name[0])) \
-                if len(fields_name) == 1 \
-                else json.dumps({field_name: getattr(self, field_name) for field_name in fields_name})
+        # value objects are frozen, so the string form is cached on instances having a __dict__
+        state = getattr(self, '__dict__', None)
+        if state is not None and '_ValueObject__str' in state:
+            return state['_ValueObject__str']
+        fields_name = _fields_name(self.__class__)
+        if len(fields_name) == 1:
+            value = str(getattr(self, fields_name[0]))
+        else:
+            import json  # pylint: disable=import-outside-toplevel
+            value = json.dumps(
+                {field_name: getattr(self, field_name) for field_name in fields_name})
+        if state is not None:
+            state['_ValueObject__str'] = value
+        return value
+
+
+def _parse_uuid(value: str) -> bytes:
+    import uuid  # pylint: disable=import-outside-toplevel
+    return uuid.UUID(value).bytes
+
+
+def _set_uuid4_bits(raw: bytearray) -> bytearray:
+    raw[6::16] = bytes(byte & 0x0F | 0x40 for byte in raw[6::16])
+    raw[8::16] = bytes(byte & 0x3F | 0x80 for byte in raw[8::16])
+    return raw
+
+
+def _random_uuid_bytes() -> bytes:
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40
+    raw[8] = raw[8] & 0x3F | 0x80
+    return bytes(raw)
+
+
+class _TimeOrderedIds:
+    """Version 7 UUIDs: a ms timestamp, a 26 bit counter and random bits, increasing."""
+
+    COUNTER_BITS = 26
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def next(self, size: int = 1) -> List[bytes]:
+        randomness = os.urandom(10 * size)
+        ids = []
+        with self._lock:
+            last_ms, counter = self._last_ms, self._counter
+            for start in range(0, 10 * size, 10):
+                now_ms = time.time_ns() // 1_000_000
+                if now_ms > last_ms:
+                    last_ms = now_ms
+                    counter = int.from_bytes(randomness[start:start + 4], 'big')
+                    counter >>= 33 - self.COUNTER_BITS
+                else:
+                    counter += 1
+                    if counter >> self.COUNTER_BITS:
+                        last_ms += 1
+                        counter = 0
+                value = (
+                    (last_ms & 0xFFFF_FFFF_FFFF) << 80
+                    | 0x7 << 76
+                    | (counter >> 14) << 64
+                    | 0b10 << 62
+                    | (counter & 0x3FFF) << 48
+                    | int.from_bytes(randomness[start + 4:start + 10], 'big')
+                )
+                ids.append(value.to_bytes(16, 'big'))
+            self._last_ms, self._counter = last_ms, counter
+        return ids
 
-@dataclass(frozen=True)
+
+_time_ordered_ids = _TimeOrderedIds()
+
+
+@dataclass(frozen=True, eq=False)
 class UniqueEntityId(ValueObject):
+    """Ids built from bytes keep them and render the string form when `id` is first read."""
 
     id: str = field(
-        default_factory=lambda: str(uuid.uuid4())
+        default_factory=_random_uuid_bytes
     )
 
     def __post_init__(self):
-        id_value = str(self.id) if isinstance(self.id, uuid.UUID) else self.id
-        object.__setattr__(self, 'id', id_value)
+        # uuid is only imported to parse id strings; until it is, no uuid.UUID can be passed in
+        uuid = sys.modules.get('uuid')
+        id_value = self.id
+        if uuid is not None and isinstance(id_value, uuid.UUID):
+            # the field is annotated str, pylint cannot tell it holds a uuid.UUID here
+            id_value = id_value.bytes  # pylint: disable=no-member
+        if isinstance(id_value, bytes):
+            del self.__dict__['id']
+            self.__dict__['_UniqueEntityId__raw'] = id_value
         self.__validate()
 
+    def __getattr__(self, name: str):
+        raw = self.__dict__.get('_UniqueEntityId__raw') if name == 'id' else None
+        if raw is None:
+            raise AttributeError(name)
+        hex_value = raw.hex()
+        id_value = self.__dict__['id'] = (
+            f'{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-'
+            f'{hex_value[16:20]}-{hex_value[20:]}'
+        )
+        return id_value
+
+    def __str__(self) -> str:
+        return self.id
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    @property
+    def bytes(self) -> bytes:
+        raw = self.__dict__.get('_UniqueEntityId__raw')
+        return raw if raw is not None else _parse_uuid(self.id)
+
+    @classmethod
+    def generate(cls, size: int, time_ordered: bool = False) -> List['UniqueEntityId']:
+        """`size` random (version 4) ids, or time ordered (version 7) ones."""
+        from_bytes = cls.from_bytes
+        if time_ordered:
+            return [from_bytes(raw) for raw in _time_ordered_ids.next(size)]
+        raw = bytes(_set_uuid4_bits(bytearray(os.urandom(16 * size))))
+        return [from_bytes(raw[start:start + 16]) for start in range(0, 16 * size, 16)]
+
+    @classmethod
+    def time_ordered(cls) -> 'UniqueEntityId':
+        """A version 7 id, sorting after the ones generated before it."""
+        return cls(_time_ordered_ids.next()[0])
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'UniqueEntityId':
+        """Builds an id from 16 valid bytes without validating them."""
+        unique_entity_id = object.__new__(cls)
+        unique_entity_id.__dict__['_UniqueEntityId__raw'] = raw
+        return unique_entity_id
+
     def __validate(self):
+        raw = self.__dict__.get('_UniqueEntityId__raw')
+        if raw is not None:
+            if len(raw) != 16:
+                raise InvalidUuidException()
+            return
         try:
-            uuid.UUID(self.id)
+            _parse_uuid(self.id)
         except ValueError as ex:
             raise InvalidUuidException() from ex
-
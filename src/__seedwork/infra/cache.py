@@ -0,0 +1,553 @@
+from abc import ABC
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Tuple
+
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.repositories import (
+    AsyncSearchableRepositoryInterface,
+    ET,
+    Input,
+    Output,
+    SearchableRepositoryInterface
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # misses that waited for a load already in flight instead of starting one
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    # entries found stored before the last write, counted as misses too
+    stale: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def estimate_size(entity: Any) -> int:
+    """Bytes taken by the entity and the values of its fields, not counting what they refer to."""
+    return sys.getsizeof(entity) + sum(
+        sys.getsizeof(getattr(entity, name)) for name in _init_fields(entity.__class__))
+
+
+class IdentityMap(Generic[ET]):
+    """
+    Entities by id, at most `max_entries` of them and, with `max_bytes`, at
+    most that many bytes of them as estimated by `sizeof`: the least recently
+    used ones are evicted to make room and, with a `ttl` (seconds), entries
+    expire that long after they were stored.
+    """
+
+    __slots__ = (
+        'max_entries', 'max_bytes', 'ttl', 'stats', 'bytes', '_sizeof', '_clock', '_entries'
+    )
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[ET], int] = estimate_size
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError('max_entries must be positive')
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be positive')
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        # estimated size of the entries, only kept with max_bytes
+        self.bytes = 0
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: OrderedDict[str, Tuple[ET, float, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def get(self, key: str) -> Optional[ET]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if self._expired(entry):
+            del self._entries[key]
+            self.bytes -= entry[2]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[0]
+
+    def get_many(self, keys: Iterable[str]) -> List[Optional[ET]]:
+        """get() for each key, with the clock read once."""
+        entries, move_to_end = self._entries, self._entries.move_to_end
+        now = self._clock() if self.ttl is not None else None
+        found: List[Optional[ET]] = []
+        for key in keys:
+            entry = entries.get(key)
+            if entry is not None and now is not None and entry[1] <= now:
+                del entries[key]
+                self.bytes -= entry[2]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                found.append(None)
+                continue
+            move_to_end(key)
+            found.append(entry[0])
+        misses = found.count(None)
+        self.stats.hits += len(found) - misses
+        self.stats.misses += misses
+        return found
+
+    def put(self, key: str, entity: ET) -> None:
+        expires_at = self._clock() + self.ttl if self.ttl is not None else 0.0
+        size = self._sizeof(entity) if self.max_bytes is not None else 0
+        replaced = self._entries.get(key)
+        if replaced is not None:
+            self.bytes -= replaced[2]
+        self._entries[key] = (entity, expires_at, size)
+        self._entries.move_to_end(key)
+        self.bytes += size
+        while len(self._entries) > self.max_entries or self._over_budget():
+            self.bytes -= self._entries.popitem(last=False)[1][2]
+            self.stats.evictions += 1
+
+    def discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def _over_budget(self) -> bool:
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+
+    def _expired(self, entry: Tuple[ET, float, int]) -> bool:
+        return self.ttl is not None and entry[1] <= self._clock()
+
+
+class PageCache:
+    """
+    Search results by search parameters, at most `max_entries` of them, least
+    recently used evicted first and, with a `ttl`, expiring like the entries
+    of an IdentityMap. A page keeps the ids of its items and the rest of the
+    result, not the entities. Every write bumps `generation`, and a page
+    stored under an older one is stale: it is dropped when next looked up,
+    so a write costs the same however many pages are stored.
+    """
+
+    __slots__ = ('max_entries', 'ttl', 'generation', 'stats', '_clock', '_entries')
+
+    def __init__(
+        self,
+        max_entries: int = 1_000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError('max_entries must be positive')
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[int, float, List[str], Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[List[str], Any]]:
+        """The ids and the result, items left out, of a fresh page."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        generation, expires_at, ids, result = entry
+        if generation != self.generation or self.ttl is not None and expires_at <= self._clock():
+            del self._entries[key]
+            if generation != self.generation:
+                self.stats.stale += 1
+            else:
+                self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return ids, result
+
+    def put(self, key: Hashable, generation: int, ids: List[str], result: Any) -> None:
+        """Stores a page read under `generation`, unless a write came since."""
+        if generation != self.generation:
+            return
+        expires_at = self._clock() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (generation, expires_at, ids, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def invalidate(self) -> None:
+        self.generation += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@lru_cache(maxsize=None)
+def _init_fields(dataclass_type: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(dataclass_type) if field.init)
+
+
+def _search_key(input_params: Any) -> Hashable:
+    # search parameters are normalized when built, so equal searches have equal fields
+    params_class = input_params.__class__
+    return (params_class, *map(input_params.__getattribute__, _init_fields(params_class)))
+
+
+def _without_items(result: Any) -> Tuple[type, Dict[str, Any]]:
+    return result.__class__, {
+        name: getattr(result, name) for name in _init_fields(result.__class__) if name != 'items'
+    }
+
+
+def _with_items(result: Tuple[type, Dict[str, Any]], items: List[Any]) -> Any:
+    result_class, values = result
+    return result_class(items=items, **values)
+
+
+def _refresh_updated(
+    refresh: Callable[[str, Optional[ET]], None], entities: List[ET], conflicts: List[ET]
+) -> None:
+    # stored entities refresh their entry, conflicting ones drop it
+    rejected = {id(entity) for entity in conflicts}
+    for entity in entities:
+        refresh(entity.id, None if id(entity) in rejected else entity)
+
+
+class CachedRepository(SearchableRepositoryInterface[ET, Input, Output], ABC):
+    """
+    Read-through identity map in front of find_by_id. Threads missing the same
+    id share a single load, writes go to the repository first and then refresh
+    (insert, update) or drop (bulk_insert, delete, a failed or conflicting
+    update, the update of a deleted entity) the entry, and a load that
+    was in flight during a write is not stored. find_all goes straight to
+    the repository.
+
+    search results go through a PageCache of up to `max_pages` pages, keyed
+    by the search parameters: a cached page is rebuilt from its ids through
+    the identity map, a search misses the cache once any write came since
+    the page was stored, and a search in flight during a write is not stored.
+    """
+
+    def __init__(
+        self,
+        repository: SearchableRepositoryInterface[ET, Input, Output],
+        max_entries: int = 10_000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_pages: int = 1_000,
+        max_bytes: Optional[int] = None
+    ) -> None:
+        self.repository = repository
+        self.identity_map: IdentityMap[ET] = IdentityMap(max_entries, ttl, clock, max_bytes)
+        self.pages = PageCache(max_pages, ttl, clock)
+        self._lock = threading.Lock()
+        self._loading: Dict[str, Future] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.identity_map.stats
+
+    @property
+    def page_stats(self) -> CacheStats:
+        return self.pages.stats
+
+    def insert(self, entity: ET) -> None:
+        self.repository.insert(entity)
+        self._refresh(entity.id, entity)
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        try:
+            self.repository.bulk_insert(entities)
+        finally:
+            for entity in entities:
+                self._refresh(entity.id, None)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        key = str(entity_id)
+        with self._lock:
+            entity = self.identity_map.get(key)
+            if entity is not None:
+                return entity
+            loading = self._loading.get(key)
+            owner = loading is None
+            if owner:
+                loading = self._loading[key] = Future()
+            else:
+                self.stats.coalesced += 1
+        if not owner:
+            return loading.result()
+
+        try:
+            entity = self.repository.find_by_id(entity_id)
+        except BaseException as ex:
+            self._loaded(key, loading, None)
+            loading.set_exception(ex)
+            raise
+        self._loaded(key, loading, entity)
+        loading.set_result(entity)
+        return entity
+
+    def find_all(self) -> List[ET]:
+        return self.repository.find_all()
+
+    def update(self, entity: ET, expected_version: Optional[int] = None) -> None:
+        try:
+            self.repository.update(entity, expected_version)
+        except Exception:
+            self._refresh(entity.id, None)
+            raise
+        self._refresh(entity.id, entity)
+
+    def bulk_update(self, updates: Iterable[Tuple[ET, int]]) -> List[ET]:
+        updates = list(updates)
+        try:
+            conflicts = self.repository.bulk_update(updates)
+        except Exception:
+            for entity, _ in updates:
+                self._refresh(entity.id, None)
+            raise
+        _refresh_updated(self._refresh, [entity for entity, _ in updates], conflicts)
+        return conflicts
+
+    def bulk_update_fields(self, changes: Iterable[Tuple[ET, Dict[str, Any], int]]) -> List[ET]:
+        changes = list(changes)
+        try:
+            conflicts = self.repository.bulk_update_fields(changes)
+        except Exception:
+            for entity, _, _ in changes:
+                self._refresh(entity.id, None)
+            raise
+        _refresh_updated(self._refresh, [entity for entity, _, _ in changes], conflicts)
+        return conflicts
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        try:
+            self.repository.delete(entity_id)
+        finally:
+            self._refresh(str(entity_id), None)
+
+    def search(self, input_params: Input) -> Output:
+        key = self._page_key(input_params)
+        if key is None:
+            return self.repository.search(input_params)
+        with self._lock:
+            page = self.pages.get(key)
+            if page is not None:
+                ids, result = page
+                items = self.identity_map.get_many(ids)
+            generation = self.pages.generation
+        if page is not None:
+            try:
+                return _with_items(result, [
+                    entity if entity is not None else self.find_by_id(entity_id)
+                    for entity_id, entity in zip(ids, items)
+                ])
+            except NotFoundException:
+                # deleted without going through the cache
+                pass
+
+        result = self.repository.search(input_params)
+        with self._lock:
+            if generation == self.pages.generation:
+                for entity in result.items:
+                    self.identity_map.put(entity.id, entity)
+            ids = [entity.id for entity in result.items]
+            self.pages.put(key, generation, ids, _without_items(result))
+        return result
+
+    def _page_key(self, input_params: Input) -> Optional[Hashable]:
+        """The key a search is cached under, None for searches that are not cached."""
+        return _search_key(input_params)
+
+    def _loaded(self, key: str, loading: Future, entity: Optional[ET]) -> None:
+        with self._lock:
+            if self._loading.get(key) is loading:
+                del self._loading[key]
+                if entity is not None:
+                    self.identity_map.put(key, entity)
+
+    def _refresh(self, key: str, entity: Optional[ET]) -> None:
+        with self._lock:
+            self.pages.invalidate()
+            self._loading.pop(key, None)
+            if entity is None or entity.deleted_at is not None:
+                self.identity_map.discard(key)
+            else:
+                self.identity_map.put(key, entity)
+
+
+class AsyncCachedRepository(AsyncSearchableRepositoryInterface[ET, Input, Output], ABC):
+    """
+    CachedRepository for coroutines. A miss starts the load as a task every
+    other task missing the same id awaits, so cancelling one of them does not
+    cancel the load for the rest.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncSearchableRepositoryInterface[ET, Input, Output],
+        max_entries: int = 10_000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_pages: int = 1_000,
+        max_bytes: Optional[int] = None
+    ) -> None:
+        self.repository = repository
+        self.identity_map: IdentityMap[ET] = IdentityMap(max_entries, ttl, clock, max_bytes)
+        self.pages = PageCache(max_pages, ttl, clock)
+        self._loading: Dict[str, asyncio.Future] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.identity_map.stats
+
+    @property
+    def page_stats(self) -> CacheStats:
+        return self.pages.stats
+
+    async def insert(self, entity: ET) -> None:
+        await self.repository.insert(entity)
+        self._refresh(entity.id, entity)
+
+    async def bulk_insert(self, entities: List[ET]) -> None:
+        try:
+            await self.repository.bulk_insert(entities)
+        finally:
+            for entity in entities:
+                self._refresh(entity.id, None)
+
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        key = str(entity_id)
+        entity = self.identity_map.get(key)
+        if entity is not None:
+            return entity
+        loading = self._loading.get(key)
+        if loading is not None:
+            self.stats.coalesced += 1
+        else:
+            loading = asyncio.ensure_future(self.repository.find_by_id(entity_id))
+            self._loading[key] = loading
+            loading.add_done_callback(partial(self._loaded, key))
+        return await asyncio.shield(loading)
+
+    async def find_all(self) -> List[ET]:
+        return await self.repository.find_all()
+
+    async def update(self, entity: ET, expected_version: Optional[int] = None) -> None:
+        try:
+            await self.repository.update(entity, expected_version)
+        except Exception:
+            self._refresh(entity.id, None)
+            raise
+        self._refresh(entity.id, entity)
+
+    async def bulk_update(self, updates: Iterable[Tuple[ET, int]]) -> List[ET]:
+        updates = list(updates)
+        try:
+            conflicts = await self.repository.bulk_update(updates)
+        except Exception:
+            for entity, _ in updates:
+                self._refresh(entity.id, None)
+            raise
+        _refresh_updated(self._refresh, [entity for entity, _ in updates], conflicts)
+        return conflicts
+
+    async def bulk_update_fields(
+        self, changes: Iterable[Tuple[ET, Dict[str, Any], int]]
+    ) -> List[ET]:
+        changes = list(changes)
+        try:
+            conflicts = await self.repository.bulk_update_fields(changes)
+        except Exception:
+            for entity, _, _ in changes:
+                self._refresh(entity.id, None)
+            raise
+        _refresh_updated(self._refresh, [entity for entity, _, _ in changes], conflicts)
+        return conflicts
+
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        try:
+            await self.repository.delete(entity_id)
+        finally:
+            self._refresh(str(entity_id), None)
+
+    async def search(self, input_params: Input) -> Output:
+        key = self._page_key(input_params)
+        if key is None:
+            return await self.repository.search(input_params)
+        page = self.pages.get(key)
+        generation = self.pages.generation
+        if page is not None:
+            ids, result = page
+            try:
+                items = self.identity_map.get_many(ids)
+                return _with_items(result, [
+                    entity if entity is not None else await self.find_by_id(entity_id)
+                    for entity_id, entity in zip(ids, items)
+                ])
+            except NotFoundException:
+                # deleted without going through the cache
+                pass
+
+        result = await self.repository.search(input_params)
+        if generation == self.pages.generation:
+            for entity in result.items:
+                self.identity_map.put(entity.id, entity)
+        ids = [entity.id for entity in result.items]
+        self.pages.put(key, generation, ids, _without_items(result))
+        return result
+
+    def _page_key(self, input_params: Input) -> Optional[Hashable]:
+        return _search_key(input_params)
+
+    def _loaded(self, key: str, loading: asyncio.Future) -> None:
+        if self._loading.get(key) is loading:
+            del self._loading[key]
+            if not loading.cancelled() and loading.exception() is None:
+                self.identity_map.put(key, loading.result())
+
+    def _refresh(self, key: str, entity: Optional[ET]) -> None:
+        self.pages.invalidate()
+        self._loading.pop(key, None)
+        if entity is None or entity.deleted_at is not None:
+            self.identity_map.discard(key)
+        else:
+            self.identity_map.put(key, entity)
@@ -0,0 +1,77 @@
+import asyncio
+import contextlib
+from dataclasses import dataclass
+import inspect
+from typing import Optional
+
+from __seedwork.domain.repositories import AsyncInMemoryRepository, InMemoryRepository
+
+
+@dataclass(slots=True)
+class CompactionStats:
+    steps: int = 0
+    failures: int = 0
+
+
+class Compactor:
+    """
+    Purges the tombstones of an in-memory repository from a background task,
+    one compact(budget) step at a time: `interval` seconds apart while the
+    repository reports more to do and `idle_interval` seconds apart once it
+    is done, so reads wait for one bounded step at most and get the time in
+    between. start() must be called from the event loop the task runs on,
+    close() stops it after the step in progress.
+    """
+
+    def __init__(
+        self,
+        repository: InMemoryRepository | AsyncInMemoryRepository,
+        budget: int = 10_000,
+        interval: float = 0.01,
+        idle_interval: float = 1.0
+    ) -> None:
+        if budget < 1:
+            raise ValueError('budget must be positive')
+        self.repository = repository
+        self.budget = budget
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.stats = CompactionStats()
+        self.last_error: Optional[BaseException] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> 'Compactor':
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._task is not None:
+            raise RuntimeError('The compactor is already running')
+        self._closing = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._closing.set()
+            await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while not self._closing.is_set():
+            try:
+                more = self.repository.compact(self.budget)
+                if inspect.isawaitable(more):
+                    more = await more
+            except Exception as ex:  # pylint: disable=broad-except
+                self.stats.failures += 1
+                self.last_error = ex
+                more = False
+            else:
+                self.stats.steps += 1
+            with contextlib.suppress(asyncio.TimeoutError):
+                interval = self.interval if more else self.idle_interval
+                await asyncio.wait_for(self._closing.wait(), interval)
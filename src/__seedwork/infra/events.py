@@ -0,0 +1,149 @@
+import asyncio
+from collections import defaultdict, deque
+import contextlib
+from dataclasses import dataclass
+import inspect
+from itertools import islice
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Type
+
+from __seedwork.domain.events import DomainEvent, EventOutbox, EventPublisher
+
+
+Handler = Callable[[DomainEvent], Optional[Awaitable[Any]]]
+
+
+class InProcessEventBus(EventPublisher):
+    """
+    Stand-in for a message broker: delivers every event of a batch, in order,
+    to the handlers subscribed to its class or to one of its base classes
+    (DomainEvent for all of them). Handlers may be plain functions or
+    coroutine functions.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[Type[DomainEvent], List[Handler]] = defaultdict(list)
+        self._resolved: Dict[type, List[Handler]] = {}
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: Handler) -> None:
+        self._handlers[event_type].append(handler)
+        self._resolved.clear()
+
+    async def publish(self, events: List[DomainEvent]) -> None:
+        for event in events:
+            for handler in self._handlers_for(event.__class__):
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+
+    def _handlers_for(self, event_type: type) -> List[Handler]:
+        handlers = self._resolved.get(event_type)
+        if handlers is None:
+            handlers = self._resolved[event_type] = [
+                handler
+                for base in reversed(event_type.__mro__)
+                for handler in self._handlers.get(base, ())
+            ]
+        return handlers
+
+
+@dataclass(slots=True)
+class OutboxStats:
+    published: int = 0
+    batches: int = 0
+    failures: int = 0
+
+
+class OutboxDispatcher(EventOutbox):
+    """
+    Publishes events in batches from a background task, so the write path only
+    appends them to a buffer: a batch goes out once `max_batch` events are
+    waiting or `max_delay` seconds after the first of them arrived, whichever
+    comes first. A batch the publisher fails on goes back to the head of the
+    buffer and is retried a window later. add() must be called from the event
+    loop the dispatcher runs on, which starts it; close() publishes what is
+    left and stops it.
+    """
+
+    def __init__(
+        self, publisher: EventPublisher, max_batch: int = 500, max_delay: float = 0.05
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError('max_batch must be positive')
+        self.publisher = publisher
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.stats = OutboxStats()
+        self.last_error: Optional[BaseException] = None
+        self._buffer: Deque[DomainEvent] = deque()
+        self._arrived: Optional[asyncio.Event] = None
+        self._full: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    async def __aenter__(self) -> 'OutboxDispatcher':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def add(self, events: Iterable[DomainEvent]) -> None:
+        if self._closing:
+            raise RuntimeError('The outbox is closed')
+        buffer = self._buffer
+        buffer.extend(events)
+        if not buffer:
+            return
+        if self._task is None:
+            self._arrived, self._full = asyncio.Event(), asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._arrived.set()
+        if len(buffer) >= self.max_batch:
+            self._full.set()
+
+    async def close(self) -> None:
+        """
+        Publishes the buffered events, or leaves them buffered if the publisher
+        fails, and stops.
+        """
+        self._closing = True
+        if self._task is not None:
+            self._arrived.set()
+            self._full.set()
+            await self._task
+
+    async def _run(self) -> None:
+        buffer = self._buffer
+        while True:
+            await self._arrived.wait()
+            if len(buffer) < self.max_batch and not self._closing:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._full.wait(), self.max_delay)
+            published = await self._publish_buffer()
+            if self._closing and (not buffer or not published):
+                return
+            if not buffer:
+                self._arrived.clear()
+            elif not published:
+                await asyncio.sleep(self.max_delay)
+
+    async def _publish_buffer(self) -> bool:
+        # the window is over: everything waiting goes, max_batch events at a time
+        buffer = self._buffer
+        while buffer:
+            self._full.clear()
+            batch = list(islice(buffer, self.max_batch))
+            for _ in batch:
+                buffer.popleft()
+            try:
+                await self.publisher.publish(batch)
+            except Exception as ex:  # pylint: disable=broad-except
+                buffer.extendleft(reversed(batch))
+                self.stats.failures += 1
+                self.last_error = ex
+                return False
+            self.stats.published += len(batch)
+            self.stats.batches += 1
+        return True
@@ -0,0 +1,71 @@
+import csv
+from datetime import date
+import io
+from typing import Any, BinaryIO, Iterable, Iterator, TextIO
+
+from __seedwork.domain.serializers import dict_serializer, isoformat, iter_json_lines
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_json_lines_chunks(
+    entities: Iterable[Any], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """JSON-lines of the entities, joined into chunks of about `chunk_size` characters."""
+    buffer, size = [], 0
+    for line in iter_json_lines(entities):
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield ''.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_csv_chunks(entities: Iterable[Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    CSV of entities of one class, headed by the to_dict keys of the first one
+    and cut into chunks of about `chunk_size` characters. None is written as
+    an empty cell, booleans as true/false and dates in ISO 8601.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    to_dict = None
+    for entity in entities:
+        if to_dict is None:
+            to_dict = dict_serializer(entity.__class__)
+            writer.writerow(to_dict(entity))
+        writer.writerow([_csv_value(value) for value in to_dict(entity).values()])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def write_chunks(
+    chunks: Iterable[str], target: TextIO | BinaryIO | Any, encoding: str = 'utf-8'
+) -> None:
+    """Writes text chunks to a text file, a binary file or a socket."""
+    if hasattr(target, 'sendall'):
+        for chunk in chunks:
+            target.sendall(chunk.encode(encoding))
+    elif isinstance(target, io.TextIOBase):
+        for chunk in chunks:
+            target.write(chunk)
+    else:
+        for chunk in chunks:
+            target.write(chunk.encode(encoding))
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if value is True or value is False:
+        return 'true' if value else 'false'
+    if isinstance(value, date):
+        return isoformat(value)
+    return value
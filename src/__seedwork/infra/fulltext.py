@@ -0,0 +1,452 @@
+from array import array
+from bisect import bisect_left, insort
+from collections import defaultdict
+from functools import lru_cache
+import heapq
+from itertools import count, islice
+import math
+import re
+import unicodedata
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+# Portuguese and English function words, folded: they are in most documents,
+# rank nothing and would make every query read most of the index
+STOPWORDS = frozenset('''
+    a ao aos as com da das de do dos e em na nas no nos o os ou para pela pelas pelo pelos por
+    que se sem um uma
+    an and at by for from in is it of on or the to with
+'''.split())
+
+# (text, weight): a field of a document, its words counted `weight` times
+Fields = Iterable[Tuple[str, int]]
+# (tf, document length) -> document numbers
+Groups = Dict[Tuple[int, int], Sequence[int]]
+# (score bound, term, tf, document length, document numbers)
+Group = Tuple[float, str, int, int, Sequence[int]]
+
+
+@lru_cache(maxsize=65_536)
+def _fold(token: str) -> str:
+    decomposed = unicodedata.normalize('NFKD', token)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def fold_tokens(text: str) -> List[str]:
+    """The case-folded words of `text` without their accents ('Ação' -> 'acao'), repeats kept."""
+    tokens = _TOKEN_PATTERN.findall(text.casefold())
+    return [token if token.isascii() else _fold(token) for token in tokens]
+
+
+class FullTextIndex:
+    """
+    In-process inverted index ranking documents with BM25.
+
+    Every posting is kept in the group of its (tf, document length): BM25
+    only depends on those two and the collection statistics, so a query
+    scores groups instead of documents and reads them from the best down,
+    stopping once the k-th result beats anything still unread (the
+    threshold algorithm). Terms with fewer than `group_threshold` postings
+    keep a flat list that is grouped at query time.
+
+    Postings are only appended. Changing or removing a document leaves its
+    old postings behind; they are skipped by checking them against the
+    document's current words and a term is rewritten once most of its
+    postings are stale.
+    """
+
+    __slots__ = (
+        'k1', 'b', 'max_expansions', 'group_threshold', 'stopwords',
+        '_numbers', '_ids', '_docs', '_free', '_total_length',
+        '_df', '_flat', '_grouped', '_stale', '_terms', '_dead_terms'
+    )
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        max_expansions: int = 50,
+        group_threshold: int = 32,
+        stopwords: frozenset = STOPWORDS
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        self.max_expansions = max_expansions
+        self.group_threshold = group_threshold
+        self.stopwords = stopwords
+        self._numbers: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        # the words of each document, a field's words repeated by its weight
+        self._docs: List[Optional[Tuple[str, ...]]] = []
+        self._free: List[int] = []
+        self._total_length = 0
+        self._df: Dict[str, int] = {}
+        self._flat: Dict[str, array] = {}
+        self._grouped: Dict[str, Dict[Tuple[int, int], array]] = {}
+        self._stale: Dict[str, int] = defaultdict(int)
+        # every term seen, sorted for prefix lookups; removed terms are
+        # skipped until the list is rebuilt
+        self._terms: List[str] = []
+        self._dead_terms = 0
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._numbers
+
+    def add(self, doc_id: str, fields: Fields) -> None:
+        """Indexes a document, or reindexes it when `doc_id` is already indexed."""
+        tokens = self._tokens(fields)
+        number = self._numbers.get(doc_id)
+        if number is None:
+            number = self._allocate(doc_id)
+            old: Tuple[str, ...] = ()
+        else:
+            old = self._docs[number]
+            if old == tokens:
+                return
+        self._docs[number] = tokens
+        self._total_length += len(tokens) - len(old)
+        self._reindex(number, old, tokens)
+
+    def extend(self, documents: Iterable[Tuple[str, Fields]]) -> None:
+        """Adds many new documents at once, sorting the new terms a single time."""
+        new_terms = []
+        for doc_id, fields in documents:
+            if doc_id in self._numbers:
+                self.add(doc_id, fields)
+                continue
+            tokens = self._tokens(fields)
+            number = self._allocate(doc_id)
+            self._docs[number] = tokens
+            self._total_length += len(tokens)
+            for term, tf in _counts(tokens).items():
+                if self._df.get(term) is None:
+                    new_terms.append(term)
+                self._append(term, tf, len(tokens), number, sort_terms=False)
+        if new_terms:
+            self._terms.extend(new_terms)
+            self._terms.sort()
+
+    def remove(self, doc_id: str) -> None:
+        number = self._numbers.pop(doc_id, None)
+        if number is None:
+            return
+        old = self._docs[number]
+        self._docs[number] = self._ids[number] = None
+        self._free.append(number)
+        self._total_length -= len(old)
+        self._reindex(number, old, ())
+
+    def search(self, query: str, limit: int = 10, prefix: bool = False) -> List[Tuple[str, float]]:
+        """
+        The best `limit` (id, score) pairs for the words of `query`, best
+        first. Each word other than a stopword adds the score of its term;
+        with `prefix` the last word matches the terms starting with it (up to
+        max_expansions, in term order), scoring the best of them, for search
+        as you type.
+        """
+        words = list(dict.fromkeys(fold_tokens(query)))
+        # the last word may be the start of a longer one while typing
+        words = [word for word in words[:-1] if word not in self.stopwords] + [
+            word for word in words[-1:] if prefix or word not in self.stopwords
+        ]
+        if not words or limit < 1 or not self._numbers:
+            return []
+        slots = [[word] for word in words[:-1]]
+        slots.append(self._expand(words[-1]) if prefix else [words[-1]])
+
+        k1, b = self.k1, self.b
+        avgdl = self._total_length / len(self._numbers)
+        norm = k1 * (1 - b)
+        length_norm = k1 * b / avgdl
+        idfs, queues = self._queues(slots, k1, norm, length_norm)
+        if not queues:
+            return []
+        top = _TopK(limit)
+        _read_best_groups(queues, self._docs, top, _scorer(queues, idfs, k1, norm, length_norm))
+        ids = self._ids
+        return [(ids[number], doc_score) for number, doc_score in top.ranked()]
+
+    def _queues(
+        self, slots: List[List[str]], k1: float, norm: float, length_norm: float
+    ) -> Tuple[Dict[str, float], List[List[Group]]]:
+        """The idf of each term and, per slot with a known term, its groups best bound first."""
+        n = len(self._numbers)
+        idfs: Dict[str, float] = {}
+        queues = []
+        for slot in slots:
+            groups: List[Group] = []
+            for term in slot:
+                df = self._df.get(term)
+                if not df:
+                    continue
+                idf = idfs[term] = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                groups.extend(
+                    (idf * tf * (k1 + 1) / (tf + norm + length_norm * dl), term, tf, dl, docs)
+                    for (tf, dl), docs in self._groups(term).items() if docs
+                )
+            if groups:
+                groups.sort(key=lambda group: group[0], reverse=True)
+                queues.append(groups)
+        return idfs, queues
+
+    def _tokens(self, fields: Fields) -> Tuple[str, ...]:
+        tokens: List[str] = []
+        stopwords = self.stopwords
+        for text, weight in fields:
+            if text:
+                words = [token for token in fold_tokens(text) if token not in stopwords]
+                tokens.extend(words * weight)
+        return tuple(tokens)
+
+    def _allocate(self, doc_id: str) -> int:
+        if self._free:
+            number = self._free.pop()
+            self._ids[number] = doc_id
+        else:
+            number = len(self._ids)
+            self._ids.append(doc_id)
+            self._docs.append(None)
+        self._numbers[doc_id] = number
+        return number
+
+    def _reindex(self, number: int, old: Tuple[str, ...], new: Tuple[str, ...]) -> None:
+        old_counts, new_counts = _counts(old), _counts(new)
+        old_length, new_length = len(old), len(new)
+        for term, tf in new_counts.items():
+            old_tf = old_counts.get(term)
+            if old_tf != tf or new_length != old_length:
+                self._append(term, tf, new_length, number, counted=old_tf is not None)
+        for term, tf in old_counts.items():
+            new_tf = new_counts.get(term)
+            if new_tf == tf and new_length == old_length:
+                continue
+            if new_tf is None:
+                self._df[term] -= 1
+            self._stale[term] += 1
+            self._maybe_compact(term)
+
+    def _append(
+        self,
+        term: str,
+        tf: int,
+        length: int,
+        number: int,
+        counted: bool = False,
+        sort_terms: bool = True
+    ) -> None:
+        df = self._df.get(term)
+        if df is None:
+            df = 0
+            if sort_terms:
+                insort(self._terms, term)
+        if not counted:
+            self._df[term] = df + 1
+        grouped = self._grouped.get(term)
+        if grouped is not None:
+            group = grouped.get((tf, length))
+            if group is None:
+                group = grouped[(tf, length)] = array('I')
+            group.append(number)
+            return
+        flat = self._flat.get(term)
+        if flat is None:
+            flat = self._flat[term] = array('I')
+        flat.append(number)
+        if len(flat) >= self.group_threshold:
+            del self._flat[term]
+            self._grouped[term] = {
+                key: array('I', group) for key, group in self._valid_groups(term, flat).items()
+            }
+            self._stale.pop(term, None)
+
+    def _groups(self, term: str) -> Groups:
+        grouped = self._grouped.get(term)
+        if grouped is not None:
+            return grouped
+        return self._valid_groups(term, self._flat.get(term, ()))
+
+    def _valid_groups(self, term: str, numbers: Iterable[int]) -> Dict[Tuple[int, int], List[int]]:
+        docs = self._docs
+        groups: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for number in dict.fromkeys(numbers):
+            tokens = docs[number]
+            if tokens is not None:
+                tf = tokens.count(term)
+                if tf:
+                    groups[(tf, len(tokens))].append(number)
+        return groups
+
+    def _maybe_compact(self, term: str) -> None:
+        df = self._df[term]
+        if df == 0:
+            del self._df[term]
+            self._flat.pop(term, None)
+            self._grouped.pop(term, None)
+            self._stale.pop(term, None)
+            self._dead_terms += 1
+            if self._dead_terms > 1_024 and self._dead_terms * 2 > len(self._terms):
+                self._terms = [term for term in self._terms if term in self._df]
+                self._dead_terms = 0
+            return
+        if self._stale[term] <= max(df, 64):
+            return
+        self._stale.pop(term)
+        flat = self._flat.get(term)
+        if flat is not None:
+            docs = self._docs
+            self._flat[term] = array('I', (
+                number for number in dict.fromkeys(flat)
+                if docs[number] is not None and term in docs[number]
+            ))
+            return
+        grouped = self._grouped[term]
+        self._grouped[term] = {
+            key: array('I', group)
+            for key, group in self._valid_groups(
+                term, (number for group in grouped.values() for number in group)).items()
+        }
+
+    def _expand(self, prefix: str) -> List[str]:
+        terms, df = self._terms, self._df
+        expansions: List[str] = []
+        for term in islice(terms, bisect_left(terms, prefix), None):
+            if not term.startswith(prefix):
+                break
+            # a term removed and added again is listed twice, next to each other
+            if term in df and (not expansions or expansions[-1] != term):
+                expansions.append(term)
+                if len(expansions) == self.max_expansions:
+                    break
+        return expansions
+
+
+def _counts(tokens: Iterable[str]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+class _TopK:
+    """The best `limit` documents offered, ties going to the first offered."""
+
+    __slots__ = ('limit', '_heap', '_order')
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._heap: List[Tuple[float, int, int]] = []
+        self._order = count()
+
+    def beats(self, bound: float) -> bool:
+        """Whether a document scoring `bound` would still get in."""
+        return len(self._heap) < self.limit or bound > self._heap[0][0]
+
+    def offer(self, doc_score: float, number: int) -> None:
+        entry = (doc_score, -next(self._order), number)
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def ranked(self) -> List[Tuple[int, float]]:
+        return [(number, doc_score) for doc_score, _, number in sorted(self._heap, reverse=True)]
+
+
+def _scorer(
+    queues: List[List[Group]], idfs: Dict[str, float], k1: float, norm: float, length_norm: float
+) -> Callable[[Tuple[str, ...]], float]:
+    """BM25 of a document's words: the sum over the slots, the best term of an expanded one."""
+    slot_terms = [frozenset(group[1] for group in groups) for groups in queues]
+    exact = [(term, idfs[term]) for terms in slot_terms if len(terms) == 1 for term in terms]
+    expanded = [terms for terms in slot_terms if len(terms) > 1]
+    k1_plus_1 = k1 + 1
+
+    def score(tokens: Tuple[str, ...]) -> float:
+        dl_norm = norm + length_norm * len(tokens)
+        total = 0.0
+        for term, idf in exact:
+            tf = tokens.count(term)
+            if tf:
+                total += idf * tf * k1_plus_1 / (tf + dl_norm)
+        for terms in expanded:
+            best = 0.0
+            for term in terms.intersection(tokens):
+                tf = tokens.count(term)
+                best = max(best, idfs[term] * tf * k1_plus_1 / (tf + dl_norm))
+            total += best
+        return total
+
+    return score
+
+
+def _read_best_groups(
+    queues: List[List[Group]],
+    docs: List[Optional[Tuple[str, ...]]],
+    top: _TopK,
+    score: Callable[[Tuple[str, ...]], float]
+) -> None:
+    """
+    The threshold algorithm: reads chunks of the group with the best bound
+    across the slots into `top`, until no unread document can get in.
+    """
+    slot_terms = [frozenset(group[1] for group in groups) for groups in queues]
+    # a document has to contain one of them to beat a full page with the group it is read from
+    other_terms = [
+        frozenset().union(*slot_terms[:slot], *slot_terms[slot + 1:]) for slot in range(len(queues))
+    ]
+    # (group, offset in it) of each slot
+    positions = [[0, 0] for _ in queues]
+    seen: Set[int] = set()
+    while True:
+        bounds = [
+            queue[position[0]][0] if position[0] < len(queue) else 0.0
+            for queue, position in zip(queues, positions)
+        ]
+        threshold = sum(bounds)
+        if threshold <= 0.0 or not top.beats(threshold):
+            return
+        current = bounds.index(max(bounds))
+        group, chunk = _next_chunk(queues[current], positions[current])
+        if not top.beats(group[0]):
+            # matching this slot alone is not enough any more: keep the
+            # documents matching another one, checked without scoring them
+            others = other_terms[current]
+            chunk = [
+                number for number in chunk
+                if docs[number] is not None and not others.isdisjoint(docs[number])
+            ]
+        _offer_chunk(group, chunk, docs, seen, top, score)
+
+
+def _offer_chunk(
+    group: Group,
+    chunk: Sequence[int],
+    docs: List[Optional[Tuple[str, ...]]],
+    seen: Set[int],
+    top: _TopK,
+    score: Callable[[Tuple[str, ...]], float]
+) -> None:
+    _, term, tf, dl, _ = group
+    for number in chunk:
+        tokens = docs[number]
+        # postings left behind by a change of the document are skipped
+        if number in seen or tokens is None or len(tokens) != dl or tokens.count(term) != tf:
+            continue
+        seen.add(number)
+        top.offer(score(tokens), number)
+
+
+def _next_chunk(queue: List[Group], position: List[int]) -> Tuple[Group, Sequence[int]]:
+    group = queue[position[0]]
+    documents = group[4]
+    chunk = documents[position[1]:position[1] + 256]
+    position[1] += 256
+    if position[1] >= len(documents):
+        position[0] += 1
+        position[1] = 0
+    return group, chunk
@@ -0,0 +1,160 @@
+from bisect import bisect_left, bisect_right, insort
+import re
+from typing import Any, Container, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def tokenize(text: str) -> Set[str]:
+    return set(_TOKEN_PATTERN.findall(text.casefold()))
+
+
+class SortedIndex:
+    """
+    Keeps (key, entity_id) pairs sorted so any page of the ordering is a slice.
+    Ties are broken by entity_id, which also makes every entry unique. Passing
+    `after` (a (key, entity_id) pair) starts the ordering right past that
+    entry, whether it is still indexed or not.
+    """
+
+    __slots__ = ('_entries',)
+
+    def __init__(self) -> None:
+        self._entries: List[Tuple[Any, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: Any, entity_id: str) -> None:
+        insort(self._entries, (key, entity_id))
+
+    def extend(self, entries: Iterable[Tuple[Any, str]]) -> None:
+        self._entries.extend(entries)
+        self._entries.sort()
+
+    def remove(self, key: Any, entity_id: str) -> None:
+        entry = (key, entity_id)
+        position = bisect_left(self._entries, entry)
+        if position < len(self._entries) and self._entries[position] == entry:
+            del self._entries[position]
+
+    def purge(
+        self,
+        entity_ids: Container[str],
+        start: Optional[Tuple[Any, str]] = None,
+        limit: int = 10_000
+    ) -> Optional[Tuple[Any, str]]:
+        """
+        Drops the entries of `entity_ids` among the `limit` entries from
+        `start` on, in one pass over them, and returns the entry to start the
+        next call from, or None once the end is reached.
+        """
+        entries = self._entries
+        begin = 0 if start is None else bisect_left(entries, start)
+        kept = [entry for entry in entries[begin:begin + limit] if entry[1] not in entity_ids]
+        entries[begin:begin + limit] = kept
+        position = begin + len(kept)
+        return entries[position] if position < len(entries) else None
+
+    def slice(
+        self, start: int, stop: int, reverse: bool = False, after: Optional[Tuple[Any, str]] = None
+    ) -> List[str]:
+        if reverse:
+            end = len(self._entries) if after is None else bisect_left(self._entries, after)
+            entries = self._entries[max(end - stop, 0):max(end - start, 0)]
+            entries.reverse()
+        else:
+            begin = 0 if after is None else bisect_right(self._entries, after)
+            entries = self._entries[begin + start:begin + stop]
+        return [entity_id for _, entity_id in entries]
+
+    def ids(self, reverse: bool = False, after: Optional[Tuple[Any, str]] = None) -> Iterator[str]:
+        entries = self._entries
+        if after is None:
+            return (entity_id for _, entity_id in (reversed(entries) if reverse else entries))
+        if reverse:
+            positions = range(bisect_left(entries, after) - 1, -1, -1)
+        else:
+            positions = range(bisect_right(entries, after), len(entries))
+        return (entries[position][1] for position in positions)
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        return (
+            bisect_left(self._entries, (prefix,)),
+            bisect_left(self._entries, (prefix + _MAX_CHAR,))
+        )
+
+    def ids_in_range(self, start: int, stop: int) -> Iterator[str]:
+        entries = self._entries
+        return (entries[position][1] for position in range(start, stop))
+
+
+class TokenIndex:
+    """Prefix lookups over the case-folded words of a text field."""
+
+    __slots__ = ('_tokens',)
+
+    def __init__(self) -> None:
+        self._tokens = SortedIndex()
+
+    def add(self, tokens: Iterable[str], entity_id: str) -> None:
+        for token in tokens:
+            self._tokens.add(token, entity_id)
+
+    def extend(self, entries: Iterable[Tuple[Iterable[str], str]]) -> None:
+        self._tokens.extend(
+            (token, entity_id) for tokens, entity_id in entries for token in tokens
+        )
+
+    def remove(self, tokens: Iterable[str], entity_id: str) -> None:
+        for token in tokens:
+            self._tokens.remove(token, entity_id)
+
+    def purge(
+        self,
+        entity_ids: Container[str],
+        start: Optional[Tuple[str, str]] = None,
+        limit: int = 10_000
+    ) -> Optional[Tuple[str, str]]:
+        return self._tokens.purge(entity_ids, start, limit)
+
+    def match(self, prefixes: Iterable[str]) -> Set[str]:
+        """Ids whose text has, for every prefix, a word starting with it."""
+        ranges = sorted(
+            (self._tokens.prefix_range(prefix) for prefix in prefixes),
+            key=lambda bounds: bounds[1] - bounds[0]
+        )
+        matches: Set[str] = set()
+        for position, (start, stop) in enumerate(ranges):
+            ids = self._tokens.ids_in_range(start, stop)
+            matches = set(ids) if position == 0 else matches.intersection(ids)
+            if not matches:
+                break
+        return matches
+
+
+class Bitmap:
+
+    __slots__ = ('_bytes', '_count')
+
+    def __init__(self) -> None:
+        self._bytes = bytearray()
+        self._count = 0
+
+    def __getitem__(self, position: int) -> bool:
+        byte = position >> 3
+        return byte < len(self._bytes) and bool(self._bytes[byte] & (1 << (position & 7)))
+
+    def __setitem__(self, position: int, value: bool) -> None:
+        byte = position >> 3
+        if byte >= len(self._bytes):
+            self._bytes.extend(bytes(byte - len(self._bytes) + 1))
+        mask = 1 << (position & 7)
+        if bool(self._bytes[byte] & mask) != bool(value):
+            self._bytes[byte] ^= mask
+            self._count += 1 if value else -1
+
+    def count(self) -> int:
+        return self._count
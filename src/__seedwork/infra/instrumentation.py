@@ -0,0 +1,188 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+import functools
+import inspect
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import EntityValidationException
+from __seedwork.domain.validators import ValidationPlan
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+# upper bounds, in seconds, of the latency buckets: 1 us doubling up to ~1 s,
+# the last bucket taking anything slower
+LATENCY_BOUNDS: Tuple[float, ...] = tuple(1e-6 * 2 ** exponent for exponent in range(21))
+
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class OperationStats:
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BOUNDS) + 1))
+
+    def observe(self, seconds: float) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        self.buckets[bisect_left(LATENCY_BOUNDS, seconds)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the `fraction` quantile, inf past the last bound."""
+        rank, seen = fraction * self.calls, 0
+        for position, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return LATENCY_BOUNDS[position] if position < len(LATENCY_BOUNDS) else float('inf')
+        return 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    # (class name, operation) -> stats
+    operations: Dict[Tuple[str, str], OperationStats]
+    # (class name, field, rule) -> failures
+    validation_failures: Dict[Tuple[str, str, str], int]
+
+
+class MetricsSink(ABC):
+
+    @abstractmethod
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        raise NotImplementedError()
+
+
+class InMemoryMetricsSink(MetricsSink):
+
+    def __init__(self) -> None:
+        self.snapshots: List[MetricsSnapshot] = []
+
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        self.snapshots.append(snapshot)
+
+
+class Instrumentation:
+    """
+    Opt-in counters and latency histograms for the hot paths of entities:
+    construction (__init__), validate and to_dict of the given entity classes,
+    and UniqueEntityId.__post_init__, plus the validation failures by field
+    and rule. enable() swaps the methods for instrumented ones and disable()
+    puts the originals back, so nothing is checked or timed per call while it
+    is off. Stats go to the class the method was enabled on, and the time of
+    an operation includes the operations it calls (construction includes
+    validate). flush() exports what was collected to the sink and starts over.
+    """
+
+    def __init__(self, sink: MetricsSink, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.sink = sink
+        self.clock = clock
+        self._operations: Dict[Tuple[str, str], OperationStats] = {}
+        self._failures: Dict[Tuple[str, str, str], int] = {}
+        self._swapped: List[Tuple[type, str, Any]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._swapped)
+
+    def __enter__(self) -> 'Instrumentation':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+        self.flush()
+
+    def enable(self, *entity_classes: type) -> 'Instrumentation':
+        if self._swapped:
+            raise RuntimeError('Instrumentation is already enabled')
+        self._swap(UniqueEntityId, '__post_init__', 'post_init')
+        for entity_class in entity_classes:
+            if not issubclass(entity_class, Entity):
+                raise TypeError(f'{entity_class.__name__} is not an entity')
+            self._swap(entity_class, '__init__', 'init')
+            self._swap(entity_class, 'to_dict', 'to_dict')
+            if hasattr(entity_class, 'validate'):
+                rules = getattr(entity_class, 'rules', None)
+                self._swap(entity_class, 'validate', 'validate',
+                           rules.failed_rules if isinstance(rules, ValidationPlan) else {})
+        return self
+
+    def disable(self) -> None:
+        while self._swapped:
+            owner, name, original = self._swapped.pop()
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+    def snapshot(self) -> MetricsSnapshot:
+        return MetricsSnapshot(
+            operations={
+                key: replace(stats, buckets=list(stats.buckets))
+                for key, stats in self._operations.items()
+            },
+            validation_failures=dict(self._failures)
+        )
+
+    def flush(self) -> None:
+        snapshot = self.snapshot()
+        self._operations, self._failures = {}, {}
+        self.sink.export(snapshot)
+
+    def _swap(
+        self, owner: type, name: str, operation: str, failed_rules: Optional[Dict] = None
+    ) -> None:
+        original = owner.__dict__.get(name, _MISSING)
+        # look the method up the way an instance would, without binding it
+        method = inspect.getattr_static(owner, name)
+        wrapper = type(method) if isinstance(method, (classmethod, staticmethod)) else None
+        function = method.__func__ if wrapper else method
+        instrumented = self._instrument(function, owner.__name__, operation, failed_rules)
+        setattr(owner, name, wrapper(instrumented) if wrapper else instrumented)
+        self._swapped.append((owner, name, original))
+
+    def _instrument(
+        self,
+        function: Callable,
+        class_name: str,
+        operation: str,
+        failed_rules: Optional[Dict[Tuple[str, str], str]]
+    ) -> Callable:
+        clock, key = self.clock, (class_name, operation)
+
+        @functools.wraps(function)
+        def instrumented(*args, **kwargs):
+            # looked up on each call: flush() replaces the tables
+            stats = self._operations.get(key)
+            if stats is None:
+                stats = self._operations[key] = OperationStats()
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            except EntityValidationException as ex:
+                stats.errors += 1
+                if failed_rules is not None:
+                    self._count_failures(class_name, ex.errors, failed_rules)
+                raise
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.observe(clock() - start)
+
+        return instrumented
+
+    def _count_failures(
+        self,
+        class_name: str,
+        errors: Dict[str, List[str]],
+        failed_rules: Dict[Tuple[str, str], str]
+    ) -> None:
+        failures = self._failures
+        for prop, messages in errors.items():
+            for message in messages:
+                key = (class_name, prop, failed_rules.get((prop, message), 'unknown'))
+                failures[key] = failures.get(key, 0) + 1
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta, timezone
+import sqlite3
+from typing import Optional
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def connect(database: str = ':memory:', **kwargs) -> sqlite3.Connection:
+    """
+    Opens a connection for the repositories: WAL journal, so readers do not
+    block the writer, with synchronous=NORMAL, which only syncs on checkpoints.
+    """
+    kwargs.setdefault('cached_statements', 256)
+    connection = sqlite3.connect(database, **kwargs)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    return connection
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """Naive datetimes are taken as they are, aware ones are converted to UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def utc_offset_seconds(value: datetime) -> Optional[int]:
+    """The offset to store next to to_epoch_micros, None for naive datetimes."""
+    offset = value.utcoffset()
+    return None if offset is None else offset // timedelta(seconds=1)
+
+
+def from_epoch_micros(value: int, offset_seconds: Optional[int] = None) -> datetime:
+    """A naive datetime, or an aware one at the fixed offset it was stored with."""
+    value = _EPOCH + timedelta(microseconds=value)
+    if offset_seconds is None:
+        return value
+    offset = timezone(timedelta(seconds=offset_seconds))
+    return value.replace(tzinfo=timezone.utc).astimezone(offset)
@@ -0,0 +1,24 @@
+import unittest
+from __seedwork.application.dto import PaginationOutput, PaginationOutputMapper, SearchInput
+from __seedwork.domain.repositories import SearchResult
+
+
+class TestSearchInput(unittest.TestCase):
+
+    def test_fields_default_to_none(self):
+        self.assertEqual(
+            SearchInput(),
+            SearchInput(page=None, per_page=None, sort=None, sort_dir=None, filter=None)
+        )
+
+
+class TestPaginationOutputMapper(unittest.TestCase):
+
+    def test_to_output(self):
+        result = SearchResult(items=['fake'], total=3, current_page=2, per_page=1)
+        self.assertEqual(
+            PaginationOutputMapper.to_output(['item'], result),
+            PaginationOutput(items=['item'], total=3, current_page=2, last_page=3, per_page=1)
+        )
+        output = PaginationOutputMapper.to_output([], result, 'cursor')
+        self.assertEqual(output.next_cursor, 'cursor')
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+import unittest
+from __seedwork.application.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.repositories import AsyncInMemoryRepository, InMemoryRepository
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: float
+
+    def change_price(self, price: float) -> None:
+        if self._set('price', price):
+            self._bump_version()
+
+
+class RecordingRepository(InMemoryRepository[StubEntity]):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = []
+
+    def bulk_update_fields(self, changes):
+        changes = list(changes)
+        self.writes.append(
+            [(entity.name, changed, expected) for entity, changed, expected in changes])
+        return super().bulk_update_fields(changes)
+
+
+class TestUnitOfWork(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = RecordingRepository()
+        self.entities = [StubEntity(name=str(number), price=number) for number in range(4)]
+        self.repo.bulk_insert(self.entities)
+
+    def test_writes_only_the_changed_entities_in_one_call(self):
+        with UnitOfWork(self.repo) as unit_of_work:
+            for entity in self.entities:
+                unit_of_work.register(entity)
+            self.entities[0].change_price(10)
+            self.entities[1].change_price(1)
+            self.entities[2].change_price(20)
+            self.entities[2].change_price(2)
+            self.entities[3].delete()
+            self.assertEqual(len(unit_of_work), 4)
+
+        self.assertEqual(self.repo.writes, [[('0', {'price': 10}, 0), ('2', {}, 0), ('3', {}, 0)]])
+        self.assertEqual(unit_of_work.conflicts, [])
+        self.assertEqual(self.entities[0].changed_fields(), {})
+        self.assertEqual(len(unit_of_work), 0)
+        self.assertEqual(self.repo.find_all(), self.entities[:3])
+
+    def test_nothing_changed_nothing_written(self):
+        unit_of_work = UnitOfWork(self.repo)
+        unit_of_work.register(self.entities[0]).change_price(0)
+        self.assertEqual(unit_of_work.commit(), [])
+        self.assertEqual(self.repo.writes, [])
+
+    def test_conflicting_entities_keep_their_changes(self):
+        stale = self.entities[0].copy()
+        self.entities[0].change_price(5)
+        self.repo.update(self.entities[0])
+        unit_of_work = UnitOfWork(self.repo)
+        unit_of_work.register(stale).change_price(7)
+        self.assertEqual(unit_of_work.commit(), [stale])
+        self.assertEqual(stale.changed_fields(), {'price': 7})
+
+    def test_rolls_back_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork(self.repo) as unit_of_work:
+                unit_of_work.register(self.entities[0]).change_price(10)
+                raise RuntimeError()
+        self.assertEqual(len(unit_of_work), 0)
+        self.assertEqual(self.repo.writes, [])
+        self.assertEqual(self.entities[0].changed_fields(), {'price': 10})
+
+
+class TestAsyncUnitOfWork(unittest.IsolatedAsyncioTestCase):
+
+    async def test_commits_through_an_async_repository(self):
+        repo = RecordingRepository()
+        entities = [StubEntity(name=str(number), price=number) for number in range(2)]
+        repo.bulk_insert(entities)
+        async with AsyncUnitOfWork(AsyncInMemoryRepository(repo)) as unit_of_work:
+            unit_of_work.register(entities[0]).change_price(3)
+            unit_of_work.register(entities[1])
+        self.assertEqual(repo.writes, [[('0', {'price': 3}, 0)]])
+        self.assertEqual(repo.versions[entities[0].id], 1)
@@ -1,9 +1,11 @@
 # pylint: disable=unexpected-keyword-arg
 
 from abc import ABC
-from dataclasses import dataclass, is_dataclass
+from dataclasses import dataclass, field, is_dataclass
 import unittest
-from __seedwork.domain.entities import Entity
+import uuid
+from __seedwork.domain.entities import AggregateRoot, Entity
+from __seedwork.domain.events import DomainEvent
 from __seedwork.domain.value_objects import UniqueEntityId
 
 
@@ -13,6 +15,22 @@ class StubEntity(Entity):
     prop2: str
 
 
+@dataclass(frozen=True, kw_only=True)
+class StubTimeOrderedEntity(Entity):
+    unique_entity_id: UniqueEntityId = field(default_factory=UniqueEntityId.time_ordered)
+    prop1: str
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubAggregate(AggregateRoot):
+    prop1: str
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEvent(DomainEvent):
+    pass
+
+
 class TestEntityUnit(unittest.TestCase):
 
     def test_if_is_a_dataclass(self):
@@ -49,9 +67,131 @@ class TestEntityUnit(unittest.TestCase):
             'prop2': 'value2'
         })
 
+    def test_to_dict_does_not_copy_field_values(self):
+        tags = ['a', 'b']
+        entity = StubEntity(prop1=tags, prop2='value2')
+        self.assertIs(entity.to_dict()['prop1'], tags)
+
+    def test_to_dicts_method(self):
+        entities = [
+            StubEntity(prop1='value1', prop2='value2'),
+            StubEntity(prop1='value3', prop2='value4'),
+        ]
+        self.assertEqual(
+            Entity.to_dicts(entities),
+            [entity.to_dict() for entity in entities]
+        )
+        self.assertEqual(Entity.to_dicts(iter([])), [])
+
+    def test_construct_method(self):
+        unique_entity_id = UniqueEntityId('08ff1b59-9257-4393-8ebb-1885fa2e4865')
+        entity = StubEntity.construct(
+            unique_entity_id=unique_entity_id, prop1='value1', prop2='value2')
+        self.assertEqual(
+            entity, StubEntity(unique_entity_id=unique_entity_id, prop1='value1', prop2='value2'))
+        entity = StubEntity.construct(prop1='value1', prop2='value2')
+        self.assertIsInstance(entity.unique_entity_id, UniqueEntityId)
+
+    def test_id_generation_is_selected_per_class(self):
+        self.assertEqual(uuid.UUID(StubEntity(prop1='a', prop2='b').id).version, 4)
+        self.assertEqual(uuid.UUID(StubTimeOrderedEntity(prop1='a').id).version, 7)
+
+        self.assertEqual({uuid.UUID(value.id).version for value in StubEntity.generate_ids(3)}, {4})
+        ids = StubTimeOrderedEntity.generate_ids(3)
+        self.assertEqual({uuid.UUID(value.id).version for value in ids}, {7})
+        self.assertEqual([value.id for value in ids], sorted(value.id for value in ids))
+
     def test_set_method(self):
         entity = StubEntity(prop1='value_1', prop2='value_2')
         entity._set('prop1', 'changed')
         self.assertEqual(entity.prop1, 'changed')
 
+    def test_changed_fields(self):
+        entity = StubEntity(prop1='value_1', prop2='value_2')
+        self.assertFalse(entity._set('prop1', 'value_1'))
+        self.assertEqual(entity.changed_fields(), {})
+
+        self.assertTrue(entity._set('prop1', 'changed'))
+        entity._set('prop2', 'changed too')
+        self.assertEqual(entity.changed_fields(), {'prop1': 'changed', 'prop2': 'changed too'})
+        entity._set('prop1', 'changed again')
+        entity._set('prop2', 'value_2')
+        self.assertEqual(entity.changed_fields(), {'prop1': 'changed again'})
+        self.assertEqual(entity.copy().changed_fields(), {'prop1': 'changed again'})
+        self.assertNotIn('_changes', repr(entity))
+
+        entity.clear_changes()
+        entity.clear_changes()
+        self.assertEqual(entity.changed_fields(), {})
+        self.assertEqual(entity.to_dict()['prop1'], 'changed again')
+
+    def test_set_tells_true_from_one(self):
+        entity = StubEntity(prop1=True, prop2=1)
+        self.assertTrue(entity._set('prop1', 1))
+        self.assertFalse(entity._set('prop2', 1))
+        self.assertEqual(entity.changed_fields(), {'prop1': 1})
+
+    def test_version(self):
+        entity = StubEntity(prop1='value_1', prop2='value_2')
+        self.assertEqual(entity.version, 0)
+        entity._bump_version()
+        entity._bump_version()
+        self.assertEqual(entity.version, 2)
+        self.assertEqual(
+            entity.to_dict(), {'id': entity.id, 'prop1': 'value_1', 'prop2': 'value_2'})
+
+        loaded = StubEntity.construct(unique_entity_id=entity.unique_entity_id,
+                                      prop1='value_1', prop2='value_2', version=2)
+        self.assertEqual((loaded, loaded.version), (entity, 2))
+
+    def test_copy(self):
+        aggregate = StubAggregate(prop1='value')
+        aggregate._bump_version()
+        aggregate.record_event(StubEvent(aggregate_id=aggregate.id))
+
+        copy = aggregate.copy()
+        self.assertIsNot(copy, aggregate)
+        self.assertEqual((copy, copy.version, copy.domain_events), (aggregate, 1, ()))
+        copy._set('prop1', 'changed')
+        copy._bump_version()
+        self.assertEqual((aggregate.prop1, aggregate.version), ('value', 1))
+
+    def test_delete(self):
+        entity = StubEntity(prop1='value1', prop2='value2')
+        self.assertIsNone(entity.deleted_at)
+        entity.delete()
+        deleted_at = entity.deleted_at
+        self.assertIsNotNone(deleted_at)
+        entity.delete()
+        self.assertEqual((entity.deleted_at, entity.version), (deleted_at, 1))
+        self.assertEqual(entity.copy().deleted_at, deleted_at)
+        self.assertNotIn('deleted_at', entity.to_dict())
+        self.assertEqual(entity, StubEntity(
+            unique_entity_id=entity.unique_entity_id, prop1='value1', prop2='value2'))
+
+
+class TestAggregateRootUnit(unittest.TestCase):
+
+    def test_records_and_pulls_events(self):
+        aggregate = StubAggregate(prop1='value')
+        self.assertEqual(aggregate.domain_events, ())
+        self.assertEqual(aggregate.pull_events(), [])
+
+        first, second = StubEvent(aggregate_id=aggregate.id), StubEvent(aggregate_id=aggregate.id)
+        aggregate.record_event(first)
+        aggregate.record_event(second)
+        self.assertEqual(aggregate.domain_events, (first, second))
+        self.assertEqual(first.event_name, 'StubEvent')
+
+        self.assertEqual(aggregate.pull_events(), [first, second])
+        self.assertEqual(aggregate.pull_events(), [])
+
+    def test_events_are_not_part_of_the_entity(self):
+        aggregate = StubAggregate(prop1='value')
+        copy = StubAggregate(unique_entity_id=aggregate.unique_entity_id, prop1='value')
+        aggregate.record_event(StubEvent(aggregate_id=aggregate.id))
 
+        self.assertEqual(aggregate, copy)
+        self.assertEqual(repr(aggregate), repr(copy))
+        self.assertEqual(aggregate.to_dict(), {'id': aggregate.id, 'prop1': 'value'})
+        self.assertFalse(hasattr(copy, '__dict__'))
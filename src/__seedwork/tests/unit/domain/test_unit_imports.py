@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 4))
+
+# only needed off the cold path: JSON text, cursors, async repositories and id strings
+LAZY_MODULES = ('asyncio', 'base64', 'json', 'uuid')
+
+
+def loaded_after(statement: str, modules: tuple) -> list:
+    completed = subprocess.run(
+        [sys.executable, '-c',
+         f'{statement}\nimport sys\nprint(" ".join(m for m in {modules!r} if m in sys.modules))'],
+        env=dict(os.environ, PYTHONPATH=SRC), capture_output=True, text=True, check=True
+    )
+    return completed.stdout.split()
+
+
+class TestImportsUnit(unittest.TestCase):
+
+    def test_domain_and_application_modules_leave_cold_path_modules_unloaded(self):
+        for module in [
+            '__seedwork.domain.entities',
+            '__seedwork.domain.repositories',
+            '__seedwork.domain.serializers',
+            'category.domain.entities',
+            'category.domain.repositories',
+            'category.application.use_cases',
+        ]:
+            with self.subTest(module=module):
+                self.assertEqual(loaded_after(f'import {module}', LAZY_MODULES), [])
+
+    def test_cold_paths_import_what_they_use(self):
+        self.assertEqual(loaded_after(
+            'from __seedwork.domain.value_objects import UniqueEntityId\n'
+            "UniqueEntityId('bb0e392e-dc7b-4d13-a22a-3dd6b9d1caf5')",
+            LAZY_MODULES
+        ), ['uuid'])
+        self.assertEqual(loaded_after(
+            'from __seedwork.domain.repositories import encode_cursor\n'
+            "encode_cursor(['a', 1])",
+            LAZY_MODULES
+        ), ['base64', 'json'])
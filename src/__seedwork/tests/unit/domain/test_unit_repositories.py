@@ -0,0 +1,421 @@
+# pylint: disable=unexpected-keyword-arg,protected-access
+
+from abc import ABC
+import asyncio
+from dataclasses import dataclass
+import threading
+from typing import List, Optional
+import unittest
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import (
+    AlreadyExistsException,
+    ConcurrencyException,
+    InvalidCursorException,
+    NotFoundException
+)
+from __seedwork.domain.repositories import (
+    AsyncInMemoryRepository,
+    AsyncRepositoryInterface,
+    AsyncSearchableRepositoryInterface,
+    InMemoryRepository,
+    InMemorySearchableRepository,
+    RepositoryInterface,
+    SearchParams,
+    SearchResult,
+    SearchableRepositoryInterface,
+    decode_cursor,
+    encode_cursor
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: float
+
+
+class StubInMemoryRepository(InMemoryRepository[StubEntity]):
+    pass
+
+
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity, str]):
+    sortable_fields: List[str] = ['name']
+
+    def _apply_filter(
+        self, items: List[StubEntity], filter_param: Optional[str]
+    ) -> List[StubEntity]:
+        if filter_param:
+            filter_lower = filter_param.lower()
+            return [item for item in items if filter_lower in item.name.lower()
+                    or filter_param == str(item.price)]
+        return items
+
+
+class TestRepositoryInterface(unittest.TestCase):
+
+    def test_throw_error_when_methods_not_implemented(self):
+        with self.assertRaises(TypeError):
+            RepositoryInterface()  # pylint: disable=abstract-class-instantiated
+
+    def test_searchable_repository_is_abstract(self):
+        self.assertIsInstance(SearchableRepositoryInterface, type(ABC))
+        with self.assertRaises(TypeError):
+            SearchableRepositoryInterface()  # pylint: disable=abstract-class-instantiated
+
+
+class TestAsyncRepositoryInterface(unittest.TestCase):
+
+    def test_throw_error_when_methods_not_implemented(self):
+        with self.assertRaises(TypeError):
+            AsyncRepositoryInterface()  # pylint: disable=abstract-class-instantiated
+        with self.assertRaises(TypeError):
+            AsyncSearchableRepositoryInterface()  # pylint: disable=abstract-class-instantiated
+
+
+class TestInMemoryRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = StubInMemoryRepository()
+
+    def test_items_prop_is_empty_on_init(self):
+        self.assertEqual(self.repo.items, {})
+
+    def test_insert_and_find(self):
+        entity = StubEntity(name='test', price=5)
+        self.repo.insert(entity)
+        self.assertIs(self.repo.find_by_id(entity.id), entity)
+        self.assertIs(self.repo.find_by_id(entity.unique_entity_id), entity)
+
+    def test_bulk_insert(self):
+        entities = [StubEntity(name='a', price=1), StubEntity(name='b', price=2)]
+        self.repo.bulk_insert(entities)
+        self.assertEqual(self.repo.find_all(), entities)
+
+    def test_throw_not_found_exception(self):
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.find_by_id('fake id')
+        self.assertEqual(assert_error.exception.args[0], "Entity not found using ID 'fake id'")
+
+        unique_entity_id = UniqueEntityId('af46842e-027d-4c91-b259-3a3642144ba4')
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.update(StubEntity(unique_entity_id=unique_entity_id, name='a', price=1))
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Entity not found using ID 'af46842e-027d-4c91-b259-3a3642144ba4'"
+        )
+
+        with self.assertRaises(NotFoundException):
+            self.repo.delete(unique_entity_id)
+
+    def test_update(self):
+        entity = StubEntity(name='test', price=5)
+        self.repo.insert(entity)
+        entity_updated = StubEntity(
+            unique_entity_id=entity.unique_entity_id, name='updated', price=1)
+        self.repo.update(entity_updated)
+        self.assertIs(self.repo.find_by_id(entity.id), entity_updated)
+
+    def test_update_with_expected_version(self):
+        entity = StubEntity(name='test', price=5)
+        self.repo.insert(entity)
+        first, second = entity.copy(), entity.copy()
+        first._bump_version()
+        second._bump_version()
+
+        self.repo.update(first, expected_version=0)
+        with self.assertRaises(ConcurrencyException) as assert_error:
+            self.repo.update(second, expected_version=0)
+        self.assertEqual(
+            (assert_error.exception.expected_version, assert_error.exception.version), (0, 1))
+        self.assertIs(self.repo.find_by_id(entity.id), first)
+
+        # changing the stored instance in place does not move the stored version
+        first._bump_version()
+        self.repo.update(first, expected_version=1)
+        self.assertEqual(self.repo.versions[entity.id], 2)
+
+    def test_bulk_update(self):
+        entities = [StubEntity(name=f'test {number}', price=number) for number in range(3)]
+        self.repo.bulk_insert(entities)
+        self.repo.delete(entities[2].id)
+        changed = [entity.copy() for entity in entities]
+        for entity in changed:
+            entity._bump_version()
+
+        conflicts = self.repo.bulk_update([(changed[0], 0), (changed[1], 5), (changed[2], 0)])
+        self.assertEqual(conflicts, [changed[1], changed[2]])
+        self.assertIs(self.repo.find_by_id(entities[0].id), changed[0])
+        self.assertIs(self.repo.find_by_id(entities[1].id), entities[1])
+
+    def test_delete(self):
+        entity = StubEntity(name='test', price=5)
+        self.repo.insert(entity)
+        self.repo.delete(entity.id)
+        self.assertEqual(self.repo.tombstones, {entity.id: None})
+        self.assertIsNone(entity.deleted_at)
+        self.assertEqual(self.repo.find_all(), [])
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entity.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.delete(entity.id)
+
+        self.assertFalse(self.repo.compact())
+        self.assertEqual((self.repo.items, self.repo.versions, self.repo.tombstones), ({}, {}, {}))
+
+    def test_update_a_deleted_entity_tombstones_it(self):
+        entities = [StubEntity(name=f'test {number}', price=number) for number in range(3)]
+        self.repo.bulk_insert(entities)
+        deleted = entities[0].copy()
+        deleted.delete()
+        self.repo.update(deleted, expected_version=0)
+        self.repo.delete(entities[1].id)
+        self.assertEqual(self.repo.find_all(), [entities[2]])
+
+        self.assertTrue(self.repo.compact(budget=1))
+        self.assertEqual(list(self.repo.items), [entities[1].id, entities[2].id])
+        self.assertFalse(self.repo.compact(budget=1))
+        self.assertEqual(list(self.repo.items), [entities[2].id])
+
+    def test_insert_a_tombstoned_id_again(self):
+        entity = StubEntity(name='test', price=5)
+        self.repo.insert(entity)
+        self.repo.delete(entity.id)
+        self.repo.insert(entity)
+        self.assertIs(self.repo.find_by_id(entity.id), entity)
+        self.assertEqual(self.repo.tombstones, {})
+
+    def test_insert_an_existing_id(self):
+        entity, other = StubEntity(name='test', price=5), StubEntity(name='other', price=1)
+        self.repo.insert(entity)
+
+        with self.assertRaises(AlreadyExistsException) as assert_error:
+            self.repo.insert(
+                StubEntity(unique_entity_id=entity.unique_entity_id, name='copy', price=1))
+        self.assertEqual(
+            assert_error.exception.args[0], f"Entity already exists using ID '{entity.id}'")
+        with self.assertRaises(AlreadyExistsException):
+            self.repo.bulk_insert([other, entity])
+        with self.assertRaises(AlreadyExistsException):
+            self.repo.bulk_insert([other, other])
+        self.assertEqual(self.repo.find_all(), [entity])
+
+    def test_insert_a_deleted_entity_tombstones_it(self):
+        entity, deleted = StubEntity(name='test', price=5), StubEntity(name='deleted', price=1)
+        deleted.delete()
+        self.repo.bulk_insert([entity, deleted])
+
+        self.assertEqual(self.repo.find_all(), [entity])
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(deleted.id)
+        self.assertFalse(self.repo.compact())
+        self.assertEqual(list(self.repo.items), [entity.id])
+
+    def test_insert_and_find_all_wait_for_the_lock(self):
+        entity = StubEntity(name='test', price=5)
+        threads = [
+            threading.Thread(target=self.repo.insert, args=(entity,)),
+            threading.Thread(target=self.repo.find_all)
+        ]
+        with self.repo.lock:
+            for thread in threads:
+                thread.start()
+                thread.join(timeout=0.05)
+                self.assertTrue(thread.is_alive())
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.repo.find_all(), [entity])
+
+
+class TestSearchParams(unittest.TestCase):
+
+    def test_props_annotations(self):
+        self.assertEqual(SearchParams.__annotations__, {
+            'page': Optional[int],
+            'per_page': Optional[int],
+            'sort': Optional[str],
+            'sort_dir': Optional[str],
+            'filter': Optional[SearchParams.__parameters__[0]]
+        })
+
+    def test_page_prop(self):
+        arrange = [
+            {'page': None, 'expected': 1},
+            {'page': '', 'expected': 1},
+            {'page': 'fake', 'expected': 1},
+            {'page': 0, 'expected': 1},
+            {'page': -1, 'expected': 1},
+            {'page': 5.5, 'expected': 5},
+            {'page': True, 'expected': 1},
+            {'page': 1, 'expected': 1},
+            {'page': 2, 'expected': 2},
+        ]
+        for item in arrange:
+            params = SearchParams(page=item['page'])
+            self.assertEqual(params.page, item['expected'], item)
+
+    def test_per_page_prop(self):
+        arrange = [
+            {'per_page': None, 'expected': 15},
+            {'per_page': 'fake', 'expected': 15},
+            {'per_page': 0, 'expected': 15},
+            {'per_page': -1, 'expected': 15},
+            {'per_page': '10', 'expected': 10},
+            {'per_page': 20, 'expected': 20},
+        ]
+        for item in arrange:
+            params = SearchParams(per_page=item['per_page'])
+            self.assertEqual(params.per_page, item['expected'], item)
+
+    def test_sort_and_sort_dir_props(self):
+        params = SearchParams()
+        self.assertIsNone(params.sort)
+        self.assertIsNone(params.sort_dir)
+
+        self.assertIsNone(SearchParams(sort='', sort_dir='asc').sort_dir)
+        arrange = [
+            {'sort_dir': None, 'expected': 'asc'},
+            {'sort_dir': 'fake', 'expected': 'asc'},
+            {'sort_dir': 'ASC', 'expected': 'asc'},
+            {'sort_dir': 'desc', 'expected': 'desc'},
+            {'sort_dir': 'DESC', 'expected': 'desc'},
+        ]
+        for item in arrange:
+            params = SearchParams(sort='field', sort_dir=item['sort_dir'])
+            self.assertEqual(params.sort, 'field')
+            self.assertEqual(params.sort_dir, item['expected'], item)
+
+    def test_filter_prop(self):
+        self.assertIsNone(SearchParams(filter='').filter)
+        self.assertIsNone(SearchParams(filter=None).filter)
+        self.assertEqual(SearchParams(filter=0).filter, '0')
+        self.assertEqual(SearchParams(filter='fake').filter, 'fake')
+
+
+class TestSearchResult(unittest.TestCase):
+
+    def test_constructor_and_to_dict(self):
+        entity = StubEntity(name='fake', price=5)
+        result = SearchResult(
+            items=[entity, entity],
+            total=4,
+            current_page=1,
+            per_page=2,
+            sort='name',
+            sort_dir='asc',
+            filter='test'
+        )
+        self.assertDictEqual(result.to_dict(), {
+            'items': [entity, entity],
+            'total': 4,
+            'current_page': 1,
+            'per_page': 2,
+            'last_page': 2,
+            'sort': 'name',
+            'sort_dir': 'asc',
+            'filter': 'test'
+        })
+
+    def test_when_per_page_is_greater_than_total(self):
+        result = SearchResult(items=[], total=4, current_page=1, per_page=15)
+        self.assertEqual(result.last_page, 1)
+
+    def test_when_per_page_is_less_than_total_and_they_are_not_multiples(self):
+        result = SearchResult(items=[], total=101, current_page=1, per_page=20)
+        self.assertEqual(result.last_page, 6)
+
+
+class TestCursor(unittest.TestCase):
+
+    def test_encode_and_decode(self):
+        cursor = encode_cursor(['ação', 1655, 'id'])
+        self.assertNotIn('=', cursor.rstrip('='))
+        self.assertEqual(decode_cursor(cursor, 3), ['ação', 1655, 'id'])
+
+    def test_invalid_cursor(self):
+        for cursor in ['fake', '!!!', encode_cursor(['a']), encode_cursor(['a', 'b', 'c'])]:
+            with self.assertRaises(InvalidCursorException, msg=cursor):
+                decode_cursor(cursor, 2)
+
+
+class TestInMemorySearchableRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = StubInMemorySearchableRepository()
+
+    def test_apply_filter(self):
+        items = [StubEntity(name='test', price=5), StubEntity(name='TEST', price=0)]
+        self.assertEqual(self.repo._apply_filter(items, None), items)
+        self.assertEqual(self.repo._apply_filter(items, 'TEST'), items)
+        self.assertEqual(self.repo._apply_filter(items, '5'), [items[0]])
+        self.assertEqual(self.repo._apply_filter(items, 'no-filter'), [])
+
+    def test_apply_sort(self):
+        items = [StubEntity(name='b', price=1), StubEntity(name='a', price=0)]
+        self.assertEqual(self.repo._apply_sort(items, None, None), items)
+        self.assertEqual(self.repo._apply_sort(items, 'price', 'asc'), items)
+        self.assertEqual(self.repo._apply_sort(items, 'name', 'asc'), [items[1], items[0]])
+        self.assertEqual(self.repo._apply_sort(items, 'name', 'desc'), items)
+
+    def test_apply_paginate(self):
+        items = [StubEntity(name=str(i), price=i) for i in range(5)]
+        self.assertEqual(self.repo._apply_paginate(items, 1, 2), items[:2])
+        self.assertEqual(self.repo._apply_paginate(items, 3, 2), items[4:])
+        self.assertEqual(self.repo._apply_paginate(items, 4, 2), [])
+
+    def test_search_applying_filter_sort_and_paginate(self):
+        items = [
+            StubEntity(name='test', price=5),
+            StubEntity(name='a', price=5),
+            StubEntity(name='TEST', price=5),
+            StubEntity(name='TeSt', price=5),
+        ]
+        self.repo.bulk_insert(items)
+
+        result = self.repo.search(SearchParams(
+            page=1, per_page=2, sort='name', sort_dir='asc', filter='TEST'))
+        self.assertEqual(result, SearchResult(
+            items=[items[2], items[3]],
+            total=3,
+            current_page=1,
+            per_page=2,
+            sort='name',
+            sort_dir='asc',
+            filter='TEST'
+        ))
+        self.assertEqual(result.last_page, 2)
+
+
+class TestAsyncInMemoryRepository(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.repo = AsyncInMemoryRepository(StubInMemorySearchableRepository(), chunk_size=2)
+
+    async def test_delegates_to_the_repository(self):
+        entity = StubEntity(name='test', price=5)
+        await self.repo.insert(entity)
+        self.assertIs(await self.repo.find_by_id(entity.id), entity)
+        self.assertEqual(await self.repo.find_all(), [entity])
+
+        entity_updated = StubEntity(
+            unique_entity_id=entity.unique_entity_id, name='updated', price=1)
+        await self.repo.update(entity_updated)
+        result = await self.repo.search(SearchParams(filter='updated'))
+        self.assertEqual(result.items, [entity_updated])
+
+        await self.repo.delete(entity.id)
+        with self.assertRaises(NotFoundException):
+            await self.repo.find_by_id(entity.id)
+        self.assertFalse(await self.repo.compact())
+        self.assertEqual(self.repo.repository.items, {})
+
+    async def test_bulk_insert_is_atomic_for_concurrent_tasks(self):
+        entities = [StubEntity(name=str(i), price=i) for i in range(10)]
+        bulk_insert = asyncio.create_task(self.repo.bulk_insert(entities))
+        await asyncio.sleep(0)
+        self.assertFalse(bulk_insert.done())
+
+        totals = await asyncio.gather(*(self.repo.search(SearchParams()) for _ in range(3)))
+        self.assertEqual([result.total for result in totals], [10, 10, 10])
+        await bulk_insert
+
@@ -0,0 +1,86 @@
+# pylint: disable=protected-access,unexpected-keyword-arg
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+import json
+import unittest
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.serializers import (
+    _json_encoder,
+    _naive_isoformat,
+    dict_serializer,
+    isoformat,
+    iter_json_lines,
+    json_line_serializer
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubEntity(Entity):
+    name: str
+    created_at: datetime
+
+
+class TestSerializersUnit(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.entity = StubEntity(
+            unique_entity_id=UniqueEntityId('08ff1b59-9257-4393-8ebb-1885fa2e4865'),
+            name='Ação',
+            created_at=datetime(2022, 6, 1, 12, 30)
+        )
+
+    def test_dict_serializer_is_built_once_per_class(self):
+        self.assertIs(dict_serializer(StubEntity), dict_serializer(StubEntity))
+        self.assertIsNot(dict_serializer(StubEntity), dict_serializer(Entity))
+
+    def test_dict_serializer(self):
+        self.assertEqual(dict_serializer(StubEntity)(self.entity), {
+            'name': 'Ação',
+            'created_at': datetime(2022, 6, 1, 12, 30),
+            'id': '08ff1b59-9257-4393-8ebb-1885fa2e4865',
+        })
+        entity = Entity()
+        self.assertEqual(dict_serializer(Entity)(entity), {'id': entity.id})
+
+    def test_iter_json_lines(self):
+        lines = list(iter_json_lines([self.entity, self.entity]))
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            lines[0],
+            '{"name":"Ação","created_at":"2022-06-01T12:30:00",'
+            '"id":"08ff1b59-9257-4393-8ebb-1885fa2e4865"}\n'
+        )
+        self.assertEqual(json.loads(lines[1])['id'], self.entity.id)
+
+    def test_json_line_serializer_matches_the_encoder(self):
+        @dataclass(frozen=True, kw_only=True)
+        class ValuesEntity(Entity):
+            value: object
+
+        values = ['a "quoted" \\ {text}\n', 'Ação', None, True, False, 0, -12, 1.5, float('nan'),
+                  datetime(2022, 6, 1), date(2022, 6, 1), [1, 'a'], {'a': None}, UniqueEntityId()]
+        for value in values:
+            entity = ValuesEntity(value=value)
+            self.assertEqual(
+                json_line_serializer(ValuesEntity)(entity),
+                _json_encoder().encode(dict_serializer(ValuesEntity)(entity)) + '\n',
+                value
+            )
+
+    def test_isoformat_is_cached(self):
+        _naive_isoformat.cache_clear()
+        value = datetime(2022, 6, 1, 12, 30, 0, 5)
+        self.assertEqual(isoformat(value), '2022-06-01T12:30:00.000005')
+        self.assertEqual(
+            isoformat(datetime(2022, 6, 1, 12, 30, 0, 5)), '2022-06-01T12:30:00.000005')
+        self.assertEqual(isoformat(date(2022, 6, 1)), '2022-06-01')
+        self.assertEqual(_naive_isoformat.cache_info().hits, 1)
+
+    def test_isoformat_keeps_the_offset_of_equal_aware_datetimes(self):
+        utc = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        brt = datetime(2024, 1, 1, 9, tzinfo=timezone(timedelta(hours=-3)))
+        self.assertEqual(utc, brt)
+        self.assertEqual(isoformat(utc), '2024-01-01T12:00:00+00:00')
+        self.assertEqual(isoformat(brt), '2024-01-01T09:00:00-03:00')
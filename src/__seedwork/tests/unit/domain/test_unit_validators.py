@@ -3,7 +3,7 @@
 import unittest
 from __seedwork.domain.validators import ValidatorRules
 from __seedwork.domain.exceptions import ValidationException
-from __seedwork.domain.validators import ValidatorFieldsInterface
+from __seedwork.domain.validators import ErrorTable, ValidatorFieldsInterface, compile_rules
 from dataclasses import fields
 
 
@@ -182,4 +182,96 @@ class TestValidatorFieldsInterfaceUnit(unittest.TestCase):
 
         validated_data_field = fields_class[1]
         self.assertEqual(validated_data_field.name, 'validated_data')
-        self.assertIsNone(validated_data_field.default)
\ No newline at end of file
+        self.assertIsNone(validated_data_field.default)
+
+
+class TestCompileRulesUnit(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.plan = compile_rules({
+            'name': 'required|string|max_length:5',
+            'description': 'string',
+            'is_active': 'boolean',
+        })
+
+    def test_rules_are_parsed(self):
+        self.assertEqual(self.plan.rules, {
+            'name': [('required', None), ('string', None), ('max_length', '5')],
+            'description': [('string', None)],
+            'is_active': [('boolean', None)],
+        })
+
+    def test_return_none_when_valid(self):
+        self.assertIsNone(self.plan.check('name', None, True))
+        self.assertIsNone(self.plan.check(name='t' * 5, description='', is_active=False))
+        self.assertIsNone(self.plan.check(**{'name': 'name', 'extra': 'ignored'}))
+
+    def test_messages_match_validator_rules(self):
+        arrange = [
+            ({'name': None}, 'Field name is required'),
+            ({'name': ''}, 'Field name is required'),
+            ({'name': 5}, 'Field name must be a string'),
+            ({'name': 't' * 6}, 'Field name length should be smaller than 5'),
+        ]
+        for data, message in arrange:
+            self.assertEqual(self.plan.check(**data), {'name': [message]}, data)
+
+    def test_failed_rules_name_the_rule_of_each_message(self):
+        failed_rules = self.plan.failed_rules
+        self.assertEqual(
+            failed_rules[('name', 'Field name length should be smaller than 5')], 'max_length')
+        self.assertEqual(
+            failed_rules[('is_active', 'The is_active must be a bool value')], 'boolean')
+        self.assertEqual(len(self.plan.failed_rules), 5)
+
+    def test_collect_errors_of_every_field(self):
+        self.assertEqual(self.plan.check(5, 5, 'not bool'), {
+            'name': ['Field name must be a string'],
+            'description': ['Field description must be a string'],
+            'is_active': ['The is_active must be a bool value'],
+        })
+
+    def test_check_columns(self):
+        self.assertIsNone(self.plan.check_columns(2, name=['a', 'b'], is_active=[True, None]))
+        self.assertEqual(self.plan.check_columns(
+            3,
+            name=['name', None, 5],
+            description=['description', 5, None]
+        ), {
+            1: {
+                'name': ['Field name is required'],
+                'description': ['Field description must be a string']
+            },
+            2: {'name': ['Field name must be a string']},
+        })
+        self.assertEqual(self.plan.check_columns(1), {0: {'name': ['Field name is required']}})
+
+    def test_throw_error_when_schema_is_invalid(self):
+        invalid_schemas = [
+            {'name': 'unknown'},
+            {'name': 'max_length'},
+            {'name': 'max_length:five'},
+            {'not a field': 'string'},
+            {'_private': 'string'},
+        ]
+        for schema in invalid_schemas:
+            with self.assertRaises(ValueError, msg=schema):
+                compile_rules(schema)
+
+
+
+class TestErrorTableUnit(unittest.TestCase):
+
+    def test_from_rows(self):
+        table = ErrorTable.from_rows({
+            4: {'name': ['Field name is required']},
+            1: {
+                'name': ['Field name must be a string'],
+                'is_active': ['The is_active must be a bool value'],
+            },
+        })
+        self.assertEqual((table.rows, table.fields), ([1, 1, 4], ['name', 'is_active', 'name']))
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.invalid_rows(), [1, 4])
+        self.assertEqual(table.by_row()[4], {'name': ['Field name is required']})
+        self.assertEqual(len(ErrorTable.from_rows(None)), 0)
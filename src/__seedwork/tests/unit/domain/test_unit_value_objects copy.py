@@ -1,6 +1,7 @@
 
 from dataclasses import FrozenInstanceError, dataclass, is_dataclass
 from abc import ABC
+import json
 import unittest
 from unittest.mock import patch
 from __seedwork.domain import value_objects
@@ -41,6 +42,21 @@ class TestValueObjectUnit(unittest.TestCase):
         vo2 = StubTwoProps(prop1='value1', prop2='value2')
         self.assertEqual('{"prop1": "value1", "prop2": "value2"}', str(vo2))
 
+    def test_string_is_computed_once(self):
+        vo2 = StubTwoProps(prop1='value1', prop2='value2')
+        with patch.object(json, 'dumps', wraps=json.dumps) as mock_dumps:
+            self.assertEqual(str(vo2), str(vo2))
+            mock_dumps.assert_called_once()
+
+    def test_fields_name_are_cached_per_class(self):
+        self.assertEqual(
+            value_objects._fields_name(StubTwoProps),  # pylint: disable=protected-access
+            ('prop1', 'prop2'))
+        self.assertIs(
+            value_objects._fields_name(StubTwoProps),  # pylint: disable=protected-access
+            value_objects._fields_name(StubTwoProps)  # pylint: disable=protected-access
+        )
+
     def test_if_immutable(self):
         with self.assertRaises(FrozenInstanceError):
             value_object = StubOneProp(prop="value")
@@ -88,6 +104,95 @@ class TestUniqueEntityIdUnit(unittest.TestCase):
             uuid.UUID(value_object.id)
             mock_validate.assert_called_once()
 
+    def test_generated_id_is_not_parsed_and_is_rendered_once(self):
+        with patch.object(
+                uuid.UUID, '__init__', autospec=True, side_effect=uuid.UUID.__init__) as mock_init:
+            value_object = UniqueEntityId()
+            mock_init.assert_not_called()
+        self.assertNotIn('id', value_object.__dict__)
+        self.assertEqual(uuid.UUID(value_object.id).version, 4)
+        self.assertIs(value_object.id, value_object.id)
+        self.assertEqual(value_object.bytes, uuid.UUID(value_object.id).bytes)
+
+    def test_accept_bytes_passed_in_constructor(self):
+        uuid_value = uuid.uuid4()
+        value_object = UniqueEntityId(uuid_value.bytes)
+        self.assertEqual(value_object.id, str(uuid_value))
+        self.assertEqual(value_object, UniqueEntityId(str(uuid_value)))
+
+        with self.assertRaises(InvalidUuidException):
+            UniqueEntityId(b'fake id')
+
+    def test_equality_and_hash(self):
+        uuid_value = uuid.uuid4()
+        from_str = UniqueEntityId(str(uuid_value))
+        from_bytes = UniqueEntityId(uuid_value.bytes)
+        self.assertEqual(from_str, from_bytes)
+        self.assertEqual(hash(from_str), hash(from_bytes))
+        self.assertEqual({from_str: 'value'}[from_bytes], 'value')
+        self.assertNotEqual(from_str, UniqueEntityId())
+        self.assertNotEqual(from_str, str(uuid_value))
+        self.assertEqual(str(from_bytes), str(uuid_value))
+
+    def test_bytes_prop(self):
+        value_object = UniqueEntityId('bb0e392e-dc7b-4d13-a22a-3dd6b9d1caf5')
+        self.assertEqual(
+            value_object.bytes, uuid.UUID('bb0e392e-dc7b-4d13-a22a-3dd6b9d1caf5').bytes)
+
+    def test_generate(self):
+        with patch.object(
+                value_objects.os, 'urandom', wraps=value_objects.os.urandom) as mock_urandom:
+            ids = UniqueEntityId.generate(100)
+            mock_urandom.assert_called_once_with(1600)
+        self.assertEqual(len(ids), 100)
+        self.assertEqual(len({value_object.id for value_object in ids}), 100)
+        for value_object in ids:
+            self.assertIsInstance(value_object, UniqueEntityId)
+            parsed = uuid.UUID(value_object.id)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+        self.assertEqual(UniqueEntityId.generate(0), [])
+
+    def test_time_ordered(self):
+        with patch.object(
+            UniqueEntityId,
+            '_UniqueEntityId__validate',
+            autospec=True,
+            side_effect=UniqueEntityId._UniqueEntityId__validate
+        ) as mock_validate:
+            value_object = UniqueEntityId.time_ordered()
+            mock_validate.assert_called_once()
+        parsed = uuid.UUID(value_object.id)
+        self.assertEqual(parsed.version, 7)
+        self.assertEqual(parsed.variant, uuid.RFC_4122)
+        self.assertEqual(UniqueEntityId(value_object.id), value_object)
+
+    def test_time_ordered_ids_are_monotonic_within_a_millisecond(self):
+        generator = value_objects._TimeOrderedIds()  # pylint: disable=protected-access
+        with patch.object(value_objects.time, 'time_ns', return_value=1_655_000_000_000_000_000):
+            ids = generator.next(1000) + generator.next()
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), 1001)
+        self.assertEqual({raw[:6] for raw in ids}, {(1_655_000_000_000).to_bytes(6, 'big')})
+
+    def test_time_ordered_ids_are_monotonic_when_clock_goes_backwards_or_counter_overflows(self):
+        generator = value_objects._TimeOrderedIds()  # pylint: disable=protected-access
+        with patch.object(value_objects.time, 'time_ns', return_value=2_000_000_000):
+            first = generator.next()[0]
+        generator._counter = (1 << generator.COUNTER_BITS) - 1  # pylint: disable=protected-access
+        with patch.object(value_objects.time, 'time_ns', return_value=1_000_000_000):
+            second, third = generator.next(2)
+        self.assertLess(first, second)
+        self.assertLess(second, third)
+        self.assertEqual(int.from_bytes(second[:6], 'big'), 2_001)
+        self.assertEqual(uuid.UUID(bytes=third).version, 7)
+
+    def test_generate_time_ordered(self):
+        ids = UniqueEntityId.generate(50, time_ordered=True)
+        rendered = [value_object.id for value_object in ids]
+        self.assertEqual(rendered, sorted(rendered))
+        self.assertEqual({uuid.UUID(value_object.id).version for value_object in ids}, {7})
+
     def test_if_immutable(self):
         with self.assertRaises(FrozenInstanceError):
             value_object = UniqueEntityId()
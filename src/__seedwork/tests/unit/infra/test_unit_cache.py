@@ -0,0 +1,367 @@
+# pylint: disable=unexpected-keyword-arg,protected-access
+
+import asyncio
+from dataclasses import dataclass
+import threading
+from typing import List, Optional
+import unittest
+from unittest.mock import patch
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.repositories import (
+    AsyncInMemoryRepository,
+    InMemorySearchableRepository,
+    SearchParams
+)
+from __seedwork.infra.cache import (
+    AsyncCachedRepository,
+    CachedRepository,
+    CacheStats,
+    IdentityMap,
+    PageCache,
+    estimate_size
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+
+
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity, str]):
+
+    def _apply_filter(
+        self, items: List[StubEntity], filter_param: Optional[str]
+    ) -> List[StubEntity]:
+        return [item for item in items if not filter_param or filter_param in item.name]
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIdentityMap(unittest.TestCase):
+
+    def test_evicts_the_least_recently_used(self):
+        identity_map = IdentityMap(max_entries=2)
+        identity_map.put('a', 1)
+        identity_map.put('b', 2)
+        self.assertEqual(identity_map.get('a'), 1)
+        identity_map.put('c', 3)
+
+        self.assertNotIn('b', identity_map)
+        self.assertEqual(
+            (identity_map.get('a'), identity_map.get('b'), identity_map.get('c')), (1, None, 3))
+        self.assertEqual(identity_map.stats, CacheStats(hits=3, misses=1, evictions=1))
+        self.assertEqual(identity_map.stats.hit_rate, 0.75)
+
+        with self.assertRaises(ValueError):
+            IdentityMap(max_entries=0)
+
+    def test_evicts_over_the_byte_budget(self):
+        identity_map = IdentityMap(max_bytes=10, sizeof=len)
+        identity_map.put('a', 'aaaa')
+        identity_map.put('b', 'bbbb')
+        identity_map.put('a', 'aa')
+        self.assertEqual(identity_map.bytes, 6)
+        identity_map.put('c', 'cccccc')
+
+        self.assertEqual(
+            (identity_map.get('a'), identity_map.get('b'), identity_map.get('c')),
+            ('aa', None, 'cccccc'))
+        self.assertEqual((identity_map.bytes, identity_map.stats.evictions), (8, 1))
+        identity_map.put('d', 'd' * 11)
+        self.assertEqual((len(identity_map), identity_map.bytes), (0, 0))
+        identity_map.put('e', 'e')
+        identity_map.discard('e')
+        self.assertEqual(identity_map.bytes, 0)
+
+        with self.assertRaises(ValueError):
+            IdentityMap(max_bytes=0)
+
+    def test_estimates_the_size_of_entities(self):
+        entity = StubEntity(name='x' * 1000)
+        self.assertGreater(estimate_size(entity), 1000)
+        identity_map = IdentityMap(max_bytes=estimate_size(entity) * 3)
+        for number in range(5):
+            identity_map.put(str(number), StubEntity(name=str(number) * 1000))
+        self.assertEqual(len(identity_map), 3)
+        repo = CachedRepository(StubInMemorySearchableRepository(), max_bytes=100)
+        self.assertEqual(repo.identity_map.max_bytes, 100)
+
+    def test_expires_entries(self):
+        clock = FakeClock()
+        identity_map = IdentityMap(ttl=10, clock=clock)
+        identity_map.put('a', 1)
+        clock.now = 9.9
+        self.assertEqual(identity_map.get('a'), 1)
+        identity_map.put('b', 2)
+        self.assertEqual(identity_map.get_many(['a', 'c', 'b']), [1, None, 2])
+        clock.now = 10
+        self.assertNotIn('a', identity_map)
+        self.assertIsNone(identity_map.get('a'))
+        clock.now = 19.9
+        self.assertEqual(identity_map.get_many(['b']), [None])
+        self.assertEqual(len(identity_map), 0)
+        self.assertEqual(identity_map.stats, CacheStats(hits=3, misses=3, expirations=2))
+
+    def test_discard_and_clear(self):
+        identity_map = IdentityMap()
+        identity_map.put('a', 1)
+        identity_map.put('b', 2)
+        identity_map.discard('a')
+        identity_map.discard('fake')
+        self.assertEqual(len(identity_map), 1)
+        identity_map.clear()
+        self.assertEqual(len(identity_map), 0)
+
+
+class TestPageCache(unittest.TestCase):
+
+    def test_pages_go_stale_on_the_next_generation(self):
+        pages = PageCache()
+        pages.put('a', 0, ['1'], 'result')
+        self.assertEqual(pages.get('a'), (['1'], 'result'))
+        pages.invalidate()
+        pages.put('b', 0, ['2'], 'result')
+
+        self.assertIsNone(pages.get('a'))
+        self.assertIsNone(pages.get('b'))
+        self.assertEqual(len(pages), 0)
+        self.assertEqual(pages.stats, CacheStats(hits=1, misses=2, stale=1))
+
+        with self.assertRaises(ValueError):
+            PageCache(max_entries=0)
+
+    def test_evicts_and_expires_pages(self):
+        clock = FakeClock()
+        pages = PageCache(max_entries=2, ttl=10, clock=clock)
+        for key in 'abc':
+            pages.put(key, 0, [], key)
+        clock.now = 10
+        self.assertIsNone(pages.get('a'))
+        self.assertIsNone(pages.get('b'))
+        self.assertEqual(pages.stats, CacheStats(misses=2, evictions=1, expirations=1))
+
+
+class TestCachedRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.inner = StubInMemorySearchableRepository()
+        self.repo = CachedRepository(self.inner, max_entries=10)
+
+    def test_find_by_id_reads_through(self):
+        entity = StubEntity(name='test')
+        self.inner.insert(entity)
+        with patch.object(self.inner, 'find_by_id', wraps=self.inner.find_by_id) as find_by_id:
+            self.assertIs(self.repo.find_by_id(entity.id), entity)
+            self.assertIs(self.repo.find_by_id(entity.unique_entity_id), entity)
+        find_by_id.assert_called_once_with(entity.id)
+        self.assertEqual(self.repo.stats, CacheStats(hits=1, misses=1))
+
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id('fake id')
+        self.assertNotIn('fake id', self.repo.identity_map)
+        self.assertEqual(self.repo._loading, {})
+
+    def test_writes_refresh_or_drop_the_entry(self):
+        entity = StubEntity(name='test')
+        self.repo.insert(entity)
+        self.assertIs(self.repo.identity_map.get(entity.id), entity)
+
+        updated = StubEntity(unique_entity_id=entity.unique_entity_id, name='updated')
+        self.repo.update(updated)
+        self.assertIs(self.repo.find_by_id(entity.id), updated)
+        self.assertEqual(self.repo.search(SearchParams(filter='updated')).items, [updated])
+
+        self.repo.delete(entity.id)
+        self.assertNotIn(entity.id, self.repo.identity_map)
+        with self.assertRaises(NotFoundException):
+            self.repo.update(updated)
+        self.assertNotIn(entity.id, self.repo.identity_map)
+
+        entities = [StubEntity(name=str(i)) for i in range(3)]
+        self.repo.bulk_insert(entities)
+        self.assertEqual(len(self.repo.identity_map), 0)
+        self.assertEqual(self.repo.find_all(), entities)
+
+    def test_bulk_update_drops_the_conflicting_entries(self):
+        entities = [StubEntity(name=str(i)) for i in range(2)]
+        for entity in entities:
+            self.repo.insert(entity)
+        changed = [entity.copy() for entity in entities]
+
+        self.assertEqual(self.repo.bulk_update([(changed[0], 0), (changed[1], 1)]), [changed[1]])
+        self.assertIs(self.repo.identity_map.get(entities[0].id), changed[0])
+        self.assertNotIn(entities[1].id, self.repo.identity_map)
+        self.assertIs(self.repo.find_by_id(entities[1].id), entities[1])
+
+    def test_bulk_update_fields_refreshes_the_stored_entries(self):
+        entities = [StubEntity(name=str(i)) for i in range(2)]
+        for entity in entities:
+            self.repo.insert(entity)
+        changed = [entity.copy() for entity in entities]
+
+        self.assertEqual(
+            self.repo.bulk_update_fields([(changed[0], {}, 0), (changed[1], {}, 1)]), [changed[1]])
+        self.assertIs(self.repo.identity_map.get(entities[0].id), changed[0])
+        self.assertNotIn(entities[1].id, self.repo.identity_map)
+
+    def test_concurrent_misses_share_one_load(self):
+        entity = StubEntity(name='test')
+        self.inner.insert(entity)
+        release = threading.Event()
+        calls = []
+
+        def slow_find_by_id(entity_id):
+            calls.append(entity_id)
+            release.wait(5)
+            return entity
+
+        results = []
+        with patch.object(self.inner, 'find_by_id', side_effect=slow_find_by_id):
+            threads = [
+                threading.Thread(target=lambda: results.append(self.repo.find_by_id(entity.id)))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            while self.repo.stats.coalesced < 7:
+                threading.Event().wait(0.001)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(calls, [entity.id])
+        self.assertEqual(results, [entity] * 8)
+        self.assertIn(entity.id, self.repo.identity_map)
+
+    def test_load_in_flight_during_a_write_is_not_stored(self):
+        entity = StubEntity(name='test')
+        self.inner.insert(entity)
+        updated = StubEntity(unique_entity_id=entity.unique_entity_id, name='updated')
+
+        def find_by_id_racing_update(entity_id):
+            self.repo.update(updated)
+            return entity
+
+        with patch.object(self.inner, 'find_by_id', side_effect=find_by_id_racing_update):
+            self.assertIs(self.repo.find_by_id(entity.id), entity)
+        self.assertIs(self.repo.find_by_id(entity.id), updated)
+
+    def test_search_pages_are_cached_until_a_write(self):
+        entities = [StubEntity(name=f'test {i}') for i in range(3)]
+        self.inner.bulk_insert(entities)
+        with patch.object(self.inner, 'search', wraps=self.inner.search) as search:
+            first = self.repo.search(SearchParams(per_page=2, sort='name', filter='test'))
+            second = self.repo.search(
+                SearchParams(page='1', per_page=2, sort='name', sort_dir='ASC', filter='test'))
+            self.assertEqual(search.call_count, 1)
+            self.assertEqual(second, first)
+            self.assertIs(second.items[0], entities[0])
+            self.assertEqual(self.repo.page_stats, CacheStats(hits=1, misses=1))
+
+            self.repo.update(
+                StubEntity(unique_entity_id=entities[0].unique_entity_id, name='renamed'))
+            third = self.repo.search(SearchParams(per_page=2, sort='name', filter='test'))
+            self.assertEqual(search.call_count, 2)
+            self.assertEqual(third.items, entities[1:])
+            self.assertEqual(self.repo.page_stats, CacheStats(hits=1, misses=2, stale=1))
+
+    def test_cached_page_loads_evicted_items_through_find_by_id(self):
+        entities = [StubEntity(name=f'test {i}') for i in range(3)]
+        self.inner.bulk_insert(entities)
+        self.repo.search(SearchParams())
+        self.repo.identity_map.clear()
+        with patch.object(self.inner, 'find_by_id', wraps=self.inner.find_by_id) as find_by_id:
+            self.assertEqual(self.repo.search(SearchParams()).items, entities)
+        self.assertEqual(find_by_id.call_count, 3)
+
+        self.inner.delete(entities[0].id)
+        self.repo.identity_map.clear()
+        self.assertEqual(self.repo.search(SearchParams()).items, entities[1:])
+
+    def test_search_in_flight_during_a_write_is_not_stored(self):
+        entity = StubEntity(name='test')
+        search = self.inner.search
+
+        def search_racing_insert(input_params):
+            result = search(input_params)
+            self.repo.insert(entity)
+            return result
+
+        with patch.object(self.inner, 'search', side_effect=search_racing_insert):
+            self.assertEqual(self.repo.search(SearchParams()).items, [])
+        self.assertEqual(len(self.repo.pages), 0)
+        self.assertEqual(self.repo.search(SearchParams()).items, [entity])
+
+
+class TestAsyncCachedRepository(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.inner = AsyncInMemoryRepository(StubInMemorySearchableRepository())
+        self.repo = AsyncCachedRepository(self.inner, max_entries=10)
+
+    async def test_concurrent_misses_share_one_load(self):
+        entity = StubEntity(name='test')
+        await self.inner.insert(entity)
+        with patch.object(self.inner, 'find_by_id', wraps=self.inner.find_by_id) as find_by_id:
+            results = await asyncio.gather(*(self.repo.find_by_id(entity.id) for _ in range(8)))
+            self.assertIs(await self.repo.find_by_id(entity.id), entity)
+        find_by_id.assert_called_once_with(entity.id)
+        self.assertEqual(results, [entity] * 8)
+        self.assertEqual(self.repo.stats, CacheStats(hits=1, misses=8, coalesced=7))
+
+    async def test_cancelling_a_waiter_does_not_cancel_the_load(self):
+        entity = StubEntity(name='test')
+        await self.inner.insert(entity)
+        first = asyncio.ensure_future(self.repo.find_by_id(entity.id))
+        second = asyncio.ensure_future(self.repo.find_by_id(entity.id))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertIs(await second, entity)
+        self.assertIn(entity.id, self.repo.identity_map)
+
+    async def test_failed_load_is_not_stored(self):
+        results = await asyncio.gather(
+            *(self.repo.find_by_id('fake id') for _ in range(2)), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, NotFoundException) for result in results))
+        self.assertNotIn('fake id', self.repo.identity_map)
+
+    async def test_writes_refresh_or_drop_the_entry(self):
+        entity = StubEntity(name='test')
+        await self.repo.insert(entity)
+        updated = StubEntity(unique_entity_id=entity.unique_entity_id, name='updated')
+        await self.repo.update(updated)
+        self.assertIs(await self.repo.find_by_id(entity.id), updated)
+        self.assertEqual((await self.repo.search(SearchParams(filter='upd'))).items, [updated])
+
+        await self.repo.delete(entity.id)
+        self.assertNotIn(entity.id, self.repo.identity_map)
+        with self.assertRaises(NotFoundException):
+            await self.repo.update(updated)
+
+        entities = [StubEntity(name=str(i)) for i in range(3)]
+        await self.repo.bulk_insert(entities)
+        self.assertEqual(await self.repo.find_all(), entities)
+        self.assertEqual(len(self.repo.identity_map), 0)
+
+    async def test_search_pages_are_cached_until_a_write(self):
+        entities = [StubEntity(name=f'test {i}') for i in range(3)]
+        await self.inner.bulk_insert(entities)
+        with patch.object(self.inner, 'search', wraps=self.inner.search) as search:
+            first = await self.repo.search(SearchParams(per_page=2))
+            self.assertEqual(await self.repo.search(SearchParams(per_page=2)), first)
+            self.assertEqual(search.call_count, 1)
+            self.repo.identity_map.clear()
+            self.assertEqual((await self.repo.search(SearchParams(per_page=2))).items, entities[:2])
+
+            await self.repo.delete(entities[0].id)
+            self.assertEqual((await self.repo.search(SearchParams(per_page=2))).items, entities[1:])
+            self.assertEqual(search.call_count, 2)
+        self.assertEqual(self.repo.page_stats, CacheStats(hits=2, misses=2, stale=1))
@@ -0,0 +1,61 @@
+import asyncio
+from dataclasses import dataclass
+import unittest
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.repositories import AsyncInMemoryRepository, InMemoryRepository
+from __seedwork.infra.compaction import CompactionStats, Compactor
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+
+
+class StubInMemoryRepository(InMemoryRepository[StubEntity]):
+    pass
+
+
+class FailingRepository(StubInMemoryRepository):
+
+    def compact(self, budget: int = 1_000) -> bool:
+        raise RuntimeError('compaction failed')
+
+
+class TestCompactor(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.repo = StubInMemoryRepository()
+        entities = [StubEntity(name=str(number)) for number in range(10)]
+        self.repo.bulk_insert(entities)
+        for entity in entities[:7]:
+            self.repo.delete(entity.id)
+
+    async def test_purges_in_steps_then_idles(self):
+        async with Compactor(self.repo, budget=3, interval=0, idle_interval=60) as compactor:
+            for _ in range(20):
+                await asyncio.sleep(0)
+            self.assertEqual(len(self.repo.items), 3)
+            self.assertEqual(compactor.stats, CompactionStats(steps=3))
+
+    async def test_awaits_the_steps_of_an_async_repository(self):
+        repo = AsyncInMemoryRepository(self.repo)
+        async with Compactor(repo, budget=5, interval=0, idle_interval=60):
+            for _ in range(20):
+                await asyncio.sleep(0)
+        self.assertEqual(self.repo.tombstones, {})
+
+    async def test_keeps_running_after_a_failure(self):
+        async with Compactor(FailingRepository(), interval=0, idle_interval=0) as compactor:
+            for _ in range(5):
+                await asyncio.sleep(0)
+        self.assertGreater(compactor.stats.failures, 1)
+        self.assertIsInstance(compactor.last_error, RuntimeError)
+
+    async def test_rejects_bad_budget_and_second_start(self):
+        with self.assertRaises(ValueError):
+            Compactor(self.repo, budget=0)
+        compactor = Compactor(self.repo)
+        compactor.start()
+        with self.assertRaises(RuntimeError):
+            compactor.start()
+        await compactor.close()
@@ -0,0 +1,112 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List
+import unittest
+from __seedwork.domain.events import DomainEvent, EventPublisher
+from __seedwork.infra.events import InProcessEventBus, OutboxDispatcher, OutboxStats
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEvent(DomainEvent):
+    number: int = 0
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class OtherStubEvent(DomainEvent):
+    pass
+
+
+def events(*numbers: int) -> List[StubEvent]:
+    return [StubEvent(aggregate_id='id', number=number) for number in numbers]
+
+
+class RecordingPublisher(EventPublisher):
+
+    def __init__(self, failures: int = 0) -> None:
+        self.batches: List[List[int]] = []
+        self.failures = failures
+
+    async def publish(self, events: List[DomainEvent]) -> None:
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError('broker is down')
+        self.batches.append([event.number for event in events])
+
+
+class TestInProcessEventBus(unittest.IsolatedAsyncioTestCase):
+
+    async def test_delivers_to_the_handlers_of_the_event_classes(self):
+        bus = InProcessEventBus()
+        received = []
+        bus.subscribe(DomainEvent, lambda event: received.append(('all', event.event_name)))
+
+        async def on_stub(event):
+            received.append(('stub', event.number))
+        bus.subscribe(StubEvent, on_stub)
+
+        await bus.publish([*events(1), OtherStubEvent(aggregate_id='id'), *events(2)])
+        self.assertEqual(received, [
+            ('all', 'StubEvent'), ('stub', 1), ('all', 'OtherStubEvent'), ('all', 'StubEvent'),
+            ('stub', 2)
+        ])
+
+
+class TestOutboxDispatcher(unittest.IsolatedAsyncioTestCase):
+
+    async def test_publishes_full_batches_right_away(self):
+        publisher = RecordingPublisher()
+        outbox = OutboxDispatcher(publisher, max_batch=3, max_delay=60)
+        outbox.add(events(1, 2))
+        outbox.add(events(3, 4))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        self.assertEqual(publisher.batches, [[1, 2, 3], [4]])
+        await outbox.close()
+
+    async def test_publishes_after_the_time_window(self):
+        publisher = RecordingPublisher()
+        outbox = OutboxDispatcher(publisher, max_batch=100, max_delay=0.01)
+        outbox.add(events(1))
+        outbox.add(events(2))
+        self.assertEqual(len(outbox), 2)
+        await asyncio.sleep(0)
+        self.assertEqual(publisher.batches, [])
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(publisher.batches, [[1, 2]])
+        outbox.add(events(3))
+        await asyncio.sleep(0.05)
+        self.assertEqual(publisher.batches, [[1, 2], [3]])
+        self.assertEqual(outbox.stats, OutboxStats(published=3, batches=2))
+        await outbox.close()
+
+    async def test_retries_failed_batches_in_order(self):
+        publisher = RecordingPublisher(failures=2)
+        outbox = OutboxDispatcher(publisher, max_batch=2, max_delay=0.01)
+        outbox.add(events(1, 2, 3))
+        await asyncio.sleep(0.1)
+        self.assertEqual(publisher.batches, [[1, 2], [3]])
+        self.assertEqual(outbox.stats, OutboxStats(published=3, batches=2, failures=2))
+        self.assertIsInstance(outbox.last_error, ConnectionError)
+        await outbox.close()
+
+    async def test_close_publishes_what_is_left(self):
+        publisher = RecordingPublisher()
+        async with OutboxDispatcher(publisher, max_batch=100, max_delay=60) as outbox:
+            outbox.add(events(1, 2))
+            outbox.add([])
+        self.assertEqual(publisher.batches, [[1, 2]])
+        with self.assertRaises(RuntimeError):
+            outbox.add(events(3))
+
+    async def test_close_keeps_the_events_when_the_publisher_fails(self):
+        outbox = OutboxDispatcher(RecordingPublisher(failures=1), max_delay=60)
+        outbox.add(events(1))
+        await outbox.close()
+        self.assertEqual(len(outbox), 1)
+        await OutboxDispatcher(RecordingPublisher()).close()
+
+    def test_validates_max_batch(self):
+        with self.assertRaises(ValueError):
+            OutboxDispatcher(RecordingPublisher(), max_batch=0)
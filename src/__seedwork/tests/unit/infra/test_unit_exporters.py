@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from datetime import datetime
+import io
+from typing import Optional
+import unittest
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.exporters import iter_csv_chunks, iter_json_lines_chunks, write_chunks
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubEntity(Entity):
+    name: str
+    is_active: bool = True
+    description: Optional[str] = None
+    created_at: datetime = datetime(2022, 6, 1, 12, 30)
+
+
+class FakeSocket:
+
+    def __init__(self) -> None:
+        self.sent = []
+
+    def sendall(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+class TestExporters(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.entities = [
+            StubEntity(
+                unique_entity_id=UniqueEntityId(f'08ff1b59-9257-4393-8ebb-1885fa2e486{i}'),
+                name=f'Ação {i}'
+            )
+            for i in range(5)
+        ]
+
+    def test_iter_json_lines_chunks(self):
+        chunks = list(iter_json_lines_chunks(self.entities, chunk_size=200))
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(all(chunk.endswith('\n') for chunk in chunks))
+        lines = ''.join(chunks).splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(
+            lines[0],
+            '{"name":"Ação 0","is_active":true,"description":null,'
+            '"created_at":"2022-06-01T12:30:00","id":"08ff1b59-9257-4393-8ebb-1885fa2e4860"}'
+        )
+        self.assertEqual(list(iter_json_lines_chunks([])), [])
+
+    def test_iter_csv_chunks(self):
+        entities = self.entities[:2] + [StubEntity(
+            unique_entity_id=self.entities[0].unique_entity_id,
+            name='with, "quotes"',
+            is_active=False,
+            description='some description'
+        )]
+        chunks = list(iter_csv_chunks(entities, chunk_size=100))
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(''.join(chunks), (
+            'name,is_active,description,created_at,id\n'
+            'Ação 0,true,,2022-06-01T12:30:00,08ff1b59-9257-4393-8ebb-1885fa2e4860\n'
+            'Ação 1,true,,2022-06-01T12:30:00,08ff1b59-9257-4393-8ebb-1885fa2e4861\n'
+            '"with, ""quotes""",false,some description,'
+            '2022-06-01T12:30:00,08ff1b59-9257-4393-8ebb-1885fa2e4860\n'
+        ))
+        self.assertEqual(list(iter_csv_chunks([])), [])
+
+    def test_write_chunks(self):
+        text, binary, socket = io.StringIO(), io.BytesIO(), FakeSocket()
+        for target in [text, binary, socket]:
+            write_chunks(iter(['Ação\n', 'b\n']), target)
+        self.assertEqual(text.getvalue(), 'Ação\nb\n')
+        self.assertEqual(binary.getvalue(), 'Ação\nb\n'.encode())
+        self.assertEqual(socket.sent, ['Ação\n'.encode(), b'b\n'])
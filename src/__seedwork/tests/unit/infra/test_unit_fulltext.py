@@ -0,0 +1,124 @@
+import math
+import random
+import unittest
+from __seedwork.infra.fulltext import FullTextIndex, fold_tokens
+
+
+def brute_force(documents, query, limit, prefix):
+    """BM25 over every document, the way FullTextIndex.search is specified."""
+    words = list(dict.fromkeys(fold_tokens(query)))
+    n = len(documents)
+    avgdl = sum(map(len, documents.values())) / n
+    terms = {token for tokens in documents.values() for token in tokens}
+    slots = [[word] for word in words[:-1]]
+    if prefix:
+        slots.append(sorted(term for term in terms if term.startswith(words[-1]))[:50])
+    else:
+        slots.append([words[-1]])
+    df = {term: sum(1 for tokens in documents.values() if term in tokens) for term in terms}
+    scores = []
+    for tokens in documents.values():
+        total, matched = 0.0, False
+        for slot in slots:
+            best = 0.0
+            for term in slot:
+                tf = tokens.count(term)
+                if tf:
+                    matched = True
+                    idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+                    norm = 1.2 * (0.25 + 0.75 * len(tokens) / avgdl)
+                    best = max(best, idf * tf * 2.2 / (tf + norm))
+            total += best
+        if matched:
+            scores.append(total)
+    return sorted(scores, reverse=True)[:limit]
+
+
+class TestFoldTokens(unittest.TestCase):
+
+    def test_folds_case_and_accents(self):
+        self.assertEqual(fold_tokens('Ação, AÇÃO e Comédia'), ['acao', 'acao', 'e', 'comedia'])
+        self.assertEqual(fold_tokens(''), [])
+
+
+class TestFullTextIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.index = FullTextIndex()
+        self.index.extend([
+            ('1', [('Ação', 2), ('Filmes de ação e aventura', 1)]),
+            ('2', [('Drama', 2), ('Dramas e romances', 1)]),
+            ('3', [('Comédia romântica', 2), ('', 1)]),
+            ('4', [('Documentários', 2), ('Documentários sobre a natureza e a ação humana', 1)]),
+        ])
+
+    def test_ranks_with_bm25(self):
+        results = self.index.search('acao')
+        self.assertEqual([doc_id for doc_id, _ in results], ['1', '4'])
+        self.assertGreater(results[0][1], results[1][1])
+        self.assertEqual(self.index.search('ACAO'), self.index.search('ação'))
+        self.assertEqual({doc_id for doc_id, _ in self.index.search('romantica drama')}, {'2', '3'})
+        self.assertEqual(self.index.search('acao', limit=1), results[:1])
+        self.assertEqual(self.index.search('western'), [])
+        self.assertEqual(self.index.search('...'), [])
+
+    def test_prefix_queries(self):
+        self.assertEqual(self.index.search('doc'), [])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search('doc', prefix=True)], ['4'])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search('rom', prefix=True)],
+                         ['3', '2'])
+        self.assertEqual({doc_id for doc_id, _ in self.index.search('d', prefix=True, limit=10)},
+                         {'2', '4'})
+
+    def test_ignores_stopwords(self):
+        self.assertEqual(self.index.search('de e a'), [])
+        self.assertEqual(self.index.search('filmes de acao'), self.index.search('filmes acao'))
+        # while typing, the last word may still grow into another one
+        self.assertEqual([doc_id for doc_id, _ in self.index.search('filmes de', prefix=True)],
+                         ['1'])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search('do', prefix=True)], ['4'])
+
+        index = FullTextIndex(stopwords=frozenset())
+        index.add('1', [('Filmes de ação', 1)])
+        self.assertEqual([doc_id for doc_id, _ in index.search('de')], ['1'])
+
+    def test_updates_and_removes_documents(self):
+        self.index.add('1', [('Western', 2)])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search('acao')], ['4'])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search('western')], ['1'])
+
+        self.index.remove('4')
+        self.index.remove('unknown')
+        self.assertEqual(self.index.search('acao'), [])
+        self.assertEqual(self.index.search('natu', prefix=True), [])
+        self.assertEqual((len(self.index), '4' in self.index), (3, False))
+
+        self.index.add('5', [('Ação', 2)])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search('acao')], ['5'])
+
+    def test_matches_brute_force_bm25_through_changes(self):
+        rng = random.Random(7)
+        words = ['ação', 'acao', 'drama', 'comédia', 'kids', 'terror', 'série', 'serie']
+        words += [f'w{i}' for i in range(30)]
+        for group_threshold in (512, 4):
+            index, documents = FullTextIndex(group_threshold=group_threshold), {}
+            for step in range(1_500):
+                doc_id = str(rng.randrange(150))
+                if rng.random() < 0.75:
+                    text = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+                    index.add(doc_id, [(text, 2)])
+                    documents[doc_id] = fold_tokens(text) * 2
+                else:
+                    index.remove(doc_id)
+                    documents.pop(doc_id, None)
+                if step % 100 == 99:
+                    queries = [
+                        ('ação drama', False), ('se', True), ('w1 kids', True), ('terror', False)
+                    ]
+                    for query, prefix in queries:
+                        results = index.search(query, limit=7, prefix=prefix)
+                        self.assertEqual(len({doc_id for doc_id, _ in results}), len(results))
+                        self.assertEqual(
+                            [round(score, 9) for _, score in results],
+                            [round(score, 9) for score in brute_force(documents, query, 7, prefix)]
+                        )
@@ -0,0 +1,104 @@
+import unittest
+from __seedwork.infra.indexes import Bitmap, SortedIndex, TokenIndex, tokenize
+
+
+class TestTokenize(unittest.TestCase):
+
+    def test_casefolds_and_splits_words(self):
+        self.assertEqual(tokenize('Science-Fiction Movies'), {'science', 'fiction', 'movies'})
+        self.assertEqual(tokenize('STRASSE straße'), {'strasse'})
+        self.assertEqual(tokenize('!!!'), set())
+
+
+class TestSortedIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.index = SortedIndex()
+        for key, entity_id in [('b', '2'), ('a', '1'), ('c', '3'), ('b', '0')]:
+            self.index.add(key, entity_id)
+
+    def test_keeps_entries_sorted_with_id_as_tie_breaker(self):
+        self.assertEqual(list(self.index.ids()), ['1', '0', '2', '3'])
+        self.assertEqual(list(self.index.ids(reverse=True)), ['3', '2', '0', '1'])
+        self.assertEqual(len(self.index), 4)
+
+    def test_slice(self):
+        self.assertEqual(self.index.slice(0, 2), ['1', '0'])
+        self.assertEqual(self.index.slice(2, 10), ['2', '3'])
+        self.assertEqual(self.index.slice(0, 2, reverse=True), ['3', '2'])
+        self.assertEqual(self.index.slice(2, 4, reverse=True), ['0', '1'])
+        self.assertEqual(self.index.slice(3, 6, reverse=True), ['1'])
+        self.assertEqual(self.index.slice(4, 6, reverse=True), [])
+
+    def test_slice_and_ids_after_an_entry(self):
+        self.assertEqual(self.index.slice(0, 2, after=('a', '1')), ['0', '2'])
+        self.assertEqual(self.index.slice(1, 5, after=('b', '1')), ['3'])
+        self.assertEqual(self.index.slice(0, 2, reverse=True, after=('b', '2')), ['0', '1'])
+        self.assertEqual(self.index.slice(0, 2, reverse=True, after=('a', '1')), [])
+        self.assertEqual(list(self.index.ids(after=('b', '0'))), ['2', '3'])
+        self.assertEqual(list(self.index.ids(reverse=True, after=('b', '5'))), ['2', '0', '1'])
+
+    def test_remove(self):
+        self.index.remove('b', '0')
+        self.index.remove('b', 'not indexed')
+        self.assertEqual(list(self.index.ids()), ['1', '2', '3'])
+
+    def test_purge_in_chunks(self):
+        self.assertEqual(self.index.purge({'1', '0', '3'}, limit=2), ('b', '2'))
+        self.assertEqual(list(self.index.ids()), ['2', '3'])
+        # entries added before the resume entry are past the pass
+        self.index.add('a', '0')
+        self.assertIsNone(self.index.purge({'0', '3'}, start=('b', '2'), limit=2))
+        self.assertEqual(list(self.index.ids()), ['0', '2'])
+
+    def test_extend(self):
+        self.index.extend([('a', '5'), ('z', '4')])
+        self.assertEqual(list(self.index.ids()), ['1', '5', '0', '2', '3', '4'])
+
+    def test_prefix_range(self):
+        index = SortedIndex()
+        index.extend([('movie', '1'), ('mov', '2'), ('music', '3'), ('mo', '4')])
+        start, stop = index.prefix_range('mov')
+        self.assertEqual(set(index.ids_in_range(start, stop)), {'1', '2'})
+        self.assertEqual(index.prefix_range('x'), (4, 4))
+
+        index.extend((f'w{number:05d}', str(number)) for number in range(10_000))
+        start, stop = index.prefix_range('w0999')
+        self.assertEqual(stop - start, 10)
+        self.assertEqual(list(index.ids_in_range(start, stop)), [str(n) for n in range(9990, 10_000)])
+
+
+class TestTokenIndex(unittest.TestCase):
+
+    def test_match_every_prefix(self):
+        index = TokenIndex()
+        index.add(tokenize('Action Movies'), '1')
+        index.add(tokenize('Action Series'), '2')
+        index.add(tokenize('Documentary'), '3')
+
+        self.assertEqual(index.match(['act']), {'1', '2'})
+        self.assertEqual(index.match(['act', 'mov']), {'1'})
+        self.assertEqual(index.match(['doc', 'mov']), set())
+        self.assertEqual(index.match([]), set())
+
+        index.remove(tokenize('Action Movies'), '1')
+        self.assertEqual(index.match(['act']), {'2'})
+
+
+class TestBitmap(unittest.TestCase):
+
+    def test_set_get_and_count(self):
+        bitmap = Bitmap()
+        self.assertFalse(bitmap[100])
+        bitmap[3] = True
+        bitmap[100] = True
+        bitmap[100] = True
+        self.assertTrue(bitmap[3])
+        self.assertTrue(bitmap[100])
+        self.assertFalse(bitmap[4])
+        self.assertEqual(bitmap.count(), 2)
+
+        bitmap[3] = False
+        bitmap[5] = False
+        self.assertFalse(bitmap[3])
+        self.assertEqual(bitmap.count(), 1)
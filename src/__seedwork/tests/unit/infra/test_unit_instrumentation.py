@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from itertools import count
+from typing import ClassVar, Optional
+import unittest
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import EntityValidationException
+from __seedwork.domain.validators import ValidationPlan, compile_rules
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.instrumentation import (
+    LATENCY_BOUNDS,
+    InMemoryMetricsSink,
+    Instrumentation,
+    OperationStats
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    description: Optional[str] = None
+
+    rules: ClassVar[ValidationPlan] = compile_rules(
+        {'name': 'required|max_length:5', 'description': 'string'})
+
+    def __post_init__(self):
+        self.validate(self.name, self.description)
+
+    @classmethod
+    def validate(cls, name: str, description: Optional[str]) -> None:
+        errors = cls.rules.check(name, description)
+        if errors:
+            raise EntityValidationException(errors)
+
+
+class TestOperationStats(unittest.TestCase):
+
+    def test_histogram(self):
+        stats = OperationStats()
+        for seconds in [0.5e-6, 3e-6, 3e-6, 10.0]:
+            stats.observe(seconds)
+        self.assertEqual((stats.calls, sum(stats.buckets)), (4, 4))
+        self.assertEqual(stats.percentile(0.5), LATENCY_BOUNDS[2])
+        self.assertEqual(stats.percentile(0.25), LATENCY_BOUNDS[0])
+        self.assertEqual(stats.percentile(1.0), float('inf'))
+        self.assertEqual(OperationStats().percentile(0.5), 0.0)
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        ticks = count()
+        self.sink = InMemoryMetricsSink()
+        # every clock reading is 1 us after the previous one
+        self.instrumentation = Instrumentation(self.sink, clock=lambda: next(ticks) * 1e-6)
+
+    def tearDown(self) -> None:
+        self.instrumentation.disable()
+
+    def test_swaps_the_methods_only_while_enabled(self):
+        originals = (StubEntity.__dict__['__init__'], StubEntity.__dict__['validate'],
+                     UniqueEntityId.__dict__['__post_init__'])
+        self.assertNotIn('to_dict', StubEntity.__dict__)
+
+        self.instrumentation.enable(StubEntity)
+        self.assertTrue(self.instrumentation.enabled)
+        self.assertIsNot(StubEntity.__dict__['__init__'], originals[0])
+        with self.assertRaises(RuntimeError):
+            self.instrumentation.enable(StubEntity)
+        with self.assertRaises(TypeError):
+            Instrumentation(self.sink).enable(int)
+
+        self.instrumentation.disable()
+        self.assertFalse(self.instrumentation.enabled)
+        self.assertEqual((StubEntity.__dict__['__init__'], StubEntity.__dict__['validate'],
+                          UniqueEntityId.__dict__['__post_init__']), originals)
+        self.assertNotIn('to_dict', StubEntity.__dict__)
+
+    def test_counts_and_times_the_operations(self):
+        with self.instrumentation.enable(StubEntity):
+            entity = StubEntity(unique_entity_id=UniqueEntityId(), name='Movie')
+            self.assertEqual(entity.to_dict()['name'], 'Movie')
+            StubEntity.construct(name='Movie', unique_entity_id=UniqueEntityId())
+            with self.assertRaises(EntityValidationException):
+                StubEntity(name='')
+            with self.assertRaises(EntityValidationException):
+                StubEntity(name='Movies', description=5)
+
+        (snapshot,) = self.sink.snapshots
+        operations = snapshot.operations
+        self.assertEqual({key: (stats.calls, stats.errors) for key, stats in operations.items()}, {
+            ('UniqueEntityId', 'post_init'): (4, 0),
+            ('StubEntity', 'init'): (4, 2),
+            ('StubEntity', 'validate'): (4, 2),
+            ('StubEntity', 'to_dict'): (1, 0),
+        })
+        self.assertAlmostEqual(operations['StubEntity', 'to_dict'].total_seconds, 1e-6)
+        self.assertEqual(snapshot.validation_failures, {
+            ('StubEntity', 'name', 'required'): 1,
+            ('StubEntity', 'name', 'max_length'): 1,
+            ('StubEntity', 'description', 'string'): 1,
+        })
+
+    def test_flush_starts_over(self):
+        self.instrumentation.enable(StubEntity)
+        StubEntity(name='Movie')
+        before = self.instrumentation.snapshot()
+        StubEntity(name='Movie')
+        self.assertEqual(before.operations['StubEntity', 'init'].calls, 1)
+
+        self.instrumentation.flush()
+        self.instrumentation.flush()
+        self.assertEqual(self.sink.snapshots[0].operations['StubEntity', 'init'].calls, 2)
+        self.assertEqual(self.sink.snapshots[1].operations, {})
@@ -0,0 +1,20 @@
+from datetime import datetime, timedelta, timezone
+import unittest
+from __seedwork.infra.sqlite import connect, from_epoch_micros, to_epoch_micros
+
+
+class TestSqlite(unittest.TestCase):
+
+    def test_connect(self):
+        connection = connect()
+        self.assertEqual(connection.execute('PRAGMA synchronous').fetchone(), (1,))
+        self.assertEqual(connection.execute('SELECT 1').fetchone(), (1,))
+
+    def test_epoch_micros(self):
+        value = datetime(2022, 6, 1, 10, 30, 15, 123456)
+        self.assertEqual(to_epoch_micros(datetime(1970, 1, 1)), 0)
+        self.assertEqual(from_epoch_micros(to_epoch_micros(value)), value)
+        self.assertLess(to_epoch_micros(value), to_epoch_micros(value + timedelta(microseconds=1)))
+
+        aware = datetime(2022, 6, 1, 12, 30, 15, 123456, tzinfo=timezone(timedelta(hours=2)))
+        self.assertEqual(to_epoch_micros(aware), to_epoch_micros(value))
@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from __seedwork.application.dto import PaginationOutput, PaginationOutputMapper, SearchInput
+from __seedwork.application.use_cases import UseCase
+from __seedwork.domain.events import EventOutbox
+from category.application.dto import CategoryOutput, CategoryOutputMapper
+from category.domain.entities import Category
+from category.domain.repositories import CategoryAsyncRepository, CategoryFilter
+
+
+@dataclass(slots=True, frozen=True)
+class CreateCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+    outbox: Optional[EventOutbox] = None
+
+    async def execute(self, input_param: 'CreateCategoryUseCase.Input') -> CategoryOutput:
+        category = Category.create(
+            name=input_param.name,
+            description=input_param.description,
+            is_active=input_param.is_active
+        )
+        await self.category_repo.insert(category)
+        _dispatch_events(self.outbox, category)
+        return CategoryOutputMapper.to_output(category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        name: str
+        description: Optional[str] = None
+        is_active: Optional[bool] = True
+
+
+@dataclass(slots=True, frozen=True)
+class GetCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+
+    async def execute(self, input_param: 'GetCategoryUseCase.Input') -> CategoryOutput:
+        category = await self.category_repo.find_by_id(input_param.id)
+        return CategoryOutputMapper.to_output(category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str
+
+
+@dataclass(slots=True, frozen=True)
+class ListCategoriesUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+
+    async def execute(
+        self, input_param: 'ListCategoriesUseCase.Input'
+    ) -> PaginationOutput[CategoryOutput]:
+        search_params = self.category_repo.SearchParams(
+            page=input_param.page,
+            per_page=input_param.per_page,
+            sort=input_param.sort,
+            sort_dir=input_param.sort_dir,
+            filter=input_param.filter,
+            cursor=input_param.cursor
+        )
+        result = await self.category_repo.search(search_params)
+        items = [CategoryOutputMapper.to_output(category) for category in result.items]
+        return PaginationOutputMapper.to_output(items, result, result.next_cursor)
+
+    @dataclass(slots=True, frozen=True)
+    class Input(SearchInput[CategoryFilter | str]):
+        # next_cursor of the previous page; seeks instead of skipping `page - 1` pages
+        cursor: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class UpdateCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+    outbox: Optional[EventOutbox] = None
+
+    async def execute(self, input_param: 'UpdateCategoryUseCase.Input') -> CategoryOutput:
+        category = await _find_copy(self.category_repo, input_param.id)
+        version = category.version
+        category.update(input_param.name, input_param.description)
+        if input_param.is_active is True:
+            category.activate()
+        elif input_param.is_active is False:
+            category.deactivate()
+        # nothing to write when the category already was that way
+        if category.version != version:
+            await self.category_repo.update(category, expected_version=version)
+        _dispatch_events(self.outbox, category)
+        return CategoryOutputMapper.to_output(category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str
+        name: str
+        description: Optional[str] = None
+        is_active: Optional[bool] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ActivateCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+    outbox: Optional[EventOutbox] = None
+
+    async def execute(self, input_param: 'ActivateCategoryUseCase.Input') -> CategoryOutput:
+        category = await _find_copy(self.category_repo, input_param.id)
+        version = category.version
+        category.activate()
+        if category.version != version:
+            await self.category_repo.update(category, expected_version=version)
+        _dispatch_events(self.outbox, category)
+        return CategoryOutputMapper.to_output(category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str
+
+
+@dataclass(slots=True, frozen=True)
+class DeactivateCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+    outbox: Optional[EventOutbox] = None
+
+    async def execute(self, input_param: 'DeactivateCategoryUseCase.Input') -> CategoryOutput:
+        category = await _find_copy(self.category_repo, input_param.id)
+        version = category.version
+        category.deactivate()
+        if category.version != version:
+            await self.category_repo.update(category, expected_version=version)
+        _dispatch_events(self.outbox, category)
+        return CategoryOutputMapper.to_output(category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str
+
+
+@dataclass(slots=True, frozen=True)
+class DeleteCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+    outbox: Optional[EventOutbox] = None
+
+    async def execute(self, input_param: 'DeleteCategoryUseCase.Input') -> None:
+        category = await _find_copy(self.category_repo, input_param.id)
+        version = category.version
+        category.delete()
+        await self.category_repo.update(category, expected_version=version)
+        _dispatch_events(self.outbox, category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str
+
+
+async def _find_copy(category_repo: CategoryAsyncRepository, category_id: str) -> Category:
+    # repositories may hand out the instance they keep, which only a successful update may change
+    return (await category_repo.find_by_id(category_id)).copy()
+
+
+def _dispatch_events(outbox: Optional[EventOutbox], category: Category) -> None:
+    # pulled even without an outbox, so entities kept by a repository do not pile them up
+    events = category.pull_events()
+    if outbox is not None and events:
+        outbox.add(events)
@@ -1,45 +1,205 @@
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional
-from __seedwork.domain.entities import Entity
-from __seedwork.domain.validators import ValidatorRules
+from itertools import repeat
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Sequence
+from __seedwork.domain.entities import AggregateRoot
+from __seedwork.domain.exceptions import (
+    BatchValidationException,
+    EntityValidationException,
+    InvalidUuidException
+)
+from __seedwork.domain.validators import ValidationPlan, compile_rules
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.events import (
+    CategoryActivated,
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryDeleted,
+    CategoryUpdated
+)
+
+
+_new = object.__new__
+_setattr = object.__setattr__
+_now = datetime.now
+
 
 @dataclass(kw_only=True, frozen=True, slots=True)
-class Category(Entity):
+class Category(AggregateRoot):
 
+    unique_entity_id: UniqueEntityId = field(default_factory=UniqueEntityId)
     name: str
     description: Optional[str] = None
     is_active: Optional[bool] = True
-    created_at: Optional[datetime] = field(default_factory=lambda: datetime.now())
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
 
-    def __new__(cls, **kwargs):
-        cls.validate(
-            name=kwargs.get('name'),
-            description=kwargs.get('description'),
-            is_active=kwargs.get('is_active')
-        )
-        return super(Category, cls).__new__(cls)
+    rules: ClassVar[ValidationPlan] = compile_rules({
+        'name': 'required|string|max_length:255',
+        'description': 'string',
+        'is_active': 'boolean',
+    })
+    # what makes the id of a category built without one; a subclass sets
+    # UniqueEntityId.time_ordered for version 7 ids
+    _new_id: ClassVar[Callable[[], UniqueEntityId]] = UniqueEntityId
+
+    # written out instead of generated by dataclass: the arguments are
+    # validated once and the defaults filled in without default factory calls
+    def __init__(
+        self,
+        *,
+        unique_entity_id: Optional[UniqueEntityId] = None,
+        name: str = None,
+        description: Optional[str] = None,
+        is_active: Optional[bool] = True,
+        created_at: Optional[datetime] = None
+    ) -> None:
+        self.validate(name, description, is_active)
+        _setattr(self, 'unique_entity_id', unique_entity_id or self._new_id())
+        _setattr(self, 'name', name)
+        _setattr(self, 'description', description)
+        _setattr(self, 'is_active', is_active)
+        _setattr(self, 'created_at', _now() if created_at is None else created_at)
+
+    @classmethod
+    def construct(
+        cls,
+        *,
+        unique_entity_id: Optional[UniqueEntityId] = None,
+        name: str = None,
+        description: Optional[str] = None,
+        is_active: Optional[bool] = True,
+        created_at: Optional[datetime] = None,
+        version: int = 0
+    ) -> 'Category':
+        category = _new(cls)
+        _setattr(category, 'unique_entity_id', unique_entity_id or cls._new_id())
+        _setattr(category, 'name', name)
+        _setattr(category, 'description', description)
+        _setattr(category, 'is_active', is_active)
+        _setattr(category, 'created_at', _now() if created_at is None else created_at)
+        if version:
+            _setattr(category, '_version', version)
+        return category
 
+    @classmethod
+    def create(
+        cls, name: str, description: Optional[str] = None, is_active: Optional[bool] = True
+    ) -> 'Category':
+        """A new category, recording CategoryCreated; the constructor alone records nothing."""
+        category = cls(name=name, description=description, is_active=is_active)
+        category.record_event(CategoryCreated(
+            aggregate_id=category.id,
+            occurred_at=category.created_at,
+            name=name,
+            description=description,
+            is_active=is_active
+        ))
+        return category
 
     def update(self, name: str, description: str):
         self.validate(name, description)
-        self._set('name', name)
-        self._set('description', description)
+        # | and not or: both fields are set
+        if self._set('name', name) | self._set('description', description):
+            self._bump_version()
+            self.record_event(
+                CategoryUpdated(aggregate_id=self.id, name=name, description=description))
         return f"Category name and description to {name} and {description} respectively"
 
     def activate(self):
-        self._set('is_active', True)
+        if self._set('is_active', True):
+            self._bump_version()
+            self.record_event(CategoryActivated(aggregate_id=self.id))
         return f"Category {self.name} has been activated"
 
     def deactivate(self):
-        self._set('is_active', False)
+        if self._set('is_active', False):
+            self._bump_version()
+            self.record_event(CategoryDeactivated(aggregate_id=self.id))
         return f"Category {self.name} has been deactivated"
 
+    def delete(self):
+        if self.deleted_at is None:
+            AggregateRoot.delete(self)
+            self.record_event(CategoryDeleted(aggregate_id=self.id, occurred_at=self.deleted_at))
+        return f"Category {self.name} has been deleted"
+
     @classmethod
     def validate(cls, name: str, description: str, is_active: bool = None):
-        ValidatorRules.values(name, "name").required().string().max_length(255)
-        ValidatorRules.values(description, "description").string()
-        ValidatorRules.values(is_active, "is_active").boolean()
+        errors = cls.rules.check(name, description, is_active)
+        if errors:
+            raise EntityValidationException(errors)
+
+    @classmethod
+    def bulk_create(
+        cls,
+        rows: Sequence[Dict[str, Any]] | Mapping[str, Sequence[Any]],
+        clock: Callable[[], datetime] = datetime.now,
+        validate: bool = True,
+        time_ordered: Optional[bool] = None
+    ) -> List['Category']:
+        """
+        Creates many categories from a list of dicts or from columns (a dict of
+        equally sized sequences, missing columns taking the field defaults).
+        Every row is validated first, one column at a time, and nothing is
+        created if any row is invalid; validate=False skips that for columns
+        already checked against cls.rules, given ids are always checked. Rows
+        without created_at share a single clock() reading. Rows without an id
+        get one of the kind the class makes, unless time_ordered says
+        otherwise.
+        """
+        columns = cls._columns(rows)
+        sizes = {len(column) for column in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError('All columns must have the same size')
+        size = sizes.pop() if sizes else 0
+
+        errors = cls.rules.check_columns(size, **columns) if validate else None
+        given_ids = columns.get('id') or ()
+        parsed_ids: List[Optional[UniqueEntityId]] = []
+        for row, entity_id in enumerate(given_ids):
+            try:
+                parsed_ids.append(UniqueEntityId(entity_id) if entity_id else None)
+            except InvalidUuidException as ex:
+                errors = errors or {}
+                errors.setdefault(row, {})['id'] = [str(ex)]
+        if errors:
+            raise BatchValidationException(dict(sorted(errors.items())))
+
+        missing_ids = parsed_ids.count(None) if given_ids else size
+        new_ids = iter(cls.generate_ids(missing_ids, time_ordered))
+        unique_entity_ids = [
+            unique_entity_id or next(new_ids) for unique_entity_id in parsed_ids
+        ] if given_ids else new_ids
 
+        created_at = clock()
+        construct = cls.construct
+        return [
+            construct(
+                unique_entity_id=unique_entity_id,
+                name=name,
+                description=description,
+                is_active=is_active,
+                created_at=row_created_at or created_at
+            )
+            for unique_entity_id, name, description, is_active, row_created_at in zip(
+                unique_entity_ids,
+                columns.get('name') or repeat(None, size),
+                columns.get('description') or repeat(None, size),
+                columns.get('is_active') or repeat(True, size),
+                columns.get('created_at') or repeat(None, size)
+            )
+        ]
 
-        
\ No newline at end of file
+    @staticmethod
+    def _columns(
+        rows: Sequence[Dict[str, Any]] | Mapping[str, Sequence[Any]]
+    ) -> Dict[str, Sequence[Any]]:
+        if isinstance(rows, Mapping):
+            return dict(rows)
+        return {
+            'id': [row.get('id') for row in rows],
+            'name': [row.get('name') for row in rows],
+            'description': [row.get('description') for row in rows],
+            'is_active': [row.get('is_active', True) for row in rows],
+            'created_at': [row.get('created_at') for row in rows],
+        }
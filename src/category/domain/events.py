@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from __seedwork.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryCreated(DomainEvent):
+    name: str
+    description: Optional[str] = None
+    is_active: Optional[bool] = True
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryUpdated(DomainEvent):
+    name: str
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryActivated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryDeactivated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryDeleted(DomainEvent):
+    pass
@@ -0,0 +1,102 @@
+from abc import ABC
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, Optional
+
+from __seedwork.domain.repositories import (
+    AsyncSearchableRepositoryInterface,
+    SearchableRepositoryInterface,
+    SearchParams as DefaultSearchParams,
+    SearchResult as DefaultSearchResult
+)
+from category.domain.entities import Category
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryFilter:
+    term: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class _SearchParams(DefaultSearchParams[CategoryFilter]):  # pylint: disable=too-few-public-methods
+    # keyset pagination: when set, the page starts right after the item the
+    # cursor was issued for and `page` is only echoed back
+    cursor: Optional[str] = None
+
+    def __post_init__(self):
+        DefaultSearchParams.__post_init__(self)
+        self.cursor = self.cursor or None
+
+    def _normalize_filter(self):
+        if isinstance(self.filter, CategoryFilter):
+            term = self.filter.term or None
+            if term is None and self.filter.is_active is None:
+                self.filter = None
+            elif term != self.filter.term:
+                self.filter = CategoryFilter(term=term, is_active=self.filter.is_active)
+            return
+        self.filter = None if self.filter == '' or self.filter is None \
+            else CategoryFilter(term=str(self.filter))
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+# pylint: disable-next=too-few-public-methods
+class _SearchResult(DefaultSearchResult[Category, CategoryFilter]):
+    next_cursor: Optional[str] = None
+
+    def to_dict(self):
+        return {**DefaultSearchResult.to_dict(self), 'next_cursor': self.next_cursor}
+
+
+class CategoryRepository(
+    SearchableRepositoryInterface[Category, _SearchParams, _SearchResult],
+    ABC
+):
+    sortable_fields = ['name', 'created_at']
+    SearchParams = _SearchParams
+    SearchResult = _SearchResult
+
+    def scan(
+        self,
+        per_page: int = 1_000,
+        sort: Optional[str] = None,
+        sort_dir: Optional[str] = None,
+        filter_param: Optional[CategoryFilter | str] = None
+    ) -> Iterator[Category]:
+        """Every category matching the filter, in search order, read lazily one page at a time."""
+        cursor = None
+        while True:
+            result = self.search(self.SearchParams(
+                per_page=per_page, sort=sort, sort_dir=sort_dir, filter=filter_param,
+                cursor=cursor))
+            yield from result.items
+            cursor = result.next_cursor
+            if cursor is None:
+                return
+
+
+class CategoryAsyncRepository(
+    AsyncSearchableRepositoryInterface[Category, _SearchParams, _SearchResult],
+    ABC
+):
+    sortable_fields = CategoryRepository.sortable_fields
+    SearchParams = _SearchParams
+    SearchResult = _SearchResult
+
+    async def scan(
+        self,
+        per_page: int = 1_000,
+        sort: Optional[str] = None,
+        sort_dir: Optional[str] = None,
+        filter_param: Optional[CategoryFilter | str] = None
+    ) -> AsyncIterator[Category]:
+        cursor = None
+        while True:
+            result = await self.search(self.SearchParams(
+                per_page=per_page, sort=sort, sort_dir=sort_dir, filter=filter_param,
+                cursor=cursor))
+            for category in result.items:
+                yield category
+            cursor = result.next_cursor
+            if cursor is None:
+                return
@@ -0,0 +1,39 @@
+from typing import Any, Dict, Mapping, Sequence
+
+from __seedwork.domain.validators import ErrorTable, ValidatorFieldsInterface
+from category.domain.entities import Category
+
+
+class CategoryValidator(ValidatorFieldsInterface[Dict[str, Any]]):
+    """
+    Checks category payloads against Category.rules without raising: every
+    invalid field of a payload is reported, each with the message of its
+    first failing rule, like Category.validate.
+    """
+
+    def validate(self, data: Mapping[str, Any]) -> bool:
+        """
+        Sets `errors` and returns False, or sets `validated_data` to the
+        category fields and returns True.
+        """
+        errors = Category.rules.check(
+            name=data.get('name'),
+            description=data.get('description'),
+            is_active=data.get('is_active', True)
+        )
+        self.errors = errors
+        self.validated_data = None if errors else {
+            'name': data.get('name'),
+            'description': data.get('description'),
+            'is_active': data.get('is_active', True),
+        }
+        return not errors
+
+    def validate_batch(self, payloads: Sequence[Mapping[str, Any]]) -> ErrorTable:
+        """The errors of many payloads, by their position, checked one column at a time."""
+        return ErrorTable.from_rows(Category.rules.check_columns(
+            len(payloads),
+            name=[payload.get('name') for payload in payloads],
+            description=[payload.get('description') for payload in payloads],
+            is_active=[payload.get('is_active', True) for payload in payloads],
+        ))
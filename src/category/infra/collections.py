@@ -0,0 +1,172 @@
+from array import array
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, overload
+
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.indexes import Bitmap, tokenize
+from __seedwork.infra.sqlite import from_epoch_micros, to_epoch_micros
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter
+
+
+_intern = sys.intern
+
+
+class CategoryCollection(Sequence[Category]):
+    """
+    Read-only columnar list of categories: ids packed as 16 bytes each,
+    created_at as int64 microseconds since the epoch (aware datetimes come back
+    as naive UTC), is_active as a bitmap with a second one marking None, and
+    interned names and descriptions.
+    Categories are only built when read; filter, sort and take work on the
+    columns and return new collections.
+    """
+
+    __slots__ = ('_ids', '_names', '_descriptions', '_active', '_unknown_active', '_created_at')
+
+    def __init__(self) -> None:
+        self._ids = bytearray()
+        self._names: List[str] = []
+        self._descriptions: List[Optional[str]] = []
+        self._active = Bitmap()
+        self._unknown_active = Bitmap()
+        self._created_at = array('q')
+
+    @classmethod
+    def from_categories(cls, categories: Iterable[Category]) -> 'CategoryCollection':
+        return cls.from_rows(
+            (
+                category.unique_entity_id.bytes,
+                category.name,
+                category.description,
+                category.is_active,
+                to_epoch_micros(category.created_at)
+            )
+            for category in categories
+        )
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Tuple[bytes, str, Optional[str], Any, int]]
+    ) -> 'CategoryCollection':
+        """
+        Builds a collection from (id bytes, name, description, is_active,
+        created_at micros) rows.
+        """
+        collection = cls()
+        ids, names, descriptions = collection._ids, collection._names, collection._descriptions
+        active, unknown_active = collection._active, collection._unknown_active
+        created_at = collection._created_at
+        for position, row in enumerate(rows):
+            entity_id, name, description, is_active, created_at_micros = row
+            ids += entity_id
+            names.append(_intern(name))
+            descriptions.append(None if description is None else _intern(description))
+            if is_active is None:
+                unknown_active[position] = True
+            elif is_active:
+                active[position] = True
+            created_at.append(created_at_micros)
+        return collection
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @overload
+    def __getitem__(self, position: int) -> Category: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> 'CategoryCollection': ...
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return self.take(range(len(self))[position])
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError('CategoryCollection index out of range')
+        return Category.construct(
+            unique_entity_id=UniqueEntityId.from_bytes(
+                bytes(self._ids[position * 16:position * 16 + 16])),
+            name=self._names[position],
+            description=self._descriptions[position],
+            is_active=None if self._unknown_active[position] else self._active[position],
+            created_at=from_epoch_micros(self._created_at[position])
+        )
+
+    def __iter__(self) -> Iterator[Category]:
+        return map(self.__getitem__, range(len(self)))
+
+    def id_at(self, position: int) -> str:
+        return UniqueEntityId.from_bytes(bytes(self._ids[position * 16:position * 16 + 16])).id
+
+    def take(self, positions: Iterable[int]) -> 'CategoryCollection':
+        """A collection of the rows at `positions`, in that order."""
+        if not isinstance(positions, (list, range)):
+            positions = list(positions)
+        ids, names, descriptions = self._ids, self._names, self._descriptions
+        active, unknown_active = self._active, self._unknown_active
+        created_at = self._created_at
+        collection = CategoryCollection()
+        collection._ids = bytearray(
+            b''.join([ids[position * 16:position * 16 + 16] for position in positions]))
+        collection._names = [names[position] for position in positions]
+        collection._descriptions = [descriptions[position] for position in positions]
+        collection._created_at = array('q', [created_at[position] for position in positions])
+        taken_active, taken_unknown_active = collection._active, collection._unknown_active
+        for taken, position in enumerate(positions):
+            if active[position]:
+                taken_active[taken] = True
+            elif unknown_active[position]:
+                taken_unknown_active[taken] = True
+        return collection
+
+    def filter(self, filter_param: Optional[CategoryFilter | str] = None) -> 'CategoryCollection':
+        """The rows matching the filter, with the repositories' word prefix semantics for terms."""
+        if isinstance(filter_param, str):
+            filter_param = CategoryFilter(term=filter_param)
+        if filter_param is None or (not filter_param.term and filter_param.is_active is None):
+            return self.take(range(len(self)))
+        positions: Iterable[int] = range(len(self))
+        if filter_param.is_active is not None:
+            active, wanted = self._active, bool(filter_param.is_active)
+            positions = [position for position in positions if active[position] is wanted]
+        if filter_param.term:
+            prefixes = tokenize(filter_param.term)
+            names = self._names
+            matches: Dict[str, bool] = {}
+            positions = [
+                position for position in positions
+                if prefixes and _matches(names[position], prefixes, matches)
+            ]
+        return self.take(positions)
+
+    def sort(self, sort: str = 'created_at', reverse: bool = False) -> 'CategoryCollection':
+        """Sorted by name (case-folded) or created_at, ties broken by id like the repositories."""
+        ids = self._ids
+        if sort == 'name':
+            folded: Dict[str, str] = {}
+            values: Sequence[Any] = [
+                folded.get(name) or folded.setdefault(name, name.casefold()) for name in self._names
+            ]
+        elif sort == 'created_at':
+            values = self._created_at
+        else:
+            raise ValueError(f'Cannot sort by {sort!r}, use name or created_at')
+        keys = [
+            (value, ids[position * 16:position * 16 + 16]) for position, value in enumerate(values)
+        ]
+        return self.take(sorted(range(len(self)), key=keys.__getitem__, reverse=reverse))
+
+    def count_active(self) -> int:
+        return self._active.count()
+
+
+def _matches(name: str, prefixes: Iterable[str], matches: Dict[str, bool]) -> bool:
+    # names are interned and often repeat, so remember the answer per name
+    matched = matches.get(name)
+    if matched is None:
+        words = tokenize(name)
+        matched = matches[name] = all(
+            any(word.startswith(prefix) for word in words) for prefix in prefixes)
+    return matched
@@ -0,0 +1,34 @@
+from typing import Any, BinaryIO, Optional, TextIO
+
+from __seedwork.infra.exporters import (
+    DEFAULT_CHUNK_SIZE,
+    iter_csv_chunks,
+    iter_json_lines_chunks,
+    write_chunks
+)
+from category.domain.repositories import CategoryFilter, CategoryRepository
+
+
+def export_categories(
+    repository: CategoryRepository,
+    target: TextIO | BinaryIO | Any,
+    file_format: str = 'jsonl',
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    per_page: int = 1_000,
+    sort: Optional[str] = None,
+    sort_dir: Optional[str] = None,
+    filter_param: Optional[CategoryFilter | str] = None
+) -> None:
+    """
+    Writes the categories matching the filter to a file or socket as JSON-lines
+    or CSV, reading the repository lazily, so only one page of categories and
+    one chunk of output are held at a time.
+    """
+    if file_format == 'jsonl':
+        iter_chunks = iter_json_lines_chunks
+    elif file_format == 'csv':
+        iter_chunks = iter_csv_chunks
+    else:
+        raise ValueError(f'Unsupported file format {file_format!r}, use csv or jsonl')
+    categories = repository.scan(per_page, sort, sort_dir, filter_param)
+    write_chunks(iter_chunks(categories, chunk_size), target)
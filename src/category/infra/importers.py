@@ -0,0 +1,227 @@
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+import contextlib
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+import json
+import os
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+import uuid
+
+from __seedwork.domain.exceptions import AlreadyExistsException
+from __seedwork.domain.validators import ErrorFields
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+
+
+_COLUMNS = ('id', 'name', 'description', 'is_active', 'created_at')
+_TRUE = frozenset(['true', '1', 'yes'])
+_FALSE = frozenset(['false', '0', 'no'])
+_FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+# (line, record): a record is the text of a JSON line or the fields of a CSV row
+Records = List[Tuple[int, Any]]
+Columns = Dict[str, List[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class RowError:
+    line: int
+    errors: ErrorFields
+
+
+@dataclass(slots=True)
+class ImportResult:
+    imported: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+
+def import_categories(
+    source: str | os.PathLike | TextIO,
+    repository: CategoryRepository,
+    file_format: Optional[str] = None,
+    chunk_size: int = 5_000,
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None
+) -> ImportResult:
+    """
+    Streams a CSV file (with a header row) or a JSON-lines file of categories
+    into repository.bulk_insert. Chunks of `chunk_size` records are parsed and
+    validated on a pool of `workers` processes (0 validates in this process);
+    at most `max_pending` chunks are in flight, so reading waits for the
+    repository and memory stays bounded whatever the file size. Invalid rows
+    and ids that already exist are skipped and reported with their line
+    number, the rest are imported.
+    """
+    if file_format is None:
+        if not isinstance(source, (str, os.PathLike)):
+            raise ValueError('file_format is required when reading from a file object')
+        file_format = _FORMATS.get(os.path.splitext(source)[1].lower())
+    if file_format not in ('csv', 'jsonl'):
+        raise ValueError(f'Unsupported file format {file_format!r}, use csv or jsonl')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * max(workers, 1)
+
+    result = ImportResult()
+    with contextlib.ExitStack() as stack:
+        file = stack.enter_context(open(source, newline='', encoding='utf-8-sig')) \
+            if isinstance(source, (str, os.PathLike)) else source
+        executor = stack.enter_context(ProcessPoolExecutor(workers)) if workers else None
+
+        pending: Deque[Future] = deque()
+        for header, records in read_chunks(file, file_format, chunk_size):
+            pending.append(_submit(executor, validate_chunk, header, records))
+            if len(pending) >= max_pending:
+                _insert(repository, pending.popleft().result(), result)
+        while pending:
+            _insert(repository, pending.popleft().result(), result)
+    return result
+
+
+def read_chunks(
+    file: TextIO, file_format: str, chunk_size: int
+) -> Iterator[Tuple[Optional[List[str]], Records]]:
+    """Splits a file into (header, records) chunks without parsing JSON lines."""
+    if file_format == 'csv':
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        header = [name.strip() for name in header]
+        records: Records = []
+        line = reader.line_num + 1
+        for row in reader:
+            records.append((line, row))
+            line = reader.line_num + 1
+            if len(records) == chunk_size:
+                yield header, records
+                records = []
+        if records:
+            yield header, records
+        return
+
+    lines = ((line, text) for line, text in enumerate(file, 1) if text.strip())
+    while records := list(islice(lines, chunk_size)):
+        yield None, records
+
+
+def validate_chunk(
+    header: Optional[Sequence[str]], records: Records
+) -> Tuple[Columns, List[RowError]]:
+    """
+    Parses and validates a chunk, returning the columns of its valid rows,
+    with their line numbers as the 'line' column, and the errors of the
+    others. Runs on the worker processes.
+    """
+    columns: Columns = {name: [] for name in _COLUMNS}
+    lines: List[int] = []
+    errors: List[RowError] = []
+    for line, record in records:
+        row, row_errors = _parse_csv(header, record) if header is not None else _parse_json(record)
+        if row_errors:
+            errors.append(RowError(line, row_errors))
+            continue
+        lines.append(line)
+        for name in _COLUMNS:
+            columns[name].append(row[name])
+
+    invalid = Category.rules.check_columns(len(lines), **columns)
+    columns['line'] = lines
+    if invalid:
+        errors.extend(
+            RowError(lines[position], row_errors) for position, row_errors in invalid.items())
+        errors.sort(key=lambda error: error.line)
+        columns = {
+            name: [value for position, value in enumerate(column) if position not in invalid]
+            for name, column in columns.items()
+        }
+    return columns, errors
+
+
+def _parse_csv(
+    header: Sequence[str], record: List[str]
+) -> Tuple[Dict[str, Any], Optional[ErrorFields]]:
+    if len(record) != len(header):
+        return {}, {'row': [f'Expected {len(header)} fields, found {len(record)}']}
+    row = dict(zip(header, record))
+    is_active = (row.get('is_active') or '').strip().lower()
+    row['is_active'] = True if not is_active or is_active in _TRUE \
+        else False if is_active in _FALSE else row['is_active']
+    row['description'] = row.get('description') or None
+    return _coerce(row)
+
+
+def _parse_json(record: str) -> Tuple[Dict[str, Any], Optional[ErrorFields]]:
+    try:
+        row = json.loads(record)
+    except ValueError:
+        return {}, {'row': ['Line is not valid JSON']}
+    if not isinstance(row, dict):
+        return {}, {'row': ['Line must be a JSON object']}
+    if row.get('is_active') is None:
+        row['is_active'] = True
+    return _coerce(row)
+
+
+def _coerce(row: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[ErrorFields]]:
+    errors: Optional[ErrorFields] = None
+    entity_id = row.get('id') or None
+    if entity_id is not None:
+        try:
+            entity_id = str(uuid.UUID(str(entity_id)))
+        except (TypeError, ValueError, AttributeError):
+            errors = {'id': ['ID must be a valid uuid']}
+    created_at = row.get('created_at') or None
+    if created_at is not None:
+        try:
+            created_at = datetime.fromisoformat(created_at)
+        except (TypeError, ValueError):
+            errors = {
+                **(errors or {}), 'created_at': ['Field created_at must be an ISO 8601 datetime']}
+    return {
+        'id': entity_id,
+        'name': row.get('name'),
+        'description': row.get('description'),
+        'is_active': row['is_active'],
+        'created_at': created_at
+    }, errors
+
+
+def _submit(executor: Optional[Executor], func, *args) -> Future:
+    if executor is not None:
+        return executor.submit(func, *args)
+    future: Future = Future()
+    future.set_result(func(*args))
+    return future
+
+
+def _insert(
+    repository: CategoryRepository,
+    validated: Tuple[Columns, List[RowError]],
+    result: ImportResult
+) -> None:
+    columns, errors = validated
+    lines = columns.pop('line')
+    if not lines:
+        result.errors.extend(errors)
+        return
+    entities = Category.bulk_create(columns, validate=False)
+    try:
+        repository.bulk_insert(entities)
+    except AlreadyExistsException:
+        # nothing of the chunk was stored, so insert it row by row to find the ids taken
+        existing = []
+        for line, entity in zip(lines, entities):
+            try:
+                repository.insert(entity)
+            except AlreadyExistsException:
+                existing.append(RowError(line, {'id': ['ID already exists']}))
+        errors = sorted(errors + existing, key=lambda error: error.line)
+        result.imported -= len(existing)
+    result.errors.extend(errors)
+    result.imported += len(entities)
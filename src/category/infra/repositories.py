@@ -0,0 +1,314 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import filterfalse, islice
+import math
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from __seedwork.domain.exceptions import InvalidCursorException
+from __seedwork.domain.repositories import (
+    AsyncInMemoryRepository,
+    InMemorySearchableRepository,
+    decode_cursor,
+    encode_cursor
+)
+from __seedwork.infra.cache import AsyncCachedRepository, CachedRepository
+from __seedwork.infra.indexes import Bitmap, SortedIndex, TokenIndex, tokenize
+from category.domain.entities import Category
+from category.domain.repositories import CategoryAsyncRepository, CategoryFilter, CategoryRepository
+
+
+@dataclass(slots=True)
+class _Compaction:
+    # the tombstones being purged, snapshot when the pass started
+    ids: Set[str]
+    # the index walked, then len(indexes) to release the items
+    stage: int = 0
+    resume: Optional[Tuple[Any, str]] = None
+    released: List[str] = field(default_factory=list)
+
+
+class CategoryInMemoryRepository(
+    CategoryRepository, InMemorySearchableRepository[Category, CategoryFilter]
+):
+    """
+    Keeps secondary indexes next to the items so a search never scans or sorts
+    the whole store: pages come out of the name/created_at orderings, terms are
+    resolved through a prefix index over the words of the name and is_active is
+    a bitmap over the entity slots. Cursors hold the (sort key, id) of the last
+    item of a page, so the next page is a seek into the ordering.
+
+    A delete only clears the is_active bit of the entity and tombstones it,
+    searches skip tombstoned ids as they walk the indexes, and compact() does
+    a bounded step of a pass that filters the tombstones of its snapshot out
+    of one index chunk at a time before releasing their items and slots.
+    """
+
+    def __init__(self, items: Optional[Iterable[Category]] = None) -> None:
+        super().__init__()
+        self._by_name = SortedIndex()
+        self._by_created_at = SortedIndex()
+        self._name_tokens = TokenIndex()
+        self._active = Bitmap()
+        self._slots: Dict[str, int] = {}
+        self._free_slots: List[int] = []
+        self._indexed: Dict[str, Tuple[str, object, Set[str]]] = {}
+        self._compaction: Optional[_Compaction] = None
+        if items:
+            self.bulk_insert(list(items))
+
+    def _store_new(self, entity: Category) -> None:
+        super()._store_new(entity)
+        self._index(entity)
+
+    def bulk_insert(self, entities: List[Category]) -> None:
+        # one sort per index beats n insertions once the batch is not tiny
+        ids = [entity.id for entity in entities]
+        with self.lock:
+            if len(ids) < 64 or len(set(ids)) != len(ids) or not self.items.keys().isdisjoint(ids):
+                super().bulk_insert(entities)
+                return
+            keys = []
+            for entity_id, entity in zip(ids, entities):
+                self.items[entity_id] = entity
+                self.versions[entity_id] = entity.version
+                keys.append(self._track(entity_id, entity))
+                if entity.deleted_at is not None:
+                    self._tombstone(entity_id)
+            self._by_name.extend(
+                (name_key, entity_id) for entity_id, (name_key, _, _) in zip(ids, keys))
+            self._by_created_at.extend(
+                (created_at, entity_id) for entity_id, (_, created_at, _) in zip(ids, keys))
+            self._name_tokens.extend(
+                (tokens, entity_id) for entity_id, (_, _, tokens) in zip(ids, keys))
+
+    def update(self, entity: Category, expected_version: Optional[int] = None) -> None:
+        with self.lock:
+            super().update(entity, expected_version)
+            # a deleted category keeps its index entries until compaction
+            if entity.deleted_at is not None:
+                return
+            name_key, created_at, _ = self._indexed[entity.id]
+            if entity.name.casefold() == name_key and entity.created_at == created_at:
+                # only is_active (or the description) changed
+                self._active[self._slots[entity.id]] = bool(entity.is_active)
+            else:
+                self._unindex(entity.id)
+                self._index(entity)
+
+    def compact(self, budget: int = 10_000) -> bool:
+        """
+        Visits up to `budget` index entries, or releases a tenth as many
+        items, returning whether there is more to do.
+        """
+        with self.lock:
+            compaction = self._compaction
+            if compaction is None:
+                if not self.tombstones:
+                    return False
+                compaction = self._compaction = _Compaction(set(self.tombstones))
+            indexes = (self._by_name, self._by_created_at, self._name_tokens)
+            if compaction.stage < len(indexes):
+                compaction.resume = indexes[compaction.stage].purge(
+                    compaction.ids, compaction.resume, budget)
+                if compaction.resume is None:
+                    compaction.stage += 1
+                    compaction.released = list(compaction.ids)
+                return True
+            # freeing an entity costs about as much as visiting ten entries
+            releases = max(budget // 10, 1)
+            for entity_id in compaction.released[-releases:]:
+                # purged since the pass started when it was inserted again
+                if entity_id in compaction.ids:
+                    self._release(entity_id)
+            del compaction.released[-releases:]
+            if not compaction.released:
+                self._compaction = None
+            return bool(compaction.released or self.tombstones)
+
+    def search(
+        self, input_params: CategoryRepository.SearchParams
+    ) -> CategoryRepository.SearchResult:
+        index, reverse = self._ordering(input_params.sort, input_params.sort_dir)
+        after = self._decode_cursor(input_params.cursor, index) if input_params.cursor else None
+        start = 0 if after else (input_params.page - 1) * input_params.per_page
+        # one extra item tells whether there is a next page
+        stop = start + input_params.per_page + 1
+
+        matches, predicate, total = self._matching(input_params.filter)
+        if matches is None and predicate is None and not self.tombstones:
+            ids = index.slice(start, stop, reverse, after)
+        elif matches is None and predicate is None:
+            live = filterfalse(self.tombstones.__contains__, index.ids(reverse, after))
+            ids = list(islice(live, start, stop))
+        elif matches is not None and self._cheaper_to_sort(len(matches), stop):
+            sort_key = self._sort_key(index)
+            if after:
+                is_past = (lambda key: key < after) if reverse else (lambda key: key > after)
+                matches = [entity_id for entity_id in matches if is_past(sort_key(entity_id))]
+            ids = sorted(matches, key=sort_key, reverse=reverse)[start:stop]
+        else:
+            candidates = filter(predicate or matches.__contains__, index.ids(reverse, after))
+            ids = list(islice(candidates, start, stop))
+
+        next_cursor = None
+        if len(ids) > input_params.per_page:
+            del ids[input_params.per_page:]
+            next_cursor = self._encode_cursor(ids[-1], index)
+
+        return CategoryRepository.SearchResult(
+            items=[self.items[entity_id] for entity_id in ids],
+            total=total,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter,
+            next_cursor=next_cursor
+        )
+
+    def _apply_filter(
+        self, items: List[Category], filter_param: CategoryFilter | None
+    ) -> List[Category]:
+        if filter_param is None:
+            return items
+        matches, predicate, _ = self._matching(filter_param)
+        keep = predicate or matches.__contains__
+        return [item for item in items if keep(item.id)]
+
+    def _ordering(self, sort: str | None, sort_dir: str | None) -> Tuple[SortedIndex, bool]:
+        if sort == 'name':
+            return self._by_name, sort_dir == 'desc'
+        if sort == 'created_at':
+            return self._by_created_at, sort_dir == 'desc'
+        return self._by_created_at, True
+
+    def _matching(
+        self, filter_param: CategoryFilter | None
+    ) -> Tuple[Optional[Set[str]], Optional[Callable[[str], bool]], int]:
+        live = len(self.items) - len(self.tombstones)
+        if filter_param is None:
+            return None, None, live
+
+        is_active = filter_param.is_active
+        if filter_param.term is None:
+            active_count = self._active.count()
+            total = active_count if is_active else live - active_count
+            return None, self._is_active_predicate(is_active), total
+
+        matches = self._name_tokens.match(tokenize(filter_param.term))
+        if self.tombstones:
+            matches.difference_update(self.tombstones)
+        if is_active is not None:
+            is_wanted = self._is_active_predicate(is_active)
+            matches = {entity_id for entity_id in matches if is_wanted(entity_id)}
+        return matches, None, len(matches)
+
+    def _is_active_predicate(self, is_active: bool) -> Callable[[str], bool]:
+        active, slots, tombstones = self._active, self._slots, self.tombstones
+        if is_active:
+            # tombstoned categories have the bit cleared
+            return lambda entity_id: active[slots[entity_id]]
+        return lambda entity_id: not active[slots[entity_id]] and entity_id not in tombstones
+
+    def _cheaper_to_sort(self, matches: int, stop: int) -> bool:
+        # walking the ordering visits about stop * n / matches entries before
+        # filling the page, sorting the matches costs matches * log(matches)
+        if matches == 0:
+            return True
+        walk_cost = stop * len(self.items) / matches
+        return matches * math.log2(matches + 1) <= walk_cost
+
+    def _sort_key(self, index: SortedIndex) -> Callable[[str], tuple]:
+        position = 0 if index is self._by_name else 1
+        indexed = self._indexed
+        return lambda entity_id: (indexed[entity_id][position], entity_id)
+
+    def _encode_cursor(self, entity_id: str, index: SortedIndex) -> str:
+        key = self._sort_key(index)(entity_id)[0]
+        return encode_cursor([key if isinstance(key, str) else key.isoformat(), entity_id])
+
+    def _decode_cursor(self, cursor: str, index: SortedIndex) -> Tuple[Any, str]:
+        key, entity_id = decode_cursor(cursor, 2)
+        if not isinstance(key, str) or not isinstance(entity_id, str):
+            raise InvalidCursorException()
+        if index is self._by_created_at:
+            try:
+                key = datetime.fromisoformat(key)
+            except ValueError as ex:
+                raise InvalidCursorException() from ex
+        return key, entity_id
+
+    def _index(self, entity: Category) -> None:
+        entity_id = entity.id
+        name_key, created_at, tokens = self._track(entity_id, entity)
+        self._by_name.add(name_key, entity_id)
+        self._by_created_at.add(created_at, entity_id)
+        self._name_tokens.add(tokens, entity_id)
+
+    def _track(self, entity_id: str, entity: Category) -> Tuple[str, object, Set[str]]:
+        if entity_id not in self._slots:
+            self._slots[entity_id] = self._free_slots.pop() if self._free_slots \
+                else len(self._slots) + len(self._free_slots)
+        self._active[self._slots[entity_id]] = bool(entity.is_active)
+        name_key = entity.name.casefold()
+        indexed = self._indexed[entity_id] = (name_key, entity.created_at, tokenize(name_key))
+        return indexed
+
+    def _tombstone(self, entity_id: str) -> None:
+        super()._tombstone(entity_id)
+        self._active[self._slots[entity_id]] = False
+
+    def _purge(self, entity_id: str) -> None:
+        # right away, index entries and all, for an id inserted again
+        if self._compaction is not None:
+            self._compaction.ids.discard(entity_id)
+        self._unindex(entity_id)
+        super()._purge(entity_id)
+        self._free_slots.append(self._slots.pop(entity_id))
+
+    def _release(self, entity_id: str) -> None:
+        # the compaction pass already dropped its index entries
+        super()._purge(entity_id)
+        del self._indexed[entity_id]
+        self._free_slots.append(self._slots.pop(entity_id))
+
+    def _unindex(self, entity_id: str) -> None:
+        name_key, created_at, tokens = self._indexed.pop(entity_id)
+        self._by_name.remove(name_key, entity_id)
+        self._by_created_at.remove(created_at, entity_id)
+        self._name_tokens.remove(tokens, entity_id)
+        self._active[self._slots[entity_id]] = False
+
+
+class CategoryAsyncInMemoryRepository(
+    CategoryAsyncRepository,
+    AsyncInMemoryRepository[
+        Category, CategoryRepository.SearchParams, CategoryRepository.SearchResult
+    ]
+):
+
+    def __init__(
+        self, repository: Optional[CategoryInMemoryRepository] = None, chunk_size: int = 5_000
+    ) -> None:
+        super().__init__(repository or CategoryInMemoryRepository(), chunk_size)
+
+
+class CategoryCachedRepository(
+    CategoryRepository,
+    CachedRepository[Category, CategoryRepository.SearchParams, CategoryRepository.SearchResult]
+):
+
+    def _page_key(self, input_params: CategoryRepository.SearchParams) -> Optional[Hashable]:
+        # keyset pages are mostly read once, walking a scan or an export
+        return None if input_params.cursor else super()._page_key(input_params)
+
+
+class CategoryAsyncCachedRepository(
+    CategoryAsyncRepository,
+    AsyncCachedRepository[
+        Category, CategoryRepository.SearchParams, CategoryRepository.SearchResult
+    ]
+):
+
+    def _page_key(self, input_params: CategoryRepository.SearchParams) -> Optional[Hashable]:
+        return None if input_params.cursor else super()._page_key(input_params)
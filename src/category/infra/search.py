@@ -0,0 +1,57 @@
+from typing import Iterable, List, Tuple
+
+from __seedwork.infra.events import InProcessEventBus
+from __seedwork.infra.fulltext import FullTextIndex
+from category.domain.entities import Category
+from category.domain.events import CategoryCreated, CategoryDeleted, CategoryUpdated
+
+
+class CategorySearchIndex:
+    """
+    Full-text search over category names and descriptions, accent and case
+    insensitive and ranked with BM25, the words of the name counting
+    `name_weight` times. Kept up to date by the category events once
+    subscribed to the bus.
+    """
+
+    __slots__ = ('index', 'name_weight')
+
+    def __init__(
+        self, categories: Iterable[Category] = (), name_weight: int = 2, **options
+    ) -> None:
+        self.index = FullTextIndex(**options)
+        self.name_weight = name_weight
+        self.index.extend(
+            (category.id, self._fields(category.name, category.description))
+            for category in categories
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def subscribe(self, bus: InProcessEventBus) -> None:
+        bus.subscribe(CategoryCreated, self._on_changed)
+        bus.subscribe(CategoryUpdated, self._on_changed)
+        bus.subscribe(CategoryDeleted, self._on_deleted)
+
+    def add(self, category: Category) -> None:
+        self.index.add(category.id, self._fields(category.name, category.description))
+
+    def remove(self, category_id: str) -> None:
+        self.index.remove(category_id)
+
+    def search(self, query: str, limit: int = 10, prefix: bool = False) -> List[Tuple[str, float]]:
+        """
+        The (id, score) of the best `limit` categories, `prefix` matching the
+        last word as typed so far.
+        """
+        return self.index.search(query, limit, prefix)
+
+    def _on_changed(self, event: CategoryCreated | CategoryUpdated) -> None:
+        self.index.add(event.aggregate_id, self._fields(event.name, event.description))
+
+    def _on_deleted(self, event: CategoryDeleted) -> None:
+        self.index.remove(event.aggregate_id)
+
+    def _fields(self, name: str, description: str | None) -> Tuple[Tuple[str, int], ...]:
+        return ((name, self.name_weight), (description or '', 1))
@@ -0,0 +1,290 @@
+from array import array
+from bisect import bisect_left
+import mmap
+import os
+import struct
+import sys
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, overload
+
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.sqlite import from_epoch_micros, to_epoch_micros
+from category.domain.entities import Category
+
+
+_MAGIC = b'CATSNAP\x02'
+# magic, byte order (0 little, 1 big), count, then the (offset, size) of each section
+_HEADER = struct.Struct('<8sBxxxI')
+_SECTIONS = (
+    'ids',                  # 16 bytes per category
+    'created_at',           # int64 microseconds since the epoch
+    'versions',             # uint32
+    'active',               # bitmap
+    'active_unknown',       # bitmap, whether is_active is None
+    'described',            # bitmap, whether the description is not None
+    'offsets',              # uint64, where each name and description ends in the heap
+    'heap',                 # UTF-8 name then description of each category
+    'by_name',              # uint32 positions ordered by (case-folded name, id)
+    'by_created_at',        # uint32 positions ordered by (created_at, id)
+    'by_id',                # uint32 positions ordered by id
+)
+_SECTION = struct.Struct('<QQ')
+_TYPECODES = {
+    'created_at': 'q', 'versions': 'I', 'offsets': 'Q',
+    'by_name': 'I', 'by_created_at': 'I', 'by_id': 'I',
+}
+_BYTE_ORDER = 0 if sys.byteorder == 'little' else 1
+
+
+def write_snapshot(categories: Iterable[Category], path: str | os.PathLike) -> int:
+    """
+    Writes the categories, deleted ones left out, as a snapshot file and
+    returns how many it holds. The file is written next to `path` and renamed
+    over it, so readers never see a partial snapshot. created_at is stored as
+    UTC microseconds without its offset: aware datetimes come back as naive
+    UTC.
+    """
+    ids, heap = bytearray(), bytearray()
+    created_at, versions = array('q'), array('I')
+    offsets = array('Q', [0])
+    active, active_unknown, described = bytearray(), bytearray(), bytearray()
+    name_keys: List[str] = []
+    count = 0
+    for category in categories:
+        if category.deleted_at is not None:
+            continue
+        if count % 8 == 0:
+            active.append(0)
+            active_unknown.append(0)
+            described.append(0)
+        ids += category.unique_entity_id.bytes
+        created_at.append(to_epoch_micros(category.created_at))
+        versions.append(category.version)
+        if category.is_active is None:
+            active_unknown[-1] |= 1 << (count % 8)
+        elif category.is_active:
+            active[-1] |= 1 << (count % 8)
+        heap += category.name.encode()
+        offsets.append(len(heap))
+        if category.description is not None:
+            described[-1] |= 1 << (count % 8)
+            heap += category.description.encode()
+        offsets.append(len(heap))
+        name_keys.append(category.name.casefold())
+        count += 1
+
+    def id_at(position: int) -> bytes:
+        return ids[position * 16:position * 16 + 16]
+
+    sections = {
+        'ids': ids,
+        'created_at': created_at,
+        'versions': versions,
+        'active': active,
+        'active_unknown': active_unknown,
+        'described': described,
+        'offsets': offsets,
+        'heap': heap,
+        'by_name': array('I', sorted(
+            range(count), key=lambda position: (name_keys[position], id_at(position)))),
+        'by_created_at': array('I', sorted(
+            range(count), key=lambda position: (created_at[position], id_at(position)))),
+        'by_id': array('I', sorted(range(count), key=id_at)),
+    }
+
+    temporary = f'{os.fspath(path)}.{os.urandom(8).hex()}.tmp'
+    # created like open() would, so the kernel applies the umask to its mode
+    descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            _write_sections(file, count, [sections[name] for name in _SECTIONS])
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return count
+
+
+def _write_sections(file: BinaryIO, count: int, sections: List[bytes | bytearray | array]) -> None:
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    for section in sections:
+        # aligned, so every column can be cast in place
+        offset += -offset % 8
+        size = len(section) * (section.itemsize if isinstance(section, array) else 1)
+        table.append((offset, size))
+        offset += size
+    file.write(_HEADER.pack(_MAGIC, _BYTE_ORDER, count))
+    for section_offset, size in table:
+        file.write(_SECTION.pack(section_offset, size))
+    for section, (section_offset, _) in zip(sections, table):
+        file.write(bytes(section_offset - file.tell()))
+        file.write(section)
+
+
+class CategorySnapshot(Sequence[Category]):
+    """
+    Read-only view of a snapshot file mapped in memory. Opening it only reads
+    the header: the columns, the string heap and the prebuilt orderings are
+    cast in place, and a Category is built through the trusted construct path
+    each time one is read, so startup does not depend on the number of
+    categories. Snapshots are only read on machines with the byte order they
+    were written with.
+    """
+
+    __slots__ = (
+        '_file', '_mmap', '_views', '_count', '_ids', '_created_at', '_versions', '_active',
+        '_active_unknown', '_described', '_offsets', '_heap', '_by_name', '_by_created_at', '_by_id'
+    )
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._file = open(path, 'rb')  # pylint: disable=consider-using-with
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f'{path} is not a category snapshot') from None
+        self._views: List[memoryview] = []
+        try:
+            self._map_sections(path)
+        except BaseException:
+            self.close()
+            raise
+
+    def _map_sections(self, path: str | os.PathLike) -> None:
+        buffer = memoryview(self._mmap)
+        self._views.append(buffer)
+        table_end = _HEADER.size + _SECTION.size * len(_SECTIONS)
+        if len(buffer) < table_end:
+            raise ValueError(f'{path} is not a category snapshot')
+        magic, byte_order, count = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError(f'{path} is not a category snapshot')
+        if byte_order != _BYTE_ORDER:
+            raise ValueError(f'{path} was written on a machine with another byte order')
+        self._count = count
+        views = {}
+        for number, name in enumerate(_SECTIONS):
+            offset, size = _SECTION.unpack_from(buffer, _HEADER.size + _SECTION.size * number)
+            if offset + size > len(buffer):
+                raise ValueError(f'{path} is truncated')
+            view = buffer[offset:offset + size]
+            if name in _TYPECODES:
+                view = view.cast(_TYPECODES[name])
+            self._views.append(view)
+            views[name] = view
+        self._ids = views['ids']
+        self._created_at = views['created_at']
+        self._versions = views['versions']
+        self._active = views['active']
+        self._active_unknown = views['active_unknown']
+        self._described = views['described']
+        self._offsets = views['offsets']
+        self._heap = views['heap']
+        self._by_name = views['by_name']
+        self._by_created_at = views['by_created_at']
+        self._by_id = views['by_id']
+
+    def __enter__(self) -> 'CategorySnapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # the map can only be closed once no view of it is left
+        while self._views:
+            self._views.pop().release()
+        self._mmap.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, position: int) -> Category: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> List[Category]: ...
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._category(taken) for taken in range(self._count)[position]]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError('CategorySnapshot index out of range')
+        return self._category(position)
+
+    def __iter__(self) -> Iterator[Category]:
+        return map(self._category, range(self._count))
+
+    def id_at(self, position: int) -> str:
+        return UniqueEntityId.from_bytes(bytes(self._ids[position * 16:position * 16 + 16])).id
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        """Binary search over the positions ordered by id."""
+        try:
+            key = UniqueEntityId(str(entity_id)).bytes
+        except Exception as ex:  # pylint: disable=broad-except
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'") from ex
+        ids, by_id = self._ids, self._by_id
+
+        def id_bytes(rank: int) -> bytes:
+            position = by_id[rank]
+            return ids[position * 16:position * 16 + 16].tobytes()
+
+        rank = bisect_left(range(self._count), key, key=id_bytes)
+        if rank < self._count and id_bytes(rank) == key:
+            return self._category(by_id[rank])
+        raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+
+    def ordered(self, sort: Optional[str] = None, reverse: bool = False) -> Iterator[Category]:
+        """
+        Every category by name (case-folded) or created_at, ties broken by id,
+        from the prebuilt ordering.
+        """
+        positions = self._ordering(sort)
+        return map(self._category, reversed(positions) if reverse else positions)
+
+    def page(
+        self, start: int, stop: int, sort: Optional[str] = None, reverse: bool = False
+    ) -> List[Category]:
+        positions = self._ordering(sort)
+        if reverse:
+            ranks = range(self._count - 1 - start, max(self._count - 1 - stop, -1), -1)
+        else:
+            ranks = range(start, min(stop, self._count))
+        return [self._category(positions[rank]) for rank in ranks]
+
+    def count_active(self) -> int:
+        return int.from_bytes(self._active, 'little').bit_count()
+
+    def _ordering(self, sort: Optional[str]) -> memoryview:
+        if sort == 'name':
+            return self._by_name
+        if sort in (None, 'created_at'):
+            return self._by_created_at
+        raise ValueError(f'Cannot sort by {sort!r}, use name or created_at')
+
+    def _category(self, position: int) -> Category:
+        heap, offsets = self._heap, self._offsets
+        start, name_end, end = offsets[2 * position:2 * position + 3]
+        described = self._bit(self._described, position)
+        return Category.construct(
+            unique_entity_id=UniqueEntityId.from_bytes(
+                bytes(self._ids[position * 16:position * 16 + 16])),
+            name=str(heap[start:name_end], 'utf-8'),
+            description=str(heap[name_end:end], 'utf-8') if described else None,
+            is_active=(
+                None if self._bit(self._active_unknown, position)
+                else self._bit(self._active, position)
+            ),
+            created_at=from_epoch_micros(self._created_at[position]),
+            version=self._versions[position]
+        )
+
+    @staticmethod
+    def _bit(bitmap: memoryview, position: int) -> bool:
+        return bool(bitmap[position >> 3] & (1 << (position & 7)))
+
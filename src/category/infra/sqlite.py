@@ -0,0 +1,407 @@
+from functools import lru_cache
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import uuid
+
+from __seedwork.domain.exceptions import (
+    AlreadyExistsException,
+    ConcurrencyException,
+    InvalidCursorException,
+    NotFoundException
+)
+from __seedwork.domain.repositories import decode_cursor, encode_cursor
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.indexes import tokenize
+from __seedwork.infra.sqlite import connect, from_epoch_micros, to_epoch_micros, utc_offset_seconds
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.collections import CategoryCollection
+
+
+# a category with is_active None is filtered as an inactive one, like in memory
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS categories (
+    id BLOB PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    name_words TEXT NOT NULL,
+    description TEXT,
+    is_active INTEGER,
+    created_at INTEGER NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    created_at_offset INTEGER
+);
+CREATE INDEX IF NOT EXISTS categories_name_key ON categories (name_key, id);
+CREATE INDEX IF NOT EXISTS categories_created_at ON categories (created_at, id);
+CREATE INDEX IF NOT EXISTS categories_active ON categories (IFNULL(is_active, 0), created_at, id);
+'''
+
+_COLUMNS = 'id, name, description, is_active, created_at, created_at_offset, version'
+_STORED = (
+    'id, name, name_key, name_words, description, is_active, created_at, created_at_offset, version'
+)
+_INSERT = f'INSERT INTO categories ({_STORED}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'
+_UPDATE = (
+    'UPDATE categories SET name = ?, name_key = ?, name_words = ?, description = ?, is_active = ?, '
+    'created_at = ?, created_at_offset = ?, version = ? WHERE id = ?'
+)
+_UPDATE_IF_VERSION = f'{_UPDATE} AND version = ?'
+_SELECT_VERSION = 'SELECT version FROM categories WHERE id = ?'
+_DELETE = 'DELETE FROM categories WHERE id = ?'
+_DELETE_IF_VERSION = f'{_DELETE} AND version = ?'
+_SELECT_BY_ID = f'SELECT {_COLUMNS} FROM categories WHERE id = ?'
+_SELECT_ALL = f'SELECT {_COLUMNS} FROM categories ORDER BY rowid'
+
+_SORT_COLUMNS = {'name': 'name_key', 'created_at': 'created_at'}
+# the columns holding each field of a category
+_FIELD_COLUMNS = {
+    'name': ('name', 'name_key', 'name_words'),
+    'description': ('description',),
+    'is_active': ('is_active',),
+    'created_at': ('created_at', 'created_at_offset'),
+}
+
+
+@lru_cache(maxsize=None)
+def _update_fields_statement(fields: Tuple[str, ...]) -> str:
+    columns = [column for name in fields for column in _FIELD_COLUMNS[name]] + ['version']
+    assignments = ', '.join(f'{column} = ?' for column in columns)
+    return f'UPDATE categories SET {assignments} WHERE id = ? AND version = ?'
+
+
+def _name_words(name_key: str) -> str:
+    return ' ' + ' '.join(sorted(tokenize(name_key)))
+
+
+def _field_values(fields: Tuple[str, ...], changed: Dict[str, Any]) -> List[Any]:
+    values = []
+    for name in fields:
+        value = changed[name]
+        if name == 'name':
+            name_key = value.casefold()
+            values += (value, name_key, _name_words(name_key))
+        elif name == 'is_active':
+            values.append(_is_active_value(value))
+        elif name == 'created_at':
+            values += (to_epoch_micros(value), utc_offset_seconds(value))
+        else:
+            values.append(value)
+    return values
+
+
+def _is_active_value(is_active: Optional[bool]) -> Optional[int]:
+    return None if is_active is None else int(bool(is_active))
+
+
+def _conditions(terms: int, is_active: bool) -> List[str]:
+    return (['IFNULL(is_active, 0) = ?'] if is_active else []) + ['name_words GLOB ?'] * terms
+
+
+def _where(conditions: List[str]) -> str:
+    return f' WHERE {" AND ".join(conditions)}' if conditions else ''
+
+
+@lru_cache(maxsize=None)
+def _search_statements(
+    column: str, reverse: bool, terms: int, is_active: bool, seek: bool
+) -> Tuple[str, str]:
+    """
+    The count and page queries for one shape of search, built once so sqlite3
+    reuses the prepared statements.
+    """
+    conditions = _conditions(terms, is_active)
+    count = f'SELECT COUNT(*) FROM categories{_where(conditions)}'
+    if seek:
+        conditions.append(f'({column}, id) {"<" if reverse else ">"} (?, ?)')
+    return count, f'{_scan_statement(column, reverse, conditions)} LIMIT ? OFFSET ?'
+
+
+@lru_cache(maxsize=None)
+def _scan_statements(column: str, reverse: bool, terms: int, is_active: bool) -> str:
+    return _scan_statement(column, reverse, _conditions(terms, is_active))
+
+
+def _scan_statement(column: str, reverse: bool, conditions: List[str]) -> str:
+    direction = 'DESC' if reverse else 'ASC'
+    return (
+        f'SELECT {_COLUMNS}, {column} FROM categories{_where(conditions)} '
+        f'ORDER BY {column} {direction}, id {direction}'
+    )
+
+
+class CategorySqliteRepository(CategoryRepository):
+    """
+    Stores categories in SQLite. Names are kept case-folded for sorting and as
+    their space separated words, so a term matches word prefixes exactly like
+    the in-memory repository. Ids are stored as their 16 bytes and created_at
+    as microseconds since the epoch plus its UTC offset; rows are read back
+    through the trusted construct path without validating them again. Cursors
+    seek on the (sort key, id) indexes instead of skipping rows with OFFSET.
+    Inserting an id that is already stored raises AlreadyExistsException.
+    Storing a deleted category removes its row, and inserting one stores
+    none: the B-tree indexes take a delete in O(log n), so there is no
+    tombstone to compact.
+    """
+
+    def __init__(self, connection: Optional[sqlite3.Connection] = None) -> None:
+        self.connection = connection or connect()
+        self.connection.executescript(_SCHEMA)
+
+    def insert(self, entity: Category) -> None:
+        if entity.deleted_at is not None:
+            return
+        try:
+            with self.connection:
+                self.connection.execute(_INSERT, self._to_row(entity))
+        except sqlite3.IntegrityError as ex:
+            raise AlreadyExistsException(f"Entity already exists using ID '{entity.id}'") from ex
+
+    def bulk_insert(self, entities: List[Category]) -> None:
+        entities = [entity for entity in entities if entity.deleted_at is None]
+        try:
+            with self.connection:
+                self.connection.executemany(_INSERT, map(self._to_row, entities))
+        except sqlite3.IntegrityError as ex:
+            entity_id = self._existing_id(entities)
+            raise AlreadyExistsException(f"Entity already exists using ID '{entity_id}'") from ex
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        row = self.connection.execute(_SELECT_BY_ID, (self._id_bytes(entity_id),)).fetchone()
+        if row is None:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+        return self._to_entity(row)
+
+    def find_all(self) -> List[Category]:
+        return [self._to_entity(row) for row in self.connection.execute(_SELECT_ALL)]
+
+    def update(self, entity: Category, expected_version: Optional[int] = None) -> None:
+        with self.connection:
+            cursor = self._write(entity, expected_version)
+        if cursor.rowcount == 0:
+            entity_id = self._id_bytes(entity.unique_entity_id)
+            row = self.connection.execute(_SELECT_VERSION, (entity_id,)).fetchone()
+            if row is None:
+                raise NotFoundException(f"Entity not found using ID '{entity.id}'")
+            raise ConcurrencyException(entity.id, expected_version, row[0])
+
+    def bulk_update(self, updates: Iterable[Tuple[Category, int]]) -> List[Category]:
+        """
+        The compare-and-swap of every pair in a single transaction, returning
+        the conflicting entities.
+        """
+        conflicts = []
+        with self.connection:
+            for entity, expected_version in updates:
+                if self._write(entity, expected_version).rowcount == 0:
+                    conflicts.append(entity)
+        return conflicts
+
+    def bulk_update_fields(
+        self, changes: Iterable[Tuple[Category, Dict[str, Any], int]]
+    ) -> List[Category]:
+        """
+        bulk_update setting only the columns of the changed fields and the
+        version, with one statement per set of changed fields, in a single
+        transaction.
+        """
+        conflicts = []
+        with self.connection:
+            for entity, changed, expected_version in changes:
+                if entity.deleted_at is not None or not changed.keys() <= _FIELD_COLUMNS.keys():
+                    cursor = self._write(entity, expected_version)
+                else:
+                    fields = tuple(sorted(changed))
+                    cursor = self.connection.execute(_update_fields_statement(fields), (
+                        *_field_values(fields, changed),
+                        entity.version,
+                        entity.unique_entity_id.bytes,
+                        expected_version
+                    ))
+                if cursor.rowcount == 0:
+                    conflicts.append(entity)
+        return conflicts
+
+    def _write(self, entity: Category, expected_version: Optional[int]) -> sqlite3.Cursor:
+        if entity.deleted_at is not None:
+            entity_id = self._id_bytes(entity.unique_entity_id)
+            if expected_version is None:
+                return self.connection.execute(_DELETE, (entity_id,))
+            return self.connection.execute(_DELETE_IF_VERSION, (entity_id, expected_version))
+        entity_id, *values = self._to_row(entity)
+        if expected_version is None:
+            return self.connection.execute(_UPDATE, (*values, entity_id))
+        return self.connection.execute(_UPDATE_IF_VERSION, (*values, entity_id, expected_version))
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        with self.connection:
+            cursor = self.connection.execute(_DELETE, (self._id_bytes(entity_id),))
+        if cursor.rowcount == 0:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+
+    def search(
+        self, input_params: CategoryRepository.SearchParams
+    ) -> CategoryRepository.SearchResult:
+        column, reverse = self._ordering(input_params.sort, input_params.sort_dir)
+        terms, params = self._filter(input_params.filter)
+        is_active = input_params.filter is not None and input_params.filter.is_active is not None
+        seek = input_params.cursor is not None
+        after = self._decode_cursor(input_params.cursor, column) if seek else []
+
+        if terms is None:
+            total, rows = 0, []
+        else:
+            count_sql, page_sql = _search_statements(column, reverse, len(terms), is_active, seek)
+            total = self.connection.execute(count_sql, params).fetchone()[0]
+            offset = 0 if seek else (input_params.page - 1) * input_params.per_page
+            # one extra row tells whether there is a next page
+            rows = self.connection.execute(
+                page_sql, params + after + [input_params.per_page + 1, offset]).fetchall()
+
+        next_cursor = None
+        if len(rows) > input_params.per_page:
+            del rows[input_params.per_page:]
+            *_, last_key = rows[-1]
+            next_cursor = encode_cursor([last_key, str(uuid.UUID(bytes=rows[-1][0]))])
+
+        return CategoryRepository.SearchResult(
+            items=[self._to_entity(row) for row in rows],
+            total=total,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter,
+            next_cursor=next_cursor
+        )
+
+    def scan(
+        self,
+        per_page: int = 1_000,
+        sort: Optional[str] = None,
+        sort_dir: Optional[str] = None,
+        filter_param: Optional[CategoryFilter | str] = None
+    ) -> Iterator[Category]:
+        """Streams one query through a database cursor, `per_page` rows per fetch."""
+        rows = self._scan_rows(per_page, sort, sort_dir, filter_param)
+        try:
+            yield from map(self._to_entity, rows)
+        finally:
+            rows.close()
+
+    def collect(
+        self,
+        sort: Optional[str] = None,
+        sort_dir: Optional[str] = None,
+        filter_param: Optional[CategoryFilter | str] = None
+    ) -> CategoryCollection:
+        """
+        The matching categories as a CategoryCollection, filled from the rows
+        without building them.
+        """
+        return CategoryCollection.from_rows(
+            (entity_id, name, description, is_active, created_at)
+            for entity_id, name, description, is_active, created_at, *_ in self._scan_rows(
+                10_000, sort, sort_dir, filter_param)
+        )
+
+    def _scan_rows(
+        self,
+        per_page: int,
+        sort: Optional[str],
+        sort_dir: Optional[str],
+        filter_param: Optional[CategoryFilter | str]
+    ) -> Iterator[Tuple[Any, ...]]:
+        params = self.SearchParams(sort=sort, sort_dir=sort_dir, filter=filter_param)
+        column, reverse = self._ordering(params.sort, params.sort_dir)
+        terms, values = self._filter(params.filter)
+        if terms is None:
+            return
+        is_active = params.filter is not None and params.filter.is_active is not None
+        statement = _scan_statements(column, reverse, len(terms), is_active)
+        cursor = self.connection.execute(statement, values)
+        try:
+            while rows := cursor.fetchmany(per_page):
+                yield from rows
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _filter(
+        filter_param: Optional[CategoryFilter]
+    ) -> Tuple[Optional[List[str]], List[Any]]:
+        """
+        The words of the term and the query parameters; words are None for a
+        term without any, which matches nothing.
+        """
+        filter_param = filter_param or CategoryFilter()
+        terms = sorted(tokenize(filter_param.term)) if filter_param.term else []
+        if filter_param.term and not terms:
+            return None, []
+        params: List[Any] = []
+        if filter_param.is_active is not None:
+            params.append(int(bool(filter_param.is_active)))
+        return terms, params + [f'* {term}*' for term in terms]
+
+    @staticmethod
+    def _ordering(sort: str | None, sort_dir: str | None) -> Tuple[str, bool]:
+        if sort in _SORT_COLUMNS:
+            return _SORT_COLUMNS[sort], sort_dir == 'desc'
+        return 'created_at', True
+
+    @staticmethod
+    def _decode_cursor(cursor: str, column: str) -> List[Any]:
+        key, entity_id = decode_cursor(cursor, 2)
+        key_type = str if column == 'name_key' else int
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(key) is not key_type or not isinstance(entity_id, str):
+            raise InvalidCursorException()
+        try:
+            return [key, uuid.UUID(entity_id).bytes]
+        except ValueError as ex:
+            raise InvalidCursorException() from ex
+
+    def _existing_id(self, entities: List[Category]) -> Optional[str]:
+        seen = set()
+        for entity in entities:
+            if entity.id in seen or self.connection.execute(
+                    _SELECT_VERSION, (entity.unique_entity_id.bytes,)).fetchone() is not None:
+                return entity.id
+            seen.add(entity.id)
+        return None
+
+    @staticmethod
+    def _id_bytes(entity_id: str | UniqueEntityId) -> bytes:
+        if isinstance(entity_id, UniqueEntityId):
+            return entity_id.bytes
+        try:
+            return uuid.UUID(str(entity_id)).bytes
+        except ValueError:
+            # no row can have it, let the lookup report it as not found
+            return b''
+
+    @staticmethod
+    def _to_row(entity: Category) -> Tuple[Any, ...]:
+        name_key = entity.name.casefold()
+        return (
+            entity.unique_entity_id.bytes,
+            entity.name,
+            name_key,
+            _name_words(name_key),
+            entity.description,
+            _is_active_value(entity.is_active),
+            to_epoch_micros(entity.created_at),
+            utc_offset_seconds(entity.created_at),
+            entity.version
+        )
+
+    @staticmethod
+    def _to_entity(row: Iterable[Any]) -> Category:
+        entity_id, name, description, is_active, created_at, created_at_offset, version, *_ = row
+        return Category.construct(
+            unique_entity_id=UniqueEntityId.from_bytes(entity_id),
+            name=name,
+            description=description,
+            is_active=None if is_active is None else bool(is_active),
+            created_at=from_epoch_micros(created_at, created_at_offset),
+            version=version
+        )
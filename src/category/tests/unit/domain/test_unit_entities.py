@@ -3,7 +3,16 @@ from datetime import date, datetime
 from unittest import mock
 from unittest.mock import patch
 import unittest
+import uuid
+from __seedwork.domain.value_objects import UniqueEntityId
 from category.domain.entities import Category
+from category.domain.events import (
+    CategoryActivated,
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryDeleted,
+    CategoryUpdated
+)
 
 
 class TestCategoryUnit(unittest.TestCase):
@@ -33,6 +42,57 @@ class TestCategoryUnit(unittest.TestCase):
             self.assertFalse(category.is_active)
             self.assertIsInstance(category.created_at, datetime)
 
+    def test_ids_are_random_unless_time_ordered_ones_are_asked_for(self):
+        with patch.object(Category, 'validate'):
+            self.assertEqual(uuid.UUID(Category(name='Movie').id).version, 4)
+            self.assertEqual(uuid.UUID(Category.construct(name='Movie').id).version, 4)
+            categories = [
+                Category(name=f'Movie {i}', unique_entity_id=UniqueEntityId.time_ordered())
+                for i in range(20)
+            ]
+        ids = [category.id for category in categories]
+        self.assertEqual({uuid.UUID(category_id).version for category_id in ids}, {7})
+        self.assertEqual(ids, sorted(ids))
+
+        rows = [{'name': f'Movie {i}'} for i in range(20)]
+        ids = [category.id for category in Category.bulk_create(rows)]
+        self.assertEqual({uuid.UUID(category_id).version for category_id in ids}, {4})
+        ids = [category.id for category in Category.bulk_create(rows, time_ordered=True)]
+        self.assertEqual({uuid.UUID(category_id).version for category_id in ids}, {7})
+        self.assertEqual(ids, sorted(ids))
+
+    def test_a_subclass_can_make_time_ordered_ids(self):
+        class TimeOrderedCategory(Category):
+            _new_id = UniqueEntityId.time_ordered
+
+        ids = [
+            TimeOrderedCategory(name='Movie').id,
+            TimeOrderedCategory.construct(name='Movie').id,
+            *(category.id for category in TimeOrderedCategory.bulk_create([{'name': 'Movie'}]))
+        ]
+        self.assertEqual({uuid.UUID(category_id).version for category_id in ids}, {7})
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(uuid.UUID(Category(name='Movie').id).version, 4)
+
+    def test_construct_skips_validation(self):
+        with patch.object(Category, 'validate') as mock_validate_method:
+            category = Category.construct(name='Movie', is_active=False)
+            mock_validate_method.assert_not_called()
+            self.assertEqual(category.name, 'Movie')
+            self.assertFalse(category.is_active)
+            self.assertIsInstance(category.created_at, datetime)
+
+    def test_construct_matches_constructor(self):
+        category = Category(name='Movie', description='some description', is_active=False)
+        self.assertEqual(Category.construct(
+            unique_entity_id=category.unique_entity_id,
+            name='Movie',
+            description='some description',
+            is_active=False,
+            created_at=category.created_at
+        ), category)
+        self.assertIsInstance(Category(name='Movie', created_at=None).created_at, datetime)
+
     def test_if_created_is_generated_in_constructor(self):
         with patch.object(Category, 'validate'):
             category_1 = Category(name="Movie 1")
@@ -67,4 +127,56 @@ class TestCategoryUnit(unittest.TestCase):
             value_object.deactivate()
             self.assertFalse(value_object.is_active)
 
-    
+    def test_records_domain_events(self):
+        category = Category.create(name='Movie', description='some description')
+        self.assertEqual(category.pull_events(), [CategoryCreated(
+            aggregate_id=category.id,
+            occurred_at=category.created_at,
+            name='Movie',
+            description='some description',
+            is_active=True
+        )])
+        self.assertEqual(Category(name='Movie').domain_events, ())
+
+        category.update('Documentary', None)
+        category.deactivate()
+        category.activate()
+        recorded = category.pull_events()
+        self.assertEqual([event.__class__ for event in recorded],
+                         [CategoryUpdated, CategoryDeactivated, CategoryActivated])
+        self.assertEqual((recorded[0].name, recorded[0].description), ('Documentary', None))
+        self.assertEqual({event.aggregate_id for event in recorded}, {category.id})
+
+
+    def test_mutators_bump_the_version(self):
+        category = Category(name='Movie')
+        self.assertEqual(category.version, 0)
+        category.update('Documentary', None)
+        category.deactivate()
+        category.activate()
+        self.assertEqual(category.version, 3)
+        self.assertEqual(Category.construct(name='Movie', version=3).version, 3)
+
+    def test_no_op_changes_are_skipped(self):
+        category = Category(name='Movie', description='description')
+        category.activate()
+        category.update('Movie', 'description')
+        self.assertEqual(
+            (category.version, category.domain_events, category.changed_fields()), (0, (), {}))
+
+        category.deactivate()
+        category.deactivate()
+        category.update('Movie', 'other description')
+        self.assertEqual(category.version, 2)
+        self.assertEqual(
+            category.changed_fields(), {'is_active': False, 'description': 'other description'})
+        self.assertEqual([event.__class__ for event in category.pull_events()],
+                         [CategoryDeactivated, CategoryUpdated])
+
+    def test_category_should_delete_once(self):
+        category = Category(name='Movie')
+        self.assertEqual(category.delete(), 'Category Movie has been deleted')
+        category.delete()
+        self.assertEqual(category.version, 1)
+        self.assertEqual(category.pull_events(), [
+            CategoryDeleted(aggregate_id=category.id, occurred_at=category.deleted_at)])
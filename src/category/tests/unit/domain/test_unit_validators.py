@@ -0,0 +1,48 @@
+import unittest
+from category.domain.validators import CategoryValidator
+
+
+class TestCategoryValidatorUnit(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.validator = CategoryValidator()
+
+    def test_valid_payload(self):
+        self.assertTrue(self.validator.validate({'name': 'Movie', 'extra': 'ignored'}))
+        self.assertIsNone(self.validator.errors)
+        self.assertEqual(self.validator.validated_data,
+                         {'name': 'Movie', 'description': None, 'is_active': True})
+
+    def test_gathers_every_invalid_field(self):
+        self.assertFalse(
+            self.validator.validate({'name': 't' * 256, 'description': 5, 'is_active': 'yes'}))
+        self.assertEqual(self.validator.errors, {
+            'name': ['Field name length should be smaller than 255'],
+            'description': ['Field description must be a string'],
+            'is_active': ['The is_active must be a bool value'],
+        })
+        self.assertIsNone(self.validator.validated_data)
+
+        self.assertTrue(self.validator.validate({'name': 'Movie'}))
+        self.assertIsNone(self.validator.errors)
+
+    def test_validate_batch(self):
+        table = self.validator.validate_batch([
+            {'name': 'Movie'},
+            {'description': 5},
+            {'name': 'Drama', 'is_active': False},
+            {'name': 5, 'is_active': 'no'},
+        ])
+        self.assertEqual(list(table), [
+            (1, 'name', ['Field name is required']),
+            (1, 'description', ['Field description must be a string']),
+            (3, 'name', ['Field name must be a string']),
+            (3, 'is_active', ['The is_active must be a bool value']),
+        ])
+        self.assertEqual(table.invalid_rows(), [1, 3])
+        self.assertEqual(table.by_row()[3], {
+            'name': ['Field name must be a string'],
+            'is_active': ['The is_active must be a bool value'],
+        })
+        self.assertEqual(len(self.validator.validate_batch([{'name': 'Movie'}] * 3)), 0)
+        self.assertEqual(len(self.validator.validate_batch([])), 0)
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+import random
+import unittest
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter
+from category.infra.collections import CategoryCollection
+from category.infra.repositories import CategoryInMemoryRepository
+from category.infra.sqlite import CategorySqliteRepository
+
+
+class TestCategoryCollection(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rand = random.Random(5)
+        words = ['action', 'drama', 'Kids', 'comedy', 'Ação']
+        now = datetime(2022, 6, 1)
+        self.items = [
+            Category(
+                name=' '.join(rand.sample(words, 2)),
+                description=rand.choice([None, 'some description']),
+                is_active=rand.random() < 0.6,
+                created_at=now + timedelta(minutes=rand.randint(0, 30))
+            )
+            for _ in range(80)
+        ]
+        self.collection = CategoryCollection.from_categories(self.items)
+
+    def test_reads_back_the_categories(self):
+        self.assertEqual(len(self.collection), 80)
+        self.assertEqual(list(self.collection), self.items)
+        self.assertEqual(self.collection[-1].to_dict(), self.items[-1].to_dict())
+        self.assertEqual(list(self.collection[10:20:3]), self.items[10:20:3])
+        self.assertEqual(self.collection.id_at(3), self.items[3].id)
+        self.assertEqual(self.collection.count_active(), sum(item.is_active for item in self.items))
+        with self.assertRaises(IndexError):
+            self.collection[80]  # pylint: disable=pointless-statement
+        self.assertEqual(list(CategoryCollection()), [])
+
+    def test_is_active_none_comes_back_as_none(self):
+        items = [Category(name=name, is_active=is_active)
+                 for name, is_active in [('a', None), ('b', True), ('c', False)]]
+        collection = CategoryCollection.from_categories(items)
+        self.assertEqual([category.is_active for category in collection], [None, True, False])
+        self.assertEqual([category.is_active for category in collection[::-1]],
+                         [False, True, None])
+        self.assertEqual(collection.count_active(), 1)
+        self.assertEqual([category.name for category in collection.filter(
+            CategoryFilter(is_active=False))], ['a', 'c'])
+
+    def test_interns_names(self):
+        first, second = [
+            position for position, item in enumerate(self.items) if item.name == self.items[0].name
+        ][:2]
+        self.assertIs(self.collection[first].name, self.collection[second].name)
+
+    def test_filter_and_sort_match_the_repository(self):
+        repo = CategoryInMemoryRepository(self.items)
+        filters = [None, 'dra', 'kids AÇ', '---', CategoryFilter(is_active=False),
+                   CategoryFilter(term='c', is_active=True)]
+        for filter_param in filters:
+            orders = [('name', False), ('name', True), ('created_at', False), ('created_at', True)]
+            for sort, reverse in orders:
+                self.assertEqual(
+                    list(self.collection.filter(filter_param).sort(sort, reverse)),
+                    list(repo.scan(sort=sort, sort_dir='desc' if reverse else 'asc',
+                                   filter_param=filter_param)),
+                    (filter_param, sort, reverse)
+                )
+        with self.assertRaises(ValueError):
+            self.collection.sort('description')
+
+    def test_collect_from_sqlite(self):
+        repo = CategorySqliteRepository()
+        repo.bulk_insert(self.items)
+        collection = repo.collect(sort='name', filter_param=CategoryFilter(is_active=True))
+        self.assertEqual(
+            list(collection),
+            list(repo.scan(sort='name', filter_param=CategoryFilter(is_active=True))))
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+import io
+import json
+import unittest
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter
+from category.infra.exporters import export_categories
+from category.infra.importers import import_categories
+from category.infra.repositories import CategoryInMemoryRepository
+from category.infra.sqlite import CategorySqliteRepository
+
+
+class TestExportCategories(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.now = datetime(2022, 6, 1)
+        self.items = [
+            Category(
+                name=f'Category, "{i}"',
+                description='some description' if i % 2 else None,
+                is_active=i % 3 != 0,
+                created_at=self.now + timedelta(minutes=i)
+            )
+            for i in range(20)
+        ]
+        self.repo = CategorySqliteRepository()
+        self.repo.bulk_insert(self.items)
+
+    def test_export_round_trips_through_the_importer(self):
+        for file_format in ['jsonl', 'csv']:
+            text = io.StringIO()
+            export_categories(self.repo, text, file_format, chunk_size=256, per_page=3)
+            text.seek(0)
+
+            imported = CategoryInMemoryRepository()
+            result = import_categories(text, imported, file_format, workers=0)
+            self.assertEqual(result.errors, [], file_format)
+            self.assertEqual(
+                [category.to_dict() for category in imported.scan()],
+                [category.to_dict() for category in self.repo.scan()],
+                file_format
+            )
+
+    def test_export_filtered_to_a_binary_file(self):
+        binary = io.BytesIO()
+        export_categories(
+            self.repo, binary, filter_param=CategoryFilter(is_active=False), sort='name')
+        lines = binary.getvalue().decode().splitlines()
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(json.loads(lines[0])['name'], 'Category, "0"')
+
+    def test_same_instant_in_other_timezones_keeps_its_offset(self):
+        repo = CategoryInMemoryRepository()
+        utc = Category(name='utc', created_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc))
+        brt = Category(
+            name='brt', created_at=datetime(2024, 1, 1, 9, tzinfo=timezone(timedelta(hours=-3))))
+        repo.bulk_insert([utc, brt])
+        formats = [('jsonl', '"2024-01-01T09:00:00-03:00"'), ('csv', '2024-01-01T09:00:00-03:00')]
+        for file_format, expected in formats:
+            text = io.StringIO()
+            export_categories(repo, text, file_format, sort='name')
+            line = text.getvalue().splitlines()[1 if file_format == 'csv' else 0]
+            self.assertIn(expected, line, file_format)
+            self.assertIn('2024-01-01T12:00:00+00:00', text.getvalue(), file_format)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            export_categories(self.repo, io.StringIO(), 'xml')
@@ -0,0 +1,141 @@
+from datetime import datetime
+import io
+import os
+import tempfile
+import unittest
+from category.domain.entities import Category
+from category.infra.importers import (
+    ImportResult,
+    RowError,
+    import_categories,
+    read_chunks,
+    validate_chunk
+)
+from category.infra.repositories import CategoryInMemoryRepository
+
+
+CSV = '''name,description,is_active,created_at
+Movie,,true,2022-06-01T10:00:00
+"Multi
+line",some description,FALSE,
+,missing name,,
+Documentary,,maybe,
+Kids,,,not a date
+Drama,,no,
+Series,,1,
+'''
+
+JSONL = '''{"name": "Movie"}
+
+{"name": "Documentary", "description": "some description", "is_active": false}
+not json
+["Movie"]
+{"name": 5}
+{"id": "fake id", "name": "Kids"}
+{"id": "0e65e9a9-bef3-4b26-9d33-2e0aaf26bbae", "name": "Series", \
+"created_at": "2022-06-01T10:00:00"}
+'''
+
+
+class TestImportCategories(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = CategoryInMemoryRepository()
+
+    def test_read_chunks(self):
+        chunks = list(read_chunks(io.StringIO(CSV), 'csv', 3))
+        self.assertEqual([len(records) for _, records in chunks], [3, 3, 1])
+        header, records = chunks[0]
+        self.assertEqual(header, ['name', 'description', 'is_active', 'created_at'])
+        self.assertEqual([line for line, _ in records], [2, 3, 5])
+        self.assertEqual(records[1][1][0], 'Multi\nline')
+
+        chunks = list(read_chunks(io.StringIO(JSONL), 'jsonl', 4))
+        self.assertEqual(
+            [[line for line, _ in records] for _, records in chunks], [[1, 3, 4, 5], [6, 7, 8]])
+        self.assertEqual(list(read_chunks(io.StringIO(''), 'csv', 3)), [])
+
+    def test_validate_chunk(self):
+        columns, errors = validate_chunk(
+            ['name', 'is_active'], [(2, ['Movie', 'no']), (3, ['', '']), (4, ['a'])])
+        self.assertEqual(columns['name'], ['Movie'])
+        self.assertEqual(columns['is_active'], [False])
+        self.assertEqual(columns['line'], [2])
+        self.assertEqual(errors, [
+            RowError(3, {'name': ['Field name is required']}),
+            RowError(4, {'row': ['Expected 2 fields, found 1']}),
+        ])
+
+    def test_import_csv(self):
+        result = import_categories(
+            io.StringIO(CSV), self.repo, file_format='csv', chunk_size=2, workers=0)
+        self.assertEqual(result.imported, 4)
+        self.assertEqual(result.errors, [
+            RowError(5, {'name': ['Field name is required']}),
+            RowError(6, {'is_active': ['The is_active must be a bool value']}),
+            RowError(7, {'created_at': ['Field created_at must be an ISO 8601 datetime']}),
+        ])
+        categories = {category.name: category for category in self.repo.find_all()}
+        self.assertEqual(list(categories), ['Movie', 'Multi\nline', 'Drama', 'Series'])
+        self.assertEqual(categories['Movie'].created_at, datetime(2022, 6, 1, 10))
+        self.assertIsNone(categories['Movie'].description)
+        self.assertEqual(
+            [category.is_active for category in categories.values()], [True, False, False, True])
+
+    def test_import_jsonl(self):
+        result = import_categories(
+            io.StringIO(JSONL), self.repo, file_format='jsonl', chunk_size=3, workers=0)
+        self.assertEqual(result.imported, 3)
+        self.assertEqual(result.errors, [
+            RowError(4, {'row': ['Line is not valid JSON']}),
+            RowError(5, {'row': ['Line must be a JSON object']}),
+            RowError(6, {'name': ['Field name must be a string']}),
+            RowError(7, {'id': ['ID must be a valid uuid']}),
+        ])
+        series = self.repo.find_by_id('0e65e9a9-bef3-4b26-9d33-2e0aaf26bbae')
+        self.assertEqual((series.name, series.created_at), ('Series', datetime(2022, 6, 1, 10)))
+        self.assertIsInstance(series, Category)
+
+    def test_import_normalizes_ids(self):
+        result = import_categories(io.StringIO(
+            '{"id": 12345678123456781234567812345678, "name": "Movie"}\n'
+            '{"id": "{0E65E9A9-BEF3-4B26-9D33-2E0AAF26BBAE}", "name": "Series"}\n'
+            '{"id": ["fake"], "name": "Kids"}\n'
+        ), self.repo, file_format='jsonl', workers=0)
+        self.assertEqual(result.imported, 2)
+        self.assertEqual(result.errors, [RowError(3, {'id': ['ID must be a valid uuid']})])
+        movie = self.repo.find_by_id('12345678-1234-5678-1234-567812345678')
+        series = self.repo.find_by_id('0e65e9a9-bef3-4b26-9d33-2e0aaf26bbae')
+        self.assertEqual((movie.name, series.name), ('Movie', 'Series'))
+
+    def test_import_csv_file_with_a_byte_order_mark(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'categories.csv')
+            with open(path, 'w', encoding='utf-8-sig') as file:
+                file.write('id,name\n0e65e9a9-bef3-4b26-9d33-2e0aaf26bbae,Movie\n')
+            result = import_categories(path, self.repo, file_format='csv', workers=0)
+        self.assertEqual((result.imported, result.errors), (1, []))
+        self.assertEqual(self.repo.find_by_id('0e65e9a9-bef3-4b26-9d33-2e0aaf26bbae').name, 'Movie')
+
+    def test_import_file_on_a_process_pool(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'categories.jsonl')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(JSONL * 20)
+            result = import_categories(path, self.repo, chunk_size=16, workers=2, max_pending=2)
+
+        # every copy of the file has the same Series id
+        self.assertEqual(result.imported, 41)
+        self.assertEqual(len(self.repo.find_all()), 41)
+        self.assertEqual(
+            [error.line for error in result.errors[:9]], [4, 5, 6, 7, 12, 13, 14, 15, 16])
+        self.assertEqual(result.errors[8].errors, {'id': ['ID already exists']})
+        self.assertEqual(len(result.errors), 20 * 4 + 19)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            import_categories(io.StringIO(CSV), self.repo)
+        with self.assertRaises(ValueError):
+            import_categories('categories.xml', self.repo)
+        self.assertEqual(
+            import_categories(io.StringIO(''), self.repo, 'csv', workers=0), ImportResult())
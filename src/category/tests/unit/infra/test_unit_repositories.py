@@ -0,0 +1,353 @@
+from datetime import datetime, timedelta
+import random
+import unittest
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.repositories import CategoryCachedRepository, CategoryInMemoryRepository
+from __seedwork.domain.exceptions import (
+    AlreadyExistsException,
+    ConcurrencyException,
+    InvalidCursorException,
+    NotFoundException
+)
+
+
+class TestCategoryInMemoryRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = CategoryInMemoryRepository()
+        self.now = datetime(2022, 6, 1)
+
+    def _category(self, name: str, minutes: int = 0, **kwargs) -> Category:
+        return Category(name=name, created_at=self.now + timedelta(minutes=minutes), **kwargs)
+
+    def test_sortable_fields(self):
+        self.assertEqual(self.repo.sortable_fields, ['name', 'created_at'])
+
+    def test_search_params_normalize_filter(self):
+        self.assertIsNone(CategoryRepository.SearchParams(filter='').filter)
+        self.assertIsNone(CategoryRepository.SearchParams(filter=CategoryFilter()).filter)
+        self.assertEqual(
+            CategoryRepository.SearchParams(filter='movie').filter,
+            CategoryFilter(term='movie')
+        )
+        self.assertEqual(
+            CategoryRepository.SearchParams(filter=CategoryFilter(term='', is_active=False)).filter,
+            CategoryFilter(is_active=False)
+        )
+
+    def test_search_sorts_by_created_at_desc_by_default(self):
+        items = [self._category(f'c{i}', minutes=i) for i in range(4)]
+        self.repo.bulk_insert([items[2], items[0], items[3], items[1]])
+
+        result = self.repo.search(CategoryRepository.SearchParams(per_page=3))
+        self.assertEqual(result.items, [items[3], items[2], items[1]])
+        self.assertEqual(result.total, 4)
+        self.assertEqual(result.last_page, 2)
+
+        result = self.repo.search(CategoryRepository.SearchParams(page=2, per_page=3))
+        self.assertEqual(result.items, [items[0]])
+
+    def test_insert_an_existing_id_keeps_the_indexes(self):
+        items = [self._category(f'c{i}', minutes=i) for i in range(100)]
+        self.repo.bulk_insert(items)
+
+        copy = Category(unique_entity_id=items[0].unique_entity_id, name='Movie')
+        with self.assertRaises(AlreadyExistsException):
+            self.repo.insert(copy)
+        with self.assertRaises(AlreadyExistsException):
+            self.repo.bulk_insert([self._category(f'd{i}') for i in range(70)] + [copy])
+        result = self.repo.search(CategoryRepository.SearchParams(per_page=200, sort='name'))
+        self.assertEqual(result.items, sorted(items, key=lambda item: item.name))
+        self.assertEqual(self.repo.search(CategoryRepository.SearchParams(filter='movie')).total, 0)
+
+    def test_search_sorted_by_name(self):
+        items = [self._category(name) for name in ['b', 'a', 'D', 'c']]
+        self.repo.bulk_insert(items)
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            per_page=2, sort='name', sort_dir='asc'))
+        self.assertEqual(result.items, [items[1], items[0]])
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            page=2, per_page=2, sort='name', sort_dir='desc'))
+        self.assertEqual(result.items, [items[0], items[1]])
+
+    def test_search_with_term_matches_word_prefixes(self):
+        items = [
+            self._category('Action Movies', 1),
+            self._category('Movies for kids', 2),
+            self._category('Documentary', 3),
+            self._category('action series', 4, is_active=False),
+        ]
+        self.repo.bulk_insert(items)
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            filter='ACT', sort='name', sort_dir='asc'))
+        self.assertEqual(result.items, [items[0], items[3]])
+        self.assertEqual(result.total, 2)
+
+        result = self.repo.search(CategoryRepository.SearchParams(filter='mov act'))
+        self.assertEqual(result.items, [items[0]])
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            filter=CategoryFilter(term='act', is_active=True)))
+        self.assertEqual(result.items, [items[0]])
+
+        result = self.repo.search(CategoryRepository.SearchParams(filter='---'))
+        self.assertEqual(result.items, [])
+        self.assertEqual(result.total, 0)
+
+    def test_search_by_is_active(self):
+        items = [self._category(f'c{i}', i, is_active=i % 3 == 0) for i in range(7)]
+        self.repo.bulk_insert(items)
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            per_page=2, filter=CategoryFilter(is_active=True), sort='created_at'))
+        self.assertEqual(result.items, [items[0], items[3]])
+        self.assertEqual(result.total, 3)
+
+        result = self.repo.search(CategoryRepository.SearchParams(
+            page=2, per_page=3, filter=CategoryFilter(is_active=False)))
+        self.assertEqual(result.items, [items[1]])
+        self.assertEqual(result.total, 4)
+
+    def test_update_reindexes_the_entity(self):
+        category = self._category('Movie')
+        self.repo.insert(category)
+        category.update('Documentary', None)
+        category.deactivate()
+        self.repo.update(category)
+
+        params = CategoryRepository.SearchParams(filter='movie')
+        self.assertEqual(self.repo.search(params).total, 0)
+        params = CategoryRepository.SearchParams(filter=CategoryFilter(term='doc', is_active=False))
+        self.assertEqual(self.repo.search(params).items, [category])
+
+    def test_update_of_is_active_only_flips_the_bit(self):
+        category = self._category('Movie')
+        self.repo.insert(category)
+        category.deactivate()
+        self.repo.update(category)
+        params = CategoryRepository.SearchParams(filter=CategoryFilter(term='mov', is_active=False))
+        self.assertEqual(self.repo.search(params).items, [category])
+        params = CategoryRepository.SearchParams(filter=CategoryFilter(is_active=True))
+        self.assertEqual(self.repo.search(params).total, 0)
+
+    def test_conflicting_update_leaves_the_indexes(self):
+        category = self._category('Movie')
+        self.repo.insert(category)
+        first, second = category.copy(), category.copy()
+        first.update('Documentary', None)
+        second.update('Music', None)
+
+        self.repo.update(first, expected_version=0)
+        with self.assertRaises(ConcurrencyException):
+            self.repo.update(second, expected_version=0)
+        params = CategoryRepository.SearchParams(filter='doc')
+        self.assertEqual(self.repo.search(params).items, [first])
+        self.assertEqual(self.repo.search(CategoryRepository.SearchParams(filter='music')).total, 0)
+
+    def test_delete_hides_the_category_until_compaction_reuses_its_slot(self):
+        first, second = self._category('Movie'), self._category('Music', is_active=False)
+        self.repo.insert(first)
+        self.repo.delete(first.id)
+        self.repo.insert(second)
+
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(first.id)
+        params = CategoryRepository.SearchParams(filter='m')
+        self.assertEqual(self.repo.search(params).items, [second])
+        self.assertEqual(self.repo.search(CategoryRepository.SearchParams()).items, [second])
+        params = CategoryRepository.SearchParams(filter=CategoryFilter(is_active=True))
+        self.assertEqual(self.repo.search(params).total, 0)
+        params = CategoryRepository.SearchParams(filter=CategoryFilter(is_active=False))
+        self.assertEqual(self.repo.search(params).items, [second])
+
+        while self.repo.compact(budget=1):
+            pass
+        self.assertEqual(list(self.repo.items), [second.id])
+        self.assertEqual(self.repo._slots, {second.id: 1})
+        third = self._category('Docs')
+        self.repo.insert(third)
+        self.assertEqual(self.repo._slots[third.id], 0)
+
+    def test_update_a_deleted_category_tombstones_it(self):
+        category = self._category('Movie')
+        self.repo.insert(category)
+        deleted = category.copy()
+        deleted.delete()
+        self.repo.update(deleted, expected_version=0)
+        self.assertEqual(self.repo.search(CategoryRepository.SearchParams(filter='movie')).total, 0)
+        self.assertEqual(self.repo.find_all(), [])
+
+    def test_insert_a_deleted_category_tombstones_it(self):
+        for count in [3, 100]:
+            repo = CategoryInMemoryRepository()
+            items = [self._category(f'c{i}', i) for i in range(count)]
+            items[1].delete()
+            repo.bulk_insert(items)
+            deleted = self._category('Movie')
+            deleted.delete()
+            repo.insert(deleted)
+
+            result = repo.search(CategoryRepository.SearchParams(per_page=200))
+            self.assertEqual(result.items, [*reversed(items[2:]), items[0]])
+            self.assertEqual(repo.search(CategoryRepository.SearchParams(filter='movie')).total, 0)
+            with self.assertRaises(NotFoundException):
+                repo.find_by_id(items[1].id)
+            while repo.compact():
+                pass
+            self.assertEqual(len(repo._by_name), count - 1)
+
+    def test_insert_again_during_compaction(self):
+        items = [self._category(f'c{i}', i) for i in range(10)]
+        self.repo.bulk_insert(items)
+        for item in items[:6]:
+            self.repo.delete(item.id)
+        self.assertTrue(self.repo.compact(budget=4))
+        self.repo.insert(items[0])
+        self.repo.delete(items[7].id)
+        while self.repo.compact(budget=4):
+            pass
+
+        self.assertEqual(self.repo.tombstones, {})
+        expected = [items[9], items[8], items[6], items[0]]
+        self.assertEqual(list(self.repo.scan(per_page=3)), expected)
+        self.assertEqual(list(self.repo.scan(per_page=3, filter_param='c')), expected)
+        self.assertEqual((len(self.repo._by_name), len(self.repo._by_created_at)), (4, 4))
+
+    def test_search_matches_a_full_scan(self):
+        rand = random.Random(7)
+        words = ['action', 'drama', 'kids', 'comedy', 'horror', 'docs']
+        items = [
+            self._category(
+                ' '.join(rand.sample(words, 2)) + f' {i}',
+                rand.randint(0, 500),
+                is_active=rand.random() < 0.7
+            )
+            for i in range(300)
+        ]
+        self.repo.bulk_insert(items[:200])
+        for item in items[200:]:
+            self.repo.insert(item)
+        deleted = set(rand.sample(range(300), 60))
+        for position in deleted:
+            self.repo.delete(items[position].id)
+        # a compaction pass left halfway through
+        for _ in range(3):
+            self.repo.compact(budget=50)
+        items = [item for position, item in enumerate(items) if position not in deleted]
+
+        filters = [None, 'dra', 'kids hor', CategoryFilter(is_active=False),
+                   CategoryFilter(term='c', is_active=True)]
+        for filter_param in filters:
+            orders = [('name', 'asc'), ('name', 'desc'), ('created_at', 'asc'), (None, None)]
+            for sort, sort_dir in orders:
+                params = CategoryRepository.SearchParams(
+                    page=2, per_page=20, sort=sort, sort_dir=sort_dir, filter=filter_param)
+                expected = self._scan(items, params)
+                result = self.repo.search(params)
+                self.assertEqual(result.total, len(expected), params)
+                self.assertEqual(result.items, expected[20:40], params)
+
+    def test_search_with_cursor_walks_the_same_pages(self):
+        rand = random.Random(3)
+        items = [
+            self._category(rand.choice(['Drama', 'drama kids', 'Docs']), rand.randint(0, 20),
+                           is_active=rand.random() < 0.5)
+            for _ in range(60)
+        ]
+        self.repo.bulk_insert(items)
+
+        filters = [None, 'dra', CategoryFilter(is_active=True),
+                   CategoryFilter(term='d', is_active=False)]
+        for filter_param in filters:
+            orders = [('name', 'asc'), ('name', 'desc'), ('created_at', 'asc'), (None, None)]
+            for sort, sort_dir in orders:
+                pages, cursor = [], None
+                while True:
+                    result = self.repo.search(CategoryRepository.SearchParams(
+                        per_page=7, sort=sort, sort_dir=sort_dir, filter=filter_param,
+                        cursor=cursor))
+                    pages.append(result.items)
+                    cursor = result.next_cursor
+                    if cursor is None:
+                        break
+                expected = [
+                    self.repo.search(CategoryRepository.SearchParams(
+                        page=page, per_page=7, sort=sort, sort_dir=sort_dir,
+                        filter=filter_param)).items
+                    for page in range(1, result.last_page + 1)
+                ] or [[]]
+                self.assertEqual(pages, expected, (filter_param, sort, sort_dir))
+
+    def test_search_cursor_survives_removing_its_item(self):
+        items = [self._category(f'c{i}', i) for i in range(5)]
+        self.repo.bulk_insert(items)
+        result = self.repo.search(CategoryRepository.SearchParams(per_page=2))
+        self.assertEqual(result.items, [items[4], items[3]])
+
+        self.repo.delete(items[3].id)
+        result = self.repo.search(
+            CategoryRepository.SearchParams(per_page=2, cursor=result.next_cursor))
+        self.assertEqual(result.items, [items[2], items[1]])
+
+    def test_scan(self):
+        items = [self._category(f'c{i}', i, is_active=i % 2 == 0) for i in range(25)]
+        self.repo.bulk_insert(items)
+        self.assertEqual(list(self.repo.scan(per_page=7)), items[::-1])
+        self.assertEqual(
+            list(self.repo.scan(
+                per_page=4, sort='name', filter_param=CategoryFilter(is_active=False))),
+            sorted(items[1::2], key=lambda item: item.name)
+        )
+        self.assertEqual(list(CategoryInMemoryRepository().scan()), [])
+
+    def test_search_with_invalid_cursor(self):
+        with self.assertRaises(InvalidCursorException):
+            self.repo.search(CategoryRepository.SearchParams(cursor='fake'))
+
+    @staticmethod
+    def _scan(items, params):
+        term, is_active = (
+            (params.filter.term, params.filter.is_active) if params.filter else (None, None))
+        matches = [
+            item for item in items
+            if (is_active is None or item.is_active == is_active)
+            and (term is None or all(
+                any(word.startswith(prefix) for word in item.name.casefold().split())
+                for prefix in term.casefold().split()))
+        ]
+        if params.sort == 'name':
+            key = lambda item: (item.name.casefold(), item.id)
+        else:
+            key = lambda item: (item.created_at, item.id)
+        return sorted(matches, key=key, reverse=params.sort_dir == 'desc' or params.sort is None)
+
+
+class TestCategoryCachedRepository(unittest.TestCase):
+
+    def test_pages_are_cached_until_a_category_changes(self):
+        repo = CategoryCachedRepository(CategoryInMemoryRepository())
+        items = [
+            Category(name=f'c{i}', created_at=datetime(2022, 6, 1) + timedelta(minutes=i))
+            for i in range(5)
+        ]
+        repo.bulk_insert(items)
+        params = CategoryRepository.SearchParams(per_page=2, filter=CategoryFilter(is_active=True))
+        first = repo.search(params)
+        self.assertEqual(repo.search(params), first)
+        self.assertEqual((first.items, repo.page_stats.hits), ([items[4], items[3]], 1))
+
+        expected_version = items[4].version
+        items[4].deactivate()
+        repo.update(items[4], expected_version)
+        self.assertEqual(repo.search(params).items, [items[3], items[2]])
+        self.assertEqual(repo.page_stats.stale, 1)
+
+    def test_cursor_pages_are_not_cached(self):
+        repo = CategoryCachedRepository(CategoryInMemoryRepository())
+        repo.bulk_insert([Category(name=f'c{i}') for i in range(5)])
+        self.assertEqual(len(list(repo.scan(per_page=2))), 5)
+        self.assertEqual(len(repo.pages), 1)
@@ -0,0 +1,35 @@
+import unittest
+from __seedwork.infra.events import InProcessEventBus
+from category.domain.entities import Category
+from category.domain.events import CategoryDeleted
+from category.infra.search import CategorySearchIndex
+
+
+class TestCategorySearchIndex(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.movies = Category(name='Filmes', description='Filmes de ação')
+        self.action = Category(name='Ação')
+        self.index = CategorySearchIndex([self.movies, self.action])
+
+    def test_searches_names_and_descriptions(self):
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual([category_id for category_id, _ in self.index.search('acao')],
+                         [self.action.id, self.movies.id])
+        self.assertEqual([category_id for category_id, _ in self.index.search('fil', prefix=True)],
+                         [self.movies.id])
+
+    async def test_follows_the_category_events(self):
+        bus = InProcessEventBus()
+        self.index.subscribe(bus)
+        drama = Category.create(name='Drama', description='Drama e ação')
+        self.action.update('Aventura', None)
+        await bus.publish([*drama.pull_events(), *self.action.pull_events()])
+
+        self.assertEqual({category_id for category_id, _ in self.index.search('acao')},
+                         {self.movies.id, drama.id})
+        self.assertEqual([category_id for category_id, _ in self.index.search('aventura')],
+                         [self.action.id])
+
+        await bus.publish([CategoryDeleted(aggregate_id=self.movies.id)])
+        self.assertEqual([category_id for category_id, _ in self.index.search('acao')], [drama.id])
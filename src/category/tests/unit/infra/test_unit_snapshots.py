@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+import os
+import random
+import tempfile
+import unittest
+from __seedwork.domain.exceptions import NotFoundException
+from category.domain.entities import Category
+from category.infra.snapshots import CategorySnapshot, write_snapshot
+
+
+class TestCategorySnapshot(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rand = random.Random(5)
+        words = ['action', 'drama', 'Kids', 'comedy', 'Ação']
+        now = datetime(2022, 6, 1)
+        self.items = [
+            Category(
+                name=' '.join(rand.sample(words, 2)),
+                description=rand.choice([None, '', 'some description']),
+                is_active=rand.random() < 0.6,
+                created_at=now + timedelta(minutes=rand.randint(0, 30))
+            )
+            for _ in range(80)
+        ]
+        self.items[0].deactivate()
+        self.items[1].delete()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'categories.snapshot')
+        self.assertEqual(write_snapshot(self.items, self.path), 79)
+        del self.items[1]
+        self.snapshot = CategorySnapshot(self.path)
+        self.addCleanup(self.snapshot.close)
+
+    def test_reads_back_the_categories(self):
+        self.assertEqual(len(self.snapshot), 79)
+        self.assertEqual(list(self.snapshot), self.items)
+        self.assertEqual([category.to_dict() for category in self.snapshot],
+                         [category.to_dict() for category in self.items])
+        self.assertEqual(self.snapshot[0].version, 1)
+        self.assertEqual(self.snapshot[-1], self.items[-1])
+        self.assertEqual(self.snapshot[10:20:3], self.items[10:20:3])
+        self.assertEqual(self.snapshot.id_at(3), self.items[3].id)
+        self.assertEqual(self.snapshot.count_active(), sum(item.is_active for item in self.items))
+        with self.assertRaises(IndexError):
+            self.snapshot[79]  # pylint: disable=pointless-statement
+
+    def test_prebuilt_orderings_match_the_repositories(self):
+        by_name = sorted(self.items, key=lambda item: (item.name.casefold(), item.id))
+        by_created_at = sorted(self.items, key=lambda item: (item.created_at, item.id))
+        self.assertEqual(list(self.snapshot.ordered('name')), by_name)
+        self.assertEqual(list(self.snapshot.ordered(reverse=True)), by_created_at[::-1])
+        self.assertEqual(self.snapshot.page(20, 30, 'name'), by_name[20:30])
+        self.assertEqual(
+            self.snapshot.page(70, 90, 'created_at', reverse=True), by_created_at[::-1][70:90])
+        with self.assertRaises(ValueError):
+            self.snapshot.ordered('description')
+
+    def test_find_by_id(self):
+        for item in self.items[::7]:
+            self.assertEqual(self.snapshot.find_by_id(item.unique_entity_id), item)
+        for entity_id in ['fake id', 'bb0e392e-dc7b-4d13-a22a-3dd6b9d1caf5']:
+            with self.assertRaises(NotFoundException):
+                self.snapshot.find_by_id(entity_id)
+
+    def test_an_empty_snapshot(self):
+        write_snapshot([], self.path)
+        with CategorySnapshot(self.path) as snapshot:
+            self.assertEqual(
+                (len(snapshot), list(snapshot.ordered('name')), snapshot.count_active()),
+                (0, [], 0))
+
+    def test_aware_created_at_comes_back_as_naive_utc(self):
+        offset = timezone(timedelta(hours=-3))
+        category = Category(name='Movie', created_at=datetime(2022, 6, 1, 9, tzinfo=offset))
+        write_snapshot([category], self.path)
+        with CategorySnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot[0].created_at, datetime(2022, 6, 1, 12))
+
+    def test_is_active_none_comes_back_as_none(self):
+        categories = [Category(name=name, is_active=is_active)
+                      for name, is_active in [('a', None), ('b', True), ('c', False)]]
+        write_snapshot(categories, self.path)
+        with CategorySnapshot(self.path) as snapshot:
+            self.assertEqual([category.is_active for category in snapshot], [None, True, False])
+            self.assertEqual(snapshot.count_active(), 1)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['categories.snapshot'])
+
+    @unittest.skipIf(os.name != 'posix', 'file modes are posix')
+    def test_the_file_mode_follows_the_umask(self):
+        umask = os.umask(0o027)
+        try:
+            write_snapshot(self.items, self.path)
+        finally:
+            os.umask(umask)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+    def test_rejects_files_that_are_not_snapshots(self):
+        for content in [b'', b'{"id": "1"}\n' * 20]:
+            with open(self.path, 'wb') as file:
+                file.write(content)
+            with self.assertRaises(ValueError):
+                CategorySnapshot(self.path)
@@ -0,0 +1,242 @@
+from datetime import datetime, timedelta, timezone
+import random
+import unittest
+from __seedwork.domain.exceptions import (
+    AlreadyExistsException,
+    ConcurrencyException,
+    InvalidCursorException,
+    NotFoundException
+)
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.repositories import CategoryInMemoryRepository
+from category.infra.sqlite import CategorySqliteRepository
+
+
+class TestCategorySqliteRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repo = CategorySqliteRepository()
+        self.now = datetime(2022, 6, 1)
+
+    def _category(self, name: str, minutes: int = 0, **kwargs) -> Category:
+        return Category(name=name, created_at=self.now + timedelta(minutes=minutes), **kwargs)
+
+    def test_insert_and_find(self):
+        category = self._category('Movie', description='some description', is_active=False)
+        self.repo.insert(category)
+
+        found = self.repo.find_by_id(category.id)
+        self.assertEqual(found, category)
+        self.assertEqual(found.to_dict(), category.to_dict())
+        self.assertEqual(self.repo.find_by_id(category.unique_entity_id), category)
+        self.assertEqual(self.repo.find_all(), [category])
+
+        for entity_id in ['fake id', '0e65e9a9-bef3-4b26-9d33-2e0aaf26bbae']:
+            with self.assertRaises(NotFoundException) as assert_error:
+                self.repo.find_by_id(entity_id)
+            self.assertEqual(
+                assert_error.exception.args[0], f"Entity not found using ID '{entity_id}'")
+
+    def test_bulk_insert(self):
+        items = Category.bulk_create([{'name': f'c{i}'} for i in range(100)])
+        self.repo.bulk_insert(items)
+        self.assertEqual(self.repo.find_all(), items)
+
+    def test_insert_an_existing_id(self):
+        items = Category.bulk_create([{'name': f'c{i}'} for i in range(3)])
+        self.repo.bulk_insert(items[:2])
+
+        items[0].update('Movie', None)
+        with self.assertRaises(AlreadyExistsException) as assert_error:
+            self.repo.insert(items[0])
+        self.assertEqual(
+            assert_error.exception.args[0], f"Entity already exists using ID '{items[0].id}'")
+        with self.assertRaises(AlreadyExistsException) as assert_error:
+            self.repo.bulk_insert([items[2], items[1]])
+        self.assertEqual(
+            assert_error.exception.args[0], f"Entity already exists using ID '{items[1].id}'")
+        with self.assertRaises(AlreadyExistsException):
+            self.repo.bulk_insert([items[2], items[2]])
+        self.assertEqual([item.name for item in self.repo.find_all()], ['c0', 'c1'])
+
+    def test_insert_a_deleted_category_stores_nothing(self):
+        items = [self._category(f'c{number}') for number in range(3)]
+        items[1].delete()
+        items[2].delete()
+        self.repo.bulk_insert(items[:2])
+        self.repo.insert(items[2])
+        self.assertEqual(self.repo.find_all(), [items[0]])
+
+    def test_keeps_the_offset_of_aware_created_at(self):
+        offset = timezone(timedelta(hours=-3))
+        aware = Category(name='Movie', created_at=datetime(2022, 6, 1, 9, tzinfo=offset))
+        naive = self._category('Documentary')
+        self.repo.bulk_insert([aware, naive])
+
+        found = self.repo.find_by_id(aware.id)
+        self.assertEqual(found.created_at, aware.created_at)
+        self.assertEqual(found.created_at.utcoffset(), timedelta(hours=-3))
+        self.assertEqual(found.to_dict(), aware.to_dict())
+        self.assertIsNone(self.repo.find_by_id(naive.id).created_at.tzinfo)
+
+        created_at = datetime(2022, 6, 1, 20, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+        self.repo.bulk_update_fields([(naive, {'created_at': created_at}, 0)])
+        self.assertEqual(
+            self.repo.find_by_id(naive.id).created_at.isoformat(), created_at.isoformat())
+
+    def test_keeps_a_null_is_active(self):
+        category = self._category('Movie', is_active=None)
+        self.repo.bulk_insert([category, self._category('Documentary', minutes=1, is_active=False)])
+
+        self.assertIsNone(self.repo.find_by_id(category.id).is_active)
+        inactive = self.repo.search(
+            CategoryRepository.SearchParams(filter=CategoryFilter(is_active=False)))
+        self.assertEqual([item.name for item in inactive.items], ['Documentary', 'Movie'])
+
+    def test_update(self):
+        category = self._category('Movie')
+        with self.assertRaises(NotFoundException):
+            self.repo.update(category)
+
+        self.repo.insert(category)
+        category.update('Documentary', 'description')
+        category.deactivate()
+        self.repo.update(category)
+        self.assertEqual(self.repo.find_by_id(category.id).to_dict(), category.to_dict())
+        self.assertEqual(self.repo.search(CategoryRepository.SearchParams(filter='movie')).total, 0)
+
+    def test_update_with_expected_version(self):
+        category = self._category('Movie')
+        self.repo.insert(category)
+        first, second = self.repo.find_by_id(category.id), self.repo.find_by_id(category.id)
+        first.update('Documentary', None)
+        second.deactivate()
+
+        self.repo.update(first, expected_version=0)
+        with self.assertRaises(ConcurrencyException) as assert_error:
+            self.repo.update(second, expected_version=0)
+        self.assertEqual(assert_error.exception.version, 1)
+        found = self.repo.find_by_id(category.id)
+        self.assertEqual((found.name, found.is_active, found.version), ('Documentary', True, 1))
+        with self.assertRaises(NotFoundException):
+            self.repo.update(self._category('Other'), expected_version=0)
+
+    def test_bulk_update(self):
+        items = [self._category(f'c{number}') for number in range(3)]
+        self.repo.bulk_insert(items)
+        self.repo.delete(items[2].id)
+        for item in items:
+            item.deactivate()
+
+        self.assertEqual(
+            self.repo.bulk_update([(items[0], 0), (items[1], 3), (items[2], 0)]), items[1:])
+        self.assertEqual(
+            [(item.is_active, item.version) for item in self.repo.find_all()],
+            [(False, 1), (True, 0)])
+
+    def test_bulk_update_fields_writes_the_changed_columns(self):
+        items = [self._category(f'c{number}') for number in range(3)]
+        self.repo.bulk_insert(items)
+        self.repo.connection.execute("UPDATE categories SET description = 'set elsewhere'")
+        items[0].deactivate()
+        items[1].update('Documentary', None)
+        items[2].deactivate()
+        items[2].delete()
+        changes = [(item, item.changed_fields(), 0) for item in items]
+
+        self.assertEqual(self.repo.bulk_update_fields(changes), [])
+        self.assertEqual(self.repo.bulk_update_fields(changes[:1]), [items[0]])
+        stored = {item.id: item for item in self.repo.find_all()}
+        self.assertEqual(len(stored), 2)
+        self.assertEqual(
+            (stored[items[0].id].is_active, stored[items[0].id].description),
+            (False, 'set elsewhere'))
+        self.assertEqual(stored[items[0].id].version, 1)
+        result = self.repo.search(CategoryRepository.SearchParams(filter='doc'))
+        self.assertEqual([(item.id, item.name, item.description) for item in result.items],
+                         [(items[1].id, 'Documentary', 'set elsewhere')])
+
+    def test_delete(self):
+        category = self._category('Movie')
+        self.repo.insert(category)
+        self.repo.delete(category.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(category.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.delete(category.id)
+
+    def test_update_a_deleted_category_removes_its_row(self):
+        items = [self._category(f'c{number}') for number in range(3)]
+        self.repo.bulk_insert(items)
+        for item in items:
+            item.delete()
+
+        with self.assertRaises(ConcurrencyException):
+            self.repo.update(items[0], expected_version=1)
+        self.repo.update(items[0], expected_version=0)
+        self.assertEqual(self.repo.bulk_update([(items[1], 0), (items[2], 4)]), [items[2]])
+        self.assertEqual(self.repo.find_all(), [items[2]])
+
+    def test_search_matches_the_in_memory_repository(self):
+        rand = random.Random(11)
+        words = ['action', 'drama', 'kids', 'comedy', 'Ação', 'docs']
+        items = [
+            self._category(
+                ' '.join(rand.sample(words, 2)) + f' {i % 40}',
+                rand.randint(0, 100),
+                is_active=rand.random() < 0.6
+            )
+            for i in range(150)
+        ]
+        self.repo.bulk_insert(items)
+        in_memory = CategoryInMemoryRepository(items)
+
+        filters = [None, 'dra', 'kids 1', 'AÇÃ', '---', CategoryFilter(is_active=False),
+                   CategoryFilter(term='c', is_active=True)]
+        for filter_param in filters:
+            orders = [('name', 'asc'), ('name', 'desc'), ('created_at', 'asc'), (None, None)]
+            for sort, sort_dir in orders:
+                params = CategoryRepository.SearchParams(
+                    page=2, per_page=15, sort=sort, sort_dir=sort_dir, filter=filter_param)
+                expected = in_memory.search(params)
+                result = self.repo.search(params)
+                self.assertEqual(result.items, expected.items, params)
+                self.assertEqual(result.total, expected.total, params)
+
+                pages, cursor = [], None
+                while True:
+                    result = self.repo.search(CategoryRepository.SearchParams(
+                        per_page=15, sort=sort, sort_dir=sort_dir, filter=filter_param,
+                        cursor=cursor))
+                    pages.extend(result.items)
+                    cursor = result.next_cursor
+                    if cursor is None:
+                        break
+                params = CategoryRepository.SearchParams(
+                    per_page=len(items), sort=sort, sort_dir=sort_dir, filter=filter_param)
+                self.assertEqual(pages, in_memory.search(params).items, params)
+
+    def test_scan(self):
+        items = [self._category(f'Movie {i}', i, is_active=i % 2 == 0) for i in range(25)]
+        self.repo.bulk_insert(items)
+        in_memory = CategoryInMemoryRepository(items)
+        for kwargs in [{}, {'sort': 'name', 'filter_param': CategoryFilter(is_active=False)},
+                       {'filter_param': 'movie 1'}, {'filter_param': '---'}]:
+            self.assertEqual(
+                list(self.repo.scan(per_page=4, **kwargs)), list(in_memory.scan(**kwargs)), kwargs)
+
+        scan = self.repo.scan(per_page=2)
+        self.assertEqual(next(scan), items[-1])
+        self.repo.delete(items[0].id)
+        scan.close()
+
+    def test_search_with_invalid_cursor(self):
+        self.repo.bulk_insert([self._category('a'), self._category('b')])
+        cursor = self.repo.search(CategoryRepository.SearchParams(per_page=1)).next_cursor
+        for params in [
+            CategoryRepository.SearchParams(cursor='fake'),
+            CategoryRepository.SearchParams(cursor=cursor, sort='name'),
+        ]:
+            with self.assertRaises(InvalidCursorException):
+                self.repo.search(params)
@@ -0,0 +1,213 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from __seedwork.domain.exceptions import (
+    ConcurrencyException,
+    NotFoundException,
+    ValidationException
+)
+from __seedwork.infra.events import InProcessEventBus, OutboxDispatcher
+from category.application.dto import CategoryOutput
+from category.application.use_cases import (
+    ActivateCategoryUseCase,
+    CreateCategoryUseCase,
+    DeactivateCategoryUseCase,
+    DeleteCategoryUseCase,
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+    UpdateCategoryUseCase
+)
+from category.domain.events import (
+    CategoryActivated,
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryDeleted,
+    CategoryUpdated
+)
+from category.domain.repositories import CategoryFilter
+from category.infra.repositories import (
+    CategoryAsyncCachedRepository,
+    CategoryAsyncInMemoryRepository
+)
+from category.infra.sqlite import CategorySqliteRepository
+
+
+class TestCategoryUseCasesInt(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.repo = CategoryAsyncInMemoryRepository()
+
+    async def _create(self, name: str, **kwargs) -> CategoryOutput:
+        return await CreateCategoryUseCase(self.repo).execute(
+            CreateCategoryUseCase.Input(name=name, **kwargs))
+
+    async def test_create_and_get(self):
+        output = await self._create('Movie', description='some description')
+        category = await self.repo.find_by_id(output.id)
+        self.assertEqual(output, CategoryOutput(
+            id=category.id,
+            name='Movie',
+            description='some description',
+            is_active=True,
+            created_at=category.created_at
+        ))
+        found = await GetCategoryUseCase(self.repo).execute(GetCategoryUseCase.Input(output.id))
+        self.assertEqual(found, output)
+
+        with self.assertRaises(ValidationException):
+            await self._create('')
+
+    async def test_update_activate_and_deactivate(self):
+        output = await self._create('Movie')
+
+        output = await UpdateCategoryUseCase(self.repo).execute(
+            UpdateCategoryUseCase.Input(id=output.id, name='Documentary', is_active=False))
+        self.assertEqual(
+            (output.name, output.description, output.is_active), ('Documentary', None, False))
+
+        output = await ActivateCategoryUseCase(self.repo).execute(
+            ActivateCategoryUseCase.Input(output.id))
+        self.assertTrue(output.is_active)
+        output = await DeactivateCategoryUseCase(self.repo).execute(
+            DeactivateCategoryUseCase.Input(output.id))
+        self.assertFalse(output.is_active)
+
+        result = await ListCategoriesUseCase(self.repo).execute(
+            ListCategoriesUseCase.Input(filter=CategoryFilter(term='doc', is_active=False)))
+        self.assertEqual(result.items, [output])
+
+    async def test_publishes_events_through_the_outbox(self):
+        bus = InProcessEventBus()
+        received = []
+        bus.subscribe(CategoryCreated, received.append)
+        bus.subscribe(CategoryUpdated, received.append)
+        bus.subscribe(CategoryActivated, received.append)
+        bus.subscribe(CategoryDeactivated, received.append)
+        bus.subscribe(CategoryDeleted, received.append)
+
+        async with OutboxDispatcher(bus, max_delay=60) as outbox:
+            output = await CreateCategoryUseCase(self.repo, outbox).execute(
+                CreateCategoryUseCase.Input('Movie'))
+            await UpdateCategoryUseCase(self.repo, outbox).execute(
+                UpdateCategoryUseCase.Input(id=output.id, name='Documentary', is_active=False))
+            await ActivateCategoryUseCase(self.repo, outbox).execute(
+                ActivateCategoryUseCase.Input(output.id))
+            self.assertEqual((await self.repo.find_by_id(output.id)).domain_events, ())
+            await DeleteCategoryUseCase(self.repo, outbox).execute(
+                DeleteCategoryUseCase.Input(output.id))
+            self.assertEqual(received, [])
+
+        self.assertEqual([event.__class__ for event in received], [
+            CategoryCreated,
+            CategoryUpdated,
+            CategoryDeactivated,
+            CategoryActivated,
+            CategoryDeleted
+        ])
+        self.assertEqual({event.aggregate_id for event in received}, {output.id})
+
+    async def test_writes_change_a_copy_of_the_stored_category(self):
+        output = await self._create('Movie')
+        stored = await self.repo.find_by_id(output.id)
+
+        await UpdateCategoryUseCase(self.repo).execute(
+            UpdateCategoryUseCase.Input(id=output.id, name='Documentary'))
+        await DeleteCategoryUseCase(self.repo).execute(DeleteCategoryUseCase.Input(output.id))
+        self.assertEqual((stored.name, stored.version, stored.deleted_at), ('Movie', 0, None))
+
+    async def test_writes_fail_when_the_category_changed_since_it_was_read(self):
+        output = await self._create('Movie')
+        find_by_id = CategoryAsyncInMemoryRepository.find_by_id
+
+        async def find_then_rename(repo, category_id):
+            category = await find_by_id(repo, category_id)
+            renamed = category.copy()
+            renamed.update('Series', None)
+            await repo.update(renamed, expected_version=category.version)
+            return category
+
+        with patch.object(CategoryAsyncInMemoryRepository, 'find_by_id', find_then_rename):
+            with self.assertRaises(ConcurrencyException):
+                await DeactivateCategoryUseCase(self.repo).execute(
+                    DeactivateCategoryUseCase.Input(output.id))
+        category = await self.repo.find_by_id(output.id)
+        self.assertEqual((category.name, category.is_active, category.version), ('Series', True, 1))
+
+    async def test_delete(self):
+        output = await self._create('Movie')
+        await DeleteCategoryUseCase(self.repo).execute(DeleteCategoryUseCase.Input(output.id))
+        with self.assertRaises(NotFoundException):
+            await GetCategoryUseCase(self.repo).execute(GetCategoryUseCase.Input(output.id))
+
+    async def test_list(self):
+        outputs = [await self._create(name) for name in ['b', 'a', 'c']]
+        result = await ListCategoriesUseCase(self.repo).execute(
+            ListCategoriesUseCase.Input(page=1, per_page=2, sort='name', sort_dir='asc'))
+        self.assertEqual(result.items, [outputs[1], outputs[0]])
+        self.assertEqual(
+            (result.total, result.current_page, result.last_page, result.per_page), (3, 1, 2, 2))
+
+        result = await ListCategoriesUseCase(self.repo).execute(ListCategoriesUseCase.Input())
+        self.assertEqual(result.items, outputs[::-1])
+        self.assertIsNone(result.next_cursor)
+
+    async def test_list_with_cursor(self):
+        outputs = [await self._create(name) for name in ['b', 'a', 'c']]
+        list_use_case = ListCategoriesUseCase(self.repo)
+        result = await list_use_case.execute(ListCategoriesUseCase.Input(per_page=2, sort='name'))
+        self.assertEqual(result.items, [outputs[1], outputs[0]])
+
+        result = await list_use_case.execute(
+            ListCategoriesUseCase.Input(per_page=2, sort='name', cursor=result.next_cursor))
+        self.assertEqual(result.items, [outputs[2]])
+        self.assertIsNone(result.next_cursor)
+
+    async def test_repository_scan(self):
+        outputs = [await self._create(f'Category {i}') for i in range(5)]
+        categories = [category async for category in self.repo.scan(per_page=2, sort='name')]
+        self.assertEqual(
+            [category.id for category in categories], [output.id for output in outputs])
+
+    async def test_concurrent_calls(self):
+        created = await asyncio.gather(*(self._create(f'Category {i}') for i in range(200)))
+        await asyncio.gather(
+            *(DeactivateCategoryUseCase(self.repo).execute(
+                DeactivateCategoryUseCase.Input(output.id)) for output in created[:100]),
+            *(DeleteCategoryUseCase(self.repo).execute(DeleteCategoryUseCase.Input(output.id))
+              for output in created[150:]),
+            *(ListCategoriesUseCase(self.repo).execute(
+                ListCategoriesUseCase.Input(filter='category')) for _ in range(20))
+        )
+        list_use_case = ListCategoriesUseCase(self.repo)
+        result = await list_use_case.execute(
+            ListCategoriesUseCase.Input(filter=CategoryFilter(is_active=False)))
+        self.assertEqual(result.total, 100)
+        result = await list_use_case.execute(ListCategoriesUseCase.Input(filter='category'))
+        self.assertEqual(result.total, 150)
+
+
+class TestCategoryUseCasesOverCacheInt(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.repo = CategoryAsyncCachedRepository(
+            CategoryAsyncInMemoryRepository(CategorySqliteRepository()))
+
+    async def test_writes_refresh_the_cached_category(self):
+        output = await CreateCategoryUseCase(self.repo).execute(
+            CreateCategoryUseCase.Input(name='Movie'))
+        get_use_case = GetCategoryUseCase(self.repo)
+        self.assertEqual(await get_use_case.execute(GetCategoryUseCase.Input(output.id)), output)
+
+        await UpdateCategoryUseCase(self.repo).execute(
+            UpdateCategoryUseCase.Input(id=output.id, name='Documentary'))
+        await DeactivateCategoryUseCase(self.repo).execute(
+            DeactivateCategoryUseCase.Input(output.id))
+        self.repo.identity_map.clear()
+        output = await get_use_case.execute(GetCategoryUseCase.Input(output.id))
+        self.assertEqual((output.name, output.is_active), ('Documentary', False))
+        self.assertEqual(await get_use_case.execute(GetCategoryUseCase.Input(output.id)), output)
+        self.assertEqual((self.repo.stats.hits, self.repo.stats.misses), (4, 1))
+
+        await DeleteCategoryUseCase(self.repo).execute(DeleteCategoryUseCase.Input(output.id))
+        with self.assertRaises(NotFoundException):
+            await get_use_case.execute(GetCategoryUseCase.Input(output.id))
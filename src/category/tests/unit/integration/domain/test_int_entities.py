@@ -1,5 +1,10 @@
 from category.domain.entities import Category
-from __seedwork.domain.exceptions import ValidationException
+from datetime import datetime
+from __seedwork.domain.exceptions import (
+    BatchValidationException,
+    EntityValidationException,
+    ValidationException
+)
 import unittest
 
 class TestCategoryIntegration(unittest.TestCase):
@@ -43,6 +48,16 @@ class TestCategoryIntegration(unittest.TestCase):
             'The is_active must be a bool value'
         )
 
+    def test_create_reports_errors_of_every_field(self):
+        with self.assertRaises(EntityValidationException) as assert_error:
+            Category(name=5, description=5, is_active=5)
+        self.assertEqual(assert_error.exception.args[0], 'Field name must be a string')
+        self.assertEqual(assert_error.exception.errors, {
+            'name': ['Field name must be a string'],
+            'description': ['Field description must be a string'],
+            'is_active': ['The is_active must be a bool value'],
+        })
+
     def test_create_with_valid_cases(self):
 
         try:
@@ -104,3 +119,86 @@ class TestCategoryIntegration(unittest.TestCase):
         except ValidationException as exception:
             self.fail(f'Some prop is not valid. Error: {exception.args[0]}')
 
+    def test_bulk_create_from_rows(self):
+        created_at = datetime(2022, 6, 1)
+        categories = Category.bulk_create([
+            {'name': 'Movie'},
+            {'name': 'Documentary', 'description': 'some description', 'is_active': False},
+            {
+                'id': 'af46842e-027d-4c91-b259-3a3642144ba4',
+                'name': 'Series',
+                'created_at': created_at,
+            },
+        ], clock=lambda: datetime(2022, 1, 1))
+
+        self.assertEqual(
+            [category.name for category in categories], ['Movie', 'Documentary', 'Series'])
+        self.assertEqual(categories[0].description, None)
+        self.assertTrue(categories[0].is_active)
+        self.assertEqual(categories[0].created_at, datetime(2022, 1, 1))
+        self.assertEqual(categories[1].description, 'some description')
+        self.assertFalse(categories[1].is_active)
+        self.assertEqual(categories[1].created_at, datetime(2022, 1, 1))
+        self.assertEqual(categories[2].id, 'af46842e-027d-4c91-b259-3a3642144ba4')
+        self.assertEqual(categories[2].created_at, created_at)
+        self.assertEqual(len({category.id for category in categories}), 3)
+
+    def test_bulk_create_from_columns(self):
+        categories = Category.bulk_create({
+            'name': ['Movie', 'Series'],
+            'is_active': [True, False],
+        })
+        self.assertEqual([category.name for category in categories], ['Movie', 'Series'])
+        self.assertEqual([category.is_active for category in categories], [True, False])
+        self.assertEqual([category.description for category in categories], [None, None])
+        self.assertEqual(categories[0].created_at, categories[1].created_at)
+        self.assertEqual(Category.bulk_create({'name': []}), [])
+        self.assertEqual(Category.bulk_create([]), [])
+
+        with self.assertRaises(ValueError):
+            Category.bulk_create({'name': ['Movie'], 'is_active': [True, False]})
+
+    def test_bulk_create_reports_errors_of_every_row(self):
+        with self.assertRaises(BatchValidationException) as assert_error:
+            Category.bulk_create([
+                {'name': 'Movie'},
+                {'name': None, 'is_active': 5},
+                {'name': 'Movie', 'description': 5},
+                {'name': 't' * 256},
+            ])
+        self.assertEqual(assert_error.exception.args[0], '3 invalid rows')
+        self.assertEqual(assert_error.exception.errors, {
+            1: {
+                'name': ['Field name is required'],
+                'is_active': ['The is_active must be a bool value']
+            },
+            2: {'description': ['Field description must be a string']},
+            3: {'name': ['Field name length should be smaller than 255']},
+        })
+
+        with self.assertRaises(BatchValidationException) as assert_error:
+            Category.bulk_create({'description': ['Movie']})
+        self.assertEqual(assert_error.exception.errors, {0: {'name': ['Field name is required']}})
+
+    def test_bulk_create_reports_invalid_ids_with_the_other_errors(self):
+        with self.assertRaises(BatchValidationException) as assert_error:
+            Category.bulk_create([
+                {'id': 'fake id', 'name': 'Movie'},
+                {'id': None, 'name': None},
+                {'id': '2', 'name': None},
+            ], validate=False)
+        self.assertEqual(assert_error.exception.errors, {
+            0: {'id': ['ID must be a valid uuid']},
+            2: {'id': ['ID must be a valid uuid']},
+        })
+
+        with self.assertRaises(BatchValidationException) as assert_error:
+            Category.bulk_create({'id': ['fake id', None], 'name': ['Movie', None]})
+        self.assertEqual(assert_error.exception.errors, {
+            0: {'id': ['ID must be a valid uuid']},
+            1: {'name': ['Field name is required']},
+        })
+
+    def test_bulk_create_without_validation(self):
+        categories = Category.bulk_create({'name': ['Movie', 'Series']}, validate=False)
+        self.assertEqual([category.name for category in categories], ['Movie', 'Series'])